@@ -1,5 +1,5 @@
 import os
-import pandas as pd
+from job_records import JobRecordBuffer
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
@@ -7,14 +7,23 @@ from selenium.webdriver.common.by import By
 from selenium_stealth import stealth
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import lease_pooled_driver
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
 
 def configure_webdriver():
+    driver = lease_pooled_driver('AirService')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'AirService')
     options.add_argument("--headless")
     options.add_argument('--log-level=1')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -26,7 +35,7 @@ def configure_webdriver():
     return driver
 
 def scrape_job_data(driver, Job_Classification, location):
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
 
     url = 'https://careers.airservicesaustralia.com/caw/en/listing/'
     driver.get(url)
@@ -38,7 +47,7 @@ def scrape_job_data(driver, Job_Classification, location):
     
     if not job_tbody:
         print("No jobs found")
-        return df
+        return jobs.to_dataframe()
 
     # Process job rows in pairs (job details row and summary row)
     job_rows = job_tbody.find_all('tr')
@@ -59,20 +68,12 @@ def scrape_job_data(driver, Job_Classification, location):
 
             print(f"Scraped job: {job_title} - {location}")
             
-            new_data = pd.DataFrame({
-                'Link': [link_full],
-                'Job Title': [job_title],
-                'Job Classification': ['N/A'],
-                'Location': [location],
-                'Company': [company]
-            })
-
-            df = pd.concat([df, new_data], ignore_index=True)
+            jobs.add(link_full, job_title, 'N/A', location, company)
 
         except Exception as e:
             print(f"Error scraping job: {e}")
 
-    return df
+    return jobs.to_dataframe()
 
 # Create the .csv_files directory if it doesn't exist
 output_dir = '.\\csv_files'
@@ -89,6 +90,7 @@ def save_df_to_csv(df, output_dir):
 
     # Save the DataFrame to a CSV file
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 # Main execution
@@ -98,4 +100,5 @@ if __name__ == "__main__":
         df = scrape_job_data(driver, 'Engineering', 'Australia')
         save_df_to_csv(df, output_dir)
     finally:
+        transfer_report(driver, 'AirService')
         driver.quit()
\ No newline at end of file
@@ -3,11 +3,24 @@ import pandas as pd
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium_stealth import stealth
-import time
 import re
+from driver_pool import lease_pooled_driver
+from waits import wait_for_dom_stable, wait_for_ready
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
+from dom_extract import capture_html
+
+# The SEEK link and every place the job list has been found (see scrape_job_data)
+AURIZN_CONTENT = ('a[href*="seek.com.au"], *:has(> p + ul), '
+                  'div[data-brz-custom-id="swkxqxpemvkfehwfzxofkztzbyrljeflluth"], li.brz-tp-lg-paragraph')
 
 def configure_webdriver():
+    driver = lease_pooled_driver('Aurizn')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'Aurizn')
     options.add_argument("--headless")
     options.add_argument('--log-level=3')
     options.add_argument('--disable-background-networking') 
@@ -15,6 +28,7 @@ def configure_webdriver():
     options.add_experimental_option('useAutomationExtension', False)
     
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     
     stealth(driver,
             languages=["en-US", "en"],
@@ -33,11 +47,13 @@ def scrape_job_data(driver):
     print(f"Scraping {url}")
 
     driver.get(url)
-    time.sleep(3) # Wait for Brizy builder to render
+    # Wait for the Brizy builder to finish rendering instead of a fixed 3s
+    wait_for_ready(driver)
+    wait_for_dom_stable(driver, 'body', quiet_ms=500)
     
     try:
         print("Processing page...")
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+        soup = BeautifulSoup(capture_html(driver, AURIZN_CONTENT), 'lxml')
         
         # 1. Get the Generic Apply Link (SEEK)
         # We need this because the text items don't have individual links
@@ -123,6 +139,7 @@ def save_df_to_csv(df, output_dir):
 
     file_path = os.path.join(output_dir, 'AURIZN_job_data.csv')
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 if __name__ == "__main__":
@@ -134,4 +151,5 @@ if __name__ == "__main__":
         else:
             print("No jobs found.")
     finally:
+        transfer_report(driver, 'Aurizn')
         driver.quit()
\ No newline at end of file
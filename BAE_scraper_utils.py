@@ -1,99 +1,12 @@
 import os
-import pandas as pd
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium_stealth import stealth
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-import time
-
-def configure_webdriver():
-    options = webdriver.ChromeOptions()
-    options.add_argument("--headless")
-    options.add_argument('--log-level=1')
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    driver = webdriver.Chrome(options=options)
-    stealth(driver,
-            languages=["en-US", "en"],
-            vendor="Google Inc.",
-            platform="Win32",
-            webgl_vendor="Intel Inc.",
-            renderer="Intel Iris OpenGL Engine",
-            fix_hairline=True,
-            )
-    return driver
-
-def scrape_job_data(driver, Job_Classification, location):
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
-   
-    url = 'https://careers.au.baesystems.com/jobtools/jncustomsearch.searchResults?in_organid=16804&in_jobDate=All'
-    driver.get(url)
-    print(f"Scraping {url}")
-
-    # First, load ALL jobs by clicking "Load More" until disabled
-    while True:
-        try:
-            load_more_button = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, 'load-more'))
-            )
-            if 'disabled' in load_more_button.get_attribute('class'):
-                print("Load More button is disabled. All jobs loaded.")
-                break
-            driver.execute_script("arguments[0].click();", load_more_button)
-            print("Clicked 'Load More'")
-            time.sleep(2)  # Wait for new content to load
-        except (NoSuchElementException, TimeoutException):
-            print("No Load More button found. All jobs loaded.")
-            break
-
-    # Now scrape all jobs at once
-    soup = BeautifulSoup(driver.page_source, 'lxml')
-    job_rows = soup.select('tbody > tr')
-    
-    print(f"Found {len(job_rows)} total job rows")
-    
-    if not job_rows:
-        print("No jobs found.")
-        return df
-        
-    for row in job_rows:
-        try:
-            columns = row.find_all('td')
-            if len(columns) != 4:
-                continue
-
-            link_element = columns[0].find('a')
-            if not link_element:
-                continue
-
-            link = link_element.get('href')
-            link_full = 'https://careers.au.baesystems.com/jobtools/' + link
-            
-            job_title = link_element.text.strip()
-            company = 'BAE'
-            job_classification = columns[1].text.strip()
-            location = columns[3].text.strip()
-            
-            print(f"Scraped job: {job_title} - {location}")
-
-            new_data = pd.DataFrame({
-                'Link': [link_full], 
-                'Job Title': [job_title], 
-                'Job Classification': [job_classification],
-                'Location': [location], 
-                'Company': [company]
-            })
-
-            df = pd.concat([df, new_data], ignore_index=True)
-            
-        except Exception as e:
-            print(f"Error scraping job: {e}")
-
+from jobtools_api import JOBTOOLS_SITES, scrape_jobtools_site
+from job_outputs import save_job_outputs
+
+def scrape_job_data(Job_Classification, location):
+    # Same JobTools backend as AIRBUS; fetch the results pages directly instead of clicking Load More
+    df = scrape_jobtools_site(JOBTOOLS_SITES['BAE'])
+    for job_title, job_location in zip(df['Job Title'], df['Location']):
+        print(f"Scraped job: {job_title} - {job_location}")
     return df
 
 output_dir = '.\\csv_files'
@@ -107,12 +20,9 @@ def save_df_to_csv(df, output_dir):
     file_path = os.path.join(output_dir, 'BAE_job_data.csv')
 
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 if __name__ == "__main__":
-    driver = configure_webdriver()
-    try:
-        df = scrape_job_data(driver, 'Engineering', 'Australia')
-        save_df_to_csv(df, output_dir)
-    finally:
-        driver.quit()
\ No newline at end of file
+    df = scrape_job_data('Engineering', 'Australia')
+    save_df_to_csv(df, output_dir)
\ No newline at end of file
@@ -1,6 +1,5 @@
 import os
-import pandas as pd
-import time
+from job_records import JobRecordBuffer
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -10,9 +9,18 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 from selenium_stealth import stealth
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import lease_pooled_driver
+from waits import count, wait_for_count_increase, wait_for_dom_stable
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
 
 def configure_webdriver():
+    driver = lease_pooled_driver('BDA')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'BDA')
     options.add_argument("--headless")
     options.add_argument('--log-level=1')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -20,6 +28,7 @@ def configure_webdriver():
     
     # Initialize the Chrome WebDriver
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -31,7 +40,7 @@ def configure_webdriver():
     return driver
 
 def scrape_job_data(driver, Job_Classification, location):
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
    
     url = 'https://jobs.boeing.com/category/boeing-defence-australia-jobs/185-18469/2681/1'
     driver.get(url)
@@ -40,31 +49,33 @@ def scrape_job_data(driver, Job_Classification, location):
     try:
         # Locate and click on the "Show All" link
         show_all_link = WebDriverWait(driver, 20).until(EC.element_to_be_clickable((By.XPATH, '//a[@class="pagination-show-all"]')))
+        previous_count = count(driver, 'li.no-security-clearance')
         driver.execute_script("arguments[0].click();", show_all_link)
         
-        # Wait for a fixed time (e.g., 5 seconds) to allow the page to load
+        # Wait until the full list has rendered rather than a fixed 5 seconds
         print("Clicked 'Show All' and waiting for page to load.")
-        time.sleep(5)  # Adjust the sleep time as necessary
+        wait_for_count_increase(driver, 'li.no-security-clearance', previous_count, timeout=20)
+        wait_for_dom_stable(driver, 'body', quiet_ms=500)
 
     except TimeoutException:
         print("Timeout waiting for 'Show All' link to be clickable")
-        return df
+        return jobs.to_dataframe()
     except NoSuchElementException:
         print("'Show All' link not found")
-        return df
+        return jobs.to_dataframe()
     except ElementClickInterceptedException:
         print("Unable to click 'Show All' link, it may be obscured")
-        return df
+        return jobs.to_dataframe()
     except Exception as e:
         print(f"Unexpected error when clicking 'Show All': {e}")
-        return df
+        return jobs.to_dataframe()
 
     soup = BeautifulSoup(driver.page_source, 'lxml')
     job_listings = soup.find_all('li', class_='no-security-clearance')
     
     if not job_listings:
         print("No job listings found.")
-        return df
+        return jobs.to_dataframe()
 
     for job in job_listings:
         try:
@@ -86,20 +97,12 @@ def scrape_job_data(driver, Job_Classification, location):
             location = location_element.text.strip() if location_element else ''
             print(f"Scraped job: {job_title} - {location}")
 
-            new_data = pd.DataFrame({
-                'Link': [link_full], 
-                'Job Title': [job_title], 
-                'Job Classification': [Job_Classification],
-                'Location': [location], 
-                'Company': [company]
-            })
-
-            df = pd.concat([df, new_data], ignore_index=True)
+            jobs.add(link_full, job_title, Job_Classification, location, company)
             
         except Exception as e:
             print(f"Error scraping job: {e}")
 
-    return df
+    return jobs.to_dataframe()
 
 # Create the .csv_files directory if it doesn't exist
 output_dir = './csv_files'
@@ -116,6 +119,7 @@ def save_df_to_csv(df, output_dir):
 
     # Save the DataFrame to a CSV file
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 # Main execution
@@ -125,4 +129,5 @@ if __name__ == "__main__":
         df = scrape_job_data(driver, 'Engineering', 'Australia')
         save_df_to_csv(df, output_dir)
     finally:
+        transfer_report(driver, 'BDA')
         driver.quit()
\ No newline at end of file
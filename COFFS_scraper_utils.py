@@ -1,5 +1,5 @@
 import os
-import pandas as pd
+from job_records import JobRecordBuffer
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -8,14 +8,23 @@ from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from driver_pool import lease_pooled_driver
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
 
 def configure_webdriver():
+    driver = lease_pooled_driver('COFFS')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'COFFS')
     options.add_argument("--headless")
     options.add_argument('--log-level=1')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -28,7 +37,7 @@ def configure_webdriver():
 
 def scrape_job_data(driver):
     """Scrape job listings from Coffs Harbour Recruitment Hub."""
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
 
     url = 'https://coffsharbour.recruitmenthub.com.au/Positions-Vacant/'
     driver.get(url)
@@ -44,7 +53,7 @@ def scrape_job_data(driver):
 
     if not job_listings:
         print("No job listings found.")
-        return df
+        return jobs.to_dataframe()
 
     for job in job_listings:
         try:
@@ -65,21 +74,13 @@ def scrape_job_data(driver):
             location = location_element.text.strip() if location_element else 'Not specified'
 
             # Create DataFrame row
-            new_data = pd.DataFrame({
-                'Link': [link_full],
-                'Job Title': [job_title],
-                'Job Classification': ['N/A'],
-                'Location': [location],
-                'Company': ['Coffs Harbour City Council']
-            })
-
-            df = pd.concat([df, new_data], ignore_index=True)
+            jobs.add(link_full, job_title, 'N/A', location, 'Coffs Harbour City Council')
             print(f"Scraped job: {job_title} - {location}")
 
         except Exception as e:
             print(f"Error scraping individual job: {e}")
 
-    return df
+    return jobs.to_dataframe()
 
 def save_df_to_csv(df, output_dir):
     """Save DataFrame to CSV file."""
@@ -88,6 +89,7 @@ def save_df_to_csv(df, output_dir):
 
     file_path = os.path.join(output_dir, 'Coffs_job_data.csv')
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 # Create output directory if it doesn't exist
@@ -104,4 +106,5 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"An error occurred: {e}")
     finally:
+        transfer_report(driver, 'COFFS')
         driver.quit()
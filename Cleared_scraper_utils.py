@@ -1,5 +1,5 @@
 import os
-import pandas as pd
+from job_records import JobRecordBuffer
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
@@ -7,14 +7,24 @@ from selenium.webdriver.common.by import By
 from selenium_stealth import stealth
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import lease_pooled_driver
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
+from dom_extract import capture_html
 
 def configure_webdriver():
+    driver = lease_pooled_driver('Cleared')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'Cleared')
     options.add_argument("--headless")
     options.add_argument('--log-level=1')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -26,7 +36,7 @@ def configure_webdriver():
     return driver
 
 def scrape_job_data(driver, Job_Classification, location):
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
 
     url = 'https://www.clearedrecruitment.com.au/jobs/'
     driver.get(url)
@@ -35,7 +45,7 @@ def scrape_job_data(driver, Job_Classification, location):
     page_number = 1
     while True:
         print(f"Scraping page {page_number}")
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+        soup = BeautifulSoup(capture_html(driver, 'div.main-result-info-panel, a[rel="next"]'), 'lxml')
         job_boxes = soup.find_all('div', {'class': 'main-result-info-panel'})
 
         if not job_boxes:
@@ -59,15 +69,7 @@ def scrape_job_data(driver, Job_Classification, location):
                 job_classification = Job_Classification  # Using the input parameter
                 company = 'Cleared Recruitment'
 
-                new_data = pd.DataFrame({
-                    'Link': [link_full],
-                    'Job Title': [job_title],
-                    'Job Classification': [job_classification],
-                    'Location': [location],
-                    'Company': [company]
-                })
-
-                df = pd.concat([df, new_data], ignore_index=True)
+                jobs.add(link_full, job_title, job_classification, location, company)
                 
                 print(f"Scraped: {job_title} - {location}")
 
@@ -89,7 +91,7 @@ def scrape_job_data(driver, Job_Classification, location):
             print(f"Error navigating to next page: {e}")
             break
 
-    return df
+    return jobs.to_dataframe()
 
 def save_df_to_csv(df, output_dir):
     if not os.path.exists(output_dir):
@@ -97,6 +99,7 @@ def save_df_to_csv(df, output_dir):
 
     file_path = os.path.join(output_dir, 'Cleared_job_data.csv')
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 # Create the output directory
@@ -111,4 +114,5 @@ if __name__ == "__main__":
         df = scrape_job_data(driver, 'Engineering', 'Australia')
         save_df_to_csv(df, output_dir)
     finally:
+        transfer_report(driver, 'Cleared')
         driver.quit()
\ No newline at end of file
@@ -1,5 +1,5 @@
 import os
-import pandas as pd
+from job_records import JobRecordBuffer
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -10,10 +10,19 @@ from selenium_stealth import stealth
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 import time
+from driver_pool import lease_pooled_driver
+from dom_extract import iter_new_items
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
 
 def configure_webdriver():
     """Configures the Selenium WebDriver."""
+    driver = lease_pooled_driver('HANWHA')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'HANWHA')
     options.add_argument('--log-level=1')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
@@ -22,6 +31,7 @@ def configure_webdriver():
 
     service = ChromeService(ChromeDriverManager().install())
     driver = webdriver.Chrome(service=service, options=options)
+    block_resources(driver)
 
     stealth(driver,
             languages=["en-US", "en"],
@@ -33,9 +43,58 @@ def configure_webdriver():
             )
     return driver
 
+def click_load_more(driver):
+    """Click the iframe's 'Load More' unless it is disabled; False once every job is listed"""
+    try:
+        load_more_button = driver.find_element(By.ID, 'load-more')
+    except NoSuchElementException:
+        print("No 'Load More' button found. Finished scraping.")
+        return False
+
+    if "disabled" in load_more_button.get_attribute("class"):
+        print("Load More button is disabled.  No more jobs.")
+        return False
+
+    driver.execute_script("arguments[0].click();", load_more_button)
+    print("Clicked 'Load More'")
+    return True
+
+def parse_rows(fragment, jobs):
+    soup = BeautifulSoup(fragment, 'lxml')
+    job_rows = soup.find_all('div', class_='row default')
+    print(f"Found {len(job_rows)} new job rows")
+
+    for row in job_rows:
+        try:
+            job_title_elem = row.find('h2', class_='jobName_h2')
+            job_title = job_title_elem.text.strip() if job_title_elem else "N/A"
+
+            job_category_elem = row.find('h6', class_='jobCategory')
+            job_classification = job_category_elem.text.strip() if job_category_elem else "N/A" #Renamed to job_classification
+
+            # Construct the link using Job ID (more reliable than apply ID)
+            details_button = row.find('a', class_='btnJobDetails')
+            job_id = "N/A"
+            if details_button and 'onclick' in details_button.attrs:
+                onclick_str = details_button['onclick']
+                start = onclick_str.find("('") + 2
+                end = onclick_str.find("')")
+                if start > 1 and end > start:
+                    job_id = onclick_str[start:end]
+
+            #link = f"https://www.hanwha-defence.com.au/job-details/{job_id}" if job_id != "N/A" else "N/A" # Corrected link construction
+            link = f"https://hanwha-defense.sentrient.online/RecruitmentJob/Careers#{job_id}" if job_id != "N/A" else "N/A" # Corrected link construction
+
+
+            print(f"Scraped job: {job_title}")
+            jobs.add(link, job_title, job_classification, 'N/A', 'HANWHA')
+
+        except Exception as e:
+            print(f"Error scraping job details: {e}")
+
 def scrape_job_data(driver):
     """Scrapes job data from within the iframe."""
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
 
     url = 'https://www.hanwha-defence.com.au/careers'
     driver.get(url)
@@ -51,7 +110,7 @@ def scrape_job_data(driver):
         print("Switched to iframe")
     except TimeoutException:
         print("Error: Timeout waiting for the iframe to load.")
-        return df
+        return jobs.to_dataframe()
     # --- Inside the iframe ---
     try:
         WebDriverWait(driver, 20).until(
@@ -61,81 +120,14 @@ def scrape_job_data(driver):
     except TimeoutException:
         print("Error: Timeout waiting for job rows inside the iframe.")
         driver.switch_to.default_content() # Switch back before returning
-        return df
-
-    while True:
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'lxml')
-
-        job_rows = soup.find_all('div', class_='row default')
-        print(f"Found {len(job_rows)} job rows")
-
-        if not job_rows:
-            print("No job rows found on this page.")
-            break
-        
-        for row in job_rows:
-            try:
-                job_title_elem = row.find('h2', class_='jobName_h2')
-                job_title = job_title_elem.text.strip() if job_title_elem else "N/A"
-
-                job_category_elem = row.find('h6', class_='jobCategory')
-                job_classification = job_category_elem.text.strip() if job_category_elem else "N/A" #Renamed to job_classification
-
-                # Construct the link using Job ID (more reliable than apply ID)
-                details_button = row.find('a', class_='btnJobDetails')
-                job_id = "N/A"
-                if details_button and 'onclick' in details_button.attrs:
-                    onclick_str = details_button['onclick']
-                    start = onclick_str.find("('") + 2
-                    end = onclick_str.find("')")
-                    if start > 1 and end > start:
-                        job_id = onclick_str[start:end]
-
-                #link = f"https://www.hanwha-defence.com.au/job-details/{job_id}" if job_id != "N/A" else "N/A" # Corrected link construction
-                link = f"https://hanwha-defense.sentrient.online/RecruitmentJob/Careers#{job_id}" if job_id != "N/A" else "N/A" # Corrected link construction
-
-
-                print(f"Scraped job: {job_title}")
-                new_data = pd.DataFrame({
-                    'Link': [link],
-                    'Job Title': [job_title],
-                    'Job Classification': [job_classification],
-                    'Location': ['N/A'],  # Hardcoded as per requirement
-                    'Company': ['HANWHA'] # Hardcoded as per requirement
-                })
-                df = pd.concat([df, new_data], ignore_index=True)
-
-            except Exception as e:
-                print(f"Error scraping job details: {e}")
-
-        # --- Load More (inside iframe) ---
-        try:
-            load_more_button = driver.find_element(By.ID, 'load-more')
-            if "disabled" not in load_more_button.get_attribute("class"):
-                driver.execute_script("arguments[0].click();", load_more_button)
-                print("Clicked 'Load More'")
-                # Wait for *new* content to load *inside* the iframe
-                WebDriverWait(driver, 10).until(
-                    lambda driver: len(driver.find_elements(By.CSS_SELECTOR, "div.row.default")) > len(job_rows)
-                )
-
-            else:
-                print("Load More button is disabled.  No more jobs.")
-                break
-
-        except NoSuchElementException:
-            print("No 'Load More' button found. Finished scraping.")
-            break
-        except TimeoutException:
-            print("Timeout waiting for new jobs to load after clicking 'Load More'.")
-            break
-        except Exception as e:
-            print(f"Error clicking 'Load More': {e}")
-            break
+        return jobs.to_dataframe()
+
+    # Each round yields only the rows appended since the previous one
+    for fragment in iter_new_items(driver, 'div.row.default', click_load_more):
+        parse_rows(fragment, jobs)
 
     driver.switch_to.default_content()  # Switch back to the main page
-    return df
+    return jobs.to_dataframe()
 
 def save_df_to_csv(df, output_dir='./csv_files'):
     """Saves the DataFrame."""
@@ -144,6 +136,7 @@ def save_df_to_csv(df, output_dir='./csv_files'):
     timestamp = time.strftime("%Y%m%d_%H%M%S")
     file_path = os.path.join(output_dir, f'hanwha_jobs_{timestamp}.csv')
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 if __name__ == "__main__":
@@ -156,4 +149,5 @@ if __name__ == "__main__":
         else:
             print("No jobs were scraped.")
     finally:
+        transfer_report(driver, 'HANWHA')
         driver.quit()
\ No newline at end of file
@@ -1,6 +1,5 @@
 import os
-import time
-import pandas as pd
+from job_records import JobRecordBuffer
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
@@ -10,15 +9,26 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium_stealth import stealth
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import lease_pooled_driver
+from waits import wait_for_present, wait_for_staleness
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
+from dom_extract import capture_html
 
 def configure_webdriver():
+    driver = lease_pooled_driver('Jacobs')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'Jacobs')
     options.add_argument("--headless")
     options.add_argument('--log-level=1')
     options.add_argument("--window-size=1920,1080")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -30,17 +40,17 @@ def configure_webdriver():
     return driver
 
 def scrape_job_data(driver, Job_Classification, location):
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
    
     url = 'https://careers.jacobs.com/en_US/careers/SearchJobs/?4182=%5B76334%5D&4182_format=4422&listFilterMode=1&jobRecordsPerPage=10&'
     driver.get(url)
     print(f"Scraping {url}")
     
-    # Wait for page to load
-    time.sleep(5)
+    # Wait for the first results to render
+    wait_for_present(driver, 'article.article--result', timeout=15)
 
     while True:
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+        soup = BeautifulSoup(capture_html(driver, 'article.article--result'), 'lxml')
         # Find all job articles
         job_listings = soup.find_all('article', {'class': 'article--result'})
         
@@ -81,15 +91,7 @@ def scrape_job_data(driver, Job_Classification, location):
                     continue
                 print(f"Scraped job: {job_title} - {location}")
 
-                new_data = pd.DataFrame({
-                    'Link': [link],
-                    'Job Title': [job_title],
-                    'Job Classification': [job_classification],
-                    'Location': [location],
-                    'Company': [company]
-                })
-
-                df = pd.concat([df, new_data], ignore_index=True)
+                jobs.add(link, job_title, job_classification, location, company)
                 print(f"Scraped: {job_title} - {location}")
                 
             except Exception as e:
@@ -102,9 +104,12 @@ def scrape_job_data(driver, Job_Classification, location):
                 print("Reached last page")
                 break
                 
+            first_result = driver.find_element(By.CSS_SELECTOR, 'article.article--result')
             next_button.click()
             print("Moving to next page")
-            time.sleep(3)  # Wait for new page to load
+            # The old results are replaced when the next page arrives
+            wait_for_staleness(driver, first_result)
+            wait_for_present(driver, 'article.article--result')
             
         except NoSuchElementException:
             print("No more pages available")
@@ -113,8 +118,8 @@ def scrape_job_data(driver, Job_Classification, location):
             print(f"Error navigating to next page: {e}")
             break
 
-    print(f"Total jobs scraped: {len(df)}")
-    return df
+    print(f"Total jobs scraped: {len(jobs)}")
+    return jobs.to_dataframe()
 
 def save_df_to_csv(df, output_dir):
     if not os.path.exists(output_dir):
@@ -122,6 +127,7 @@ def save_df_to_csv(df, output_dir):
 
     file_path = os.path.join(output_dir, 'Jacobs_job_data.csv')  # Changed filename to Jacobs
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 # Main execution
@@ -137,4 +143,5 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"An error occurred: {e}")
     finally:
+        transfer_report(driver, 'Jacobs')
         driver.quit()
\ No newline at end of file
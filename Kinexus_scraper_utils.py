@@ -1,5 +1,5 @@
 import os
-import pandas as pd
+from job_records import JobRecordBuffer
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
@@ -7,14 +7,24 @@ from selenium.webdriver.common.by import By
 from selenium_stealth import stealth
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import lease_pooled_driver
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
+from dom_extract import capture_html
 
 def configure_webdriver():
+    driver = lease_pooled_driver('Kinexus')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'Kinexus')
     options.add_argument("--headless")
     options.add_argument('--log-level=1')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -26,7 +36,7 @@ def configure_webdriver():
     return driver
 
 def scrape_job_data(driver, Job_Classification, location):
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
    
     url = 'https://www.kinexus.com.au/jobs'
     driver.get(url)
@@ -35,7 +45,7 @@ def scrape_job_data(driver, Job_Classification, location):
     last_page = False
 
     while True:
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+        soup = BeautifulSoup(capture_html(driver, 'li.job-result-item, a[rel="next"]'), 'lxml')
         # Updated selector to find job listings
         job_listings = soup.find_all('li', {'class': 'job-result-item'})
         
@@ -67,15 +77,7 @@ def scrape_job_data(driver, Job_Classification, location):
                 
                 company = 'Kinexus'
                 
-                new_data = pd.DataFrame({
-                    'Link': [link_full],
-                    'Job Title': [job_title],
-                    'Job Classification': [Job_Classification],
-                    'Location': [location],
-                    'Company': [company]
-                })
-
-                df = pd.concat([df, new_data], ignore_index=True)
+                jobs.add(link_full, job_title, Job_Classification, location, company)
                 print(f"Scraped: {job_title} - {location}")
                 
             except Exception as e:
@@ -104,7 +106,7 @@ def scrape_job_data(driver, Job_Classification, location):
             print(f"No next page found: {e}")
             break
 
-    return df
+    return jobs.to_dataframe()
 
 def save_df_to_csv(df, output_dir):
     if not os.path.exists(output_dir):
@@ -112,6 +114,7 @@ def save_df_to_csv(df, output_dir):
 
     file_path = os.path.join(output_dir, 'Kinexus_job_data.csv')
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 # Main execution
@@ -122,4 +125,5 @@ if __name__ == "__main__":
         df = scrape_job_data(driver, 'Engineering', 'Australia')
         save_df_to_csv(df, output_dir)
     finally:
+        transfer_report(driver, 'Kinexus')
         driver.quit()
\ No newline at end of file
@@ -1,5 +1,5 @@
 import os
-import pandas as pd
+from job_records import JobRecordBuffer
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.common.exceptions import NoSuchElementException
@@ -7,15 +7,25 @@ from selenium.webdriver.common.by import By
 from selenium_stealth import stealth
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
-import time
+from driver_pool import lease_pooled_driver
+from waits import wait_for_present
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
+from dom_extract import capture_html
 
 def configure_webdriver():
+    driver = lease_pooled_driver('L3Harris')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'L3Harris')
     options.add_argument("--headless")
     options.add_argument('--log-level=1')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -27,7 +37,7 @@ def configure_webdriver():
     return driver
 
 def scrape_job_data(driver, Job_Classification, location):
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
     base_url = 'https://careers.l3harris.com'
     url = f'{base_url}/en/location/australia-jobs/4832/2077456/2'
     driver.get(url)
@@ -35,10 +45,10 @@ def scrape_job_data(driver, Job_Classification, location):
     
     page = 1
     while True:
-        # Add a small delay to ensure the page loads completely
-        time.sleep(2)
+        # Wait for the results list instead of a fixed delay
+        wait_for_present(driver, '#search-results-list ul li')
         
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+        soup = BeautifulSoup(capture_html(driver, '#search-results-list, div.pagination-paging.paging-right'), 'lxml')
         # Find all job listings within the search-results-list
         job_listings = soup.select('#search-results-list ul li')
 
@@ -68,15 +78,7 @@ def scrape_job_data(driver, Job_Classification, location):
                 location_element = job.find('span', {'class': 'results-facet job-location test3'})
                 job_location = location_element.text.strip() if location_element else 'No Location'
 
-                new_data = pd.DataFrame({
-                    'Link': [link],
-                    'Job Title': [job_title],
-                    'Job Classification': [job_classification],
-                    'Location': [job_location],
-                    'Company': ['L3Harris']
-                })
-
-                df = pd.concat([df, new_data], ignore_index=True)
+                jobs.add(link, job_title, job_classification, job_location, 'L3Harris')
                 print(f"Scraped: {job_title} - {job_location}")
 
             except Exception as e:
@@ -107,7 +109,7 @@ def scrape_job_data(driver, Job_Classification, location):
             break
 
     print(f"Finished scraping. Total pages processed: {page}")
-    return df
+    return jobs.to_dataframe()
 
 def save_df_to_csv(df, output_dir):
     if not os.path.exists(output_dir):
@@ -115,6 +117,7 @@ def save_df_to_csv(df, output_dir):
     
     file_path = os.path.join(output_dir, 'L3Harris_job_data.csv')
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 # Create the output directory
@@ -128,4 +131,5 @@ if __name__ == "__main__":
         df = scrape_job_data(driver, 'Engineering', 'Australia')
         save_df_to_csv(df, output_dir)
     finally:
+        transfer_report(driver, 'L3Harris')
         driver.quit()
\ No newline at end of file
@@ -1,74 +1,55 @@
 import os
-import pandas as pd
 from seleniumbase import SB
-import time
+from dom_extract import extract_rows
+from job_records import JobRecordBuffer
+from waits import wait_for_dom_stable, wait_for_staleness
+from job_outputs import save_job_outputs
+from replay import wrap_sb
 
-def scrape_page_jobs(sb):
-    """Scrape all jobs from the current page."""
-    jobs_data = []
+# Location and clearance are the first and second div.large-3.columns of a listing
+LEIDOS_FIELDS = {
+    'title': 'div.large-4 a',
+    'link': ('div.large-4 a', 'href'),
+    'location': {'css': 'div.large-3.columns', 'index': 0},
+    'clearance': {'css': 'div.large-3.columns', 'index': 1},
+}
+
+def scrape_page_jobs(sb, jobs):
+    """Add every job on the current page to jobs with one extraction call; returns how many were added."""
+    added = 0
     
     try:
-        job_items = sb.find_elements('div.jobs-section__item')
+        job_items = extract_rows(sb.driver, 'div.jobs-section__item', LEIDOS_FIELDS)
         print(f"Found {len(job_items)} job listings on this page")
         
         for job in job_items:
-            try:
-                # Extract job title and link
-                title_element = job.find_element('css selector', 'div.large-4 a')
-                job_title = title_element.text.strip()
-                link = title_element.get_attribute('href')
-                
-                # Extract location
-                try:
-                    location_element = job.find_element('css selector', 'div.large-3.columns')
-                    location = location_element.text.strip()
-                    # Remove "Location: " prefix if present
-                    location = location.replace('Location:', '').strip()
-                except:
-                    location = 'Not specified'
-                
-                # Extract job classification (clearance level)
-                try:
-                    clearance_elements = job.find_elements('css selector', 'div.large-3.columns')
-                    if len(clearance_elements) >= 2:
-                        job_classification = clearance_elements[1].text.strip()
-                        job_classification = job_classification.replace('Clearance:', '').strip()
-                    else:
-                        job_classification = 'Not specified'
-                except:
-                    job_classification = 'Not specified'
-                
-                jobs_data.append({
-                    'Link': link,
-                    'Job Title': job_title,
-                    'Job Classification': job_classification,
-                    'Location': location,
-                    'Company': 'Leidos'
-                })
-                
-                print(f"Scraped: {job_title} - {location}")
-                
-            except Exception as e:
-                print(f"Error scraping individual job: {e}")
+            if not job['title']:
                 continue
+            
+            # Remove "Location: " / "Clearance:" prefixes if present
+            location = (job['location'] or '').replace('Location:', '').strip() or 'Not specified'
+            job_classification = (job['clearance'] or '').replace('Clearance:', '').strip() or 'Not specified'
+            
+            jobs.add(job['link'], job['title'], job_classification, location, 'Leidos')
+            added += 1
+            
+            print(f"Scraped: {job['title']} - {location}")
                 
     except Exception as e:
         print(f"Error finding job listings: {e}")
     
-    return jobs_data
+    return added
 
 def scrape_job_data(sb):
-    all_jobs_data = []
+    jobs = JobRecordBuffer()
     
     url = 'https://auscareers.leidos.com/search/jobs'
     sb.open(url)
     print(f"Scraping {url}")
     
-    # Wait for the page to load
+    # Wait for the page to load and the list to stop changing
     sb.wait_for_element('div.jobs-section__item', timeout=15)
-    
-    # Add random delay to appear more human-like
-    sb.sleep(2)
+    wait_for_dom_stable(sb.driver, 'body', quiet_ms=500)
     
     page_num = 1
     
@@ -76,9 +57,8 @@ def scrape_job_data(sb):
         print(f"\n--- Scraping Page {page_num} ---")
         
         # Scrape jobs from current page
-        jobs_data = scrape_page_jobs(sb)
-        all_jobs_data.extend(jobs_data)
-        print(f"Total jobs scraped so far: {len(all_jobs_data)}")
+        scrape_page_jobs(sb, jobs)
+        print(f"Total jobs scraped so far: {len(jobs)}")
         
         # Look for next page button
         try:
@@ -92,22 +72,19 @@ def scrape_job_data(sb):
                 
                 # Human-like behavior: scroll around a bit before clicking
                 sb.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
-                sb.sleep(1)
                 
                 # Scroll to next button and click
                 print(f"Moving to page {page_num + 1}...")
                 sb.scroll_to('a.next_page')
-                sb.sleep(1)
+                first_item = sb.find_element('div.jobs-section__item')
                 
                 # Click using SeleniumBase method (handles Cloudflare better)
                 sb.click('a.next_page')
                 
-                # Wait for new page to load
-                sb.sleep(3)
+                # Wait for the old listings to be replaced by the new page
+                wait_for_staleness(sb.driver, first_item, timeout=15)
                 sb.wait_for_element('div.jobs-section__item', timeout=15)
-                
-                # Additional wait to ensure page fully loads
-                sb.sleep(2)
+                wait_for_dom_stable(sb.driver, 'body', quiet_ms=500)
                 
                 page_num += 1
             else:
@@ -118,7 +95,7 @@ def scrape_job_data(sb):
             print(f"Error navigating to next page: {e}")
             break
     
-    return pd.DataFrame(all_jobs_data)
+    return jobs.to_dataframe()
 
 def save_df_to_csv(df, output_dir):
     if not os.path.exists(output_dir):
@@ -128,6 +105,7 @@ def save_df_to_csv(df, output_dir):
     
     try:
         df.to_csv(file_path, index=False)
+        save_job_outputs(df, file_path, __file__)
         print(f"\nData saved to {file_path}")
         print(f"Total jobs scraped: {len(df)}")
     except Exception as e:
@@ -139,6 +117,7 @@ if __name__ == "__main__":
     
     # Use SeleniumBase with UC mode (undetected) to bypass Cloudflare
     with SB(uc=True, headless=True) as sb:
+        wrap_sb(sb)
         try:
             df = scrape_job_data(sb)
             
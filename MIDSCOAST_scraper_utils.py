@@ -1,5 +1,5 @@
 import os
-import pandas as pd
+from job_records import JobRecordBuffer
 import time
 from selenium import webdriver
 from selenium_stealth import stealth
@@ -9,14 +9,23 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from driver_pool import lease_pooled_driver
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
 
 def configure_webdriver():
+    driver = lease_pooled_driver('MIDSCOAST')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'MIDSCOAST')
     options.add_argument("--headless")  # Run in headless mode
     options.add_argument('--log-level=1')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -28,7 +37,7 @@ def configure_webdriver():
     return driver
 
 def scrape_job_data(driver):
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
     url = 'https://www.midcoast.nsw.gov.au/Your-Council/Working-with-us/Current-vacancies'
     driver.get(url)
     print(f"Scraping {url}")
@@ -40,7 +49,7 @@ def scrape_job_data(driver):
         )
     except TimeoutException:
         print("Timed out waiting for the iframe to load.")
-        return df
+        return jobs.to_dataframe()
 
     # Wait for job listings to load *inside* the iframe
     try:
@@ -50,7 +59,7 @@ def scrape_job_data(driver):
     except TimeoutException:
         print("Timed out waiting for job listings inside the iframe to load.")
         driver.switch_to.default_content()  # Switch back to the main content
-        return df
+        return jobs.to_dataframe()
 
     # Find job listings *inside* the iframe using Selenium
     job_listings = driver.find_elements(By.CSS_SELECTOR, "table.table-list tbody tr")
@@ -58,7 +67,7 @@ def scrape_job_data(driver):
     if not job_listings:
         print("No job listings found inside the iframe.")
         driver.switch_to.default_content()
-        return df
+        return jobs.to_dataframe()
 
     for job in job_listings:
         try:
@@ -68,15 +77,7 @@ def scrape_job_data(driver):
             link_full = link_element.get_attribute('href')
 
             # Create DataFrame row
-            new_data = pd.DataFrame({
-                'Link': [link_full],
-                'Job Title': [job_title],
-                'Job Classification': ['N/A'],
-                'Location': ['N/A'],
-                'Company': ['Mid Coast City Council']
-            })
-
-            df = pd.concat([df, new_data], ignore_index=True)
+            jobs.add(link_full, job_title, 'N/A', 'N/A', 'Mid Coast City Council')
             print(f"Scraped job: {job_title}")
 
         except Exception as e:
@@ -84,7 +85,7 @@ def scrape_job_data(driver):
             continue  # Move to the next job if there's an error
 
     driver.switch_to.default_content()  # Switch back to the main content after scraping
-    return df
+    return jobs.to_dataframe()
 
 def save_df_to_csv(df, output_dir):
     """Save DataFrame to CSV file."""
@@ -93,6 +94,7 @@ def save_df_to_csv(df, output_dir):
 
     file_path = os.path.join(output_dir, 'MIDC_job_data.csv')
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 # Create output directory
@@ -112,4 +114,5 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"An error occurred: {e}")
     finally:
+        transfer_report(driver, 'MIDSCOAST')
         driver.quit()
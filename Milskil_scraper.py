@@ -9,12 +9,16 @@ from bs4 import BeautifulSoup
 import pandas as pd
 import traceback
 import os
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
+from replay import wrap_driver
 
 # --- Configuration ---
 base_url = "https://milskil.com"
 careers_url = f"{base_url}/careers/"
 
 chrome_options = Options()
+apply_profile(chrome_options, 'Milskil')
 chrome_options.add_argument("--headless")  # Uncomment to run in background
 chrome_options.add_argument("--no-sandbox")
 chrome_options.add_argument("--disable-dev-shm-usage")
@@ -34,6 +38,7 @@ def save_df_to_csv(df, output_dir):
 
     # Save the DataFrame to a CSV file
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
     return file_path
 
@@ -46,7 +51,8 @@ if not os.path.exists(output_dir):
 try:
     # service = Service(executable_path=chromedriver_path) # Use if path is set
     # driver = webdriver.Chrome(service=service, options=chrome_options)
-    driver = webdriver.Chrome(options=chrome_options) # Assumes chromedriver is in PATH
+    driver = wrap_driver(webdriver.Chrome(options=chrome_options)) # Assumes chromedriver is in PATH
+    block_resources(driver)
     print("Chrome WebDriver initialized.")
 except Exception as e:
     print(f"Error initializing Chrome WebDriver: {e}")
@@ -204,5 +210,6 @@ finally:
     print("Switched back to main page context.")
     # Quit the driver
     print("Closing the browser...")
+    transfer_report(driver, 'Milskil')
     driver.quit()
     print("Browser closed.")
\ No newline at end of file
@@ -8,12 +8,15 @@ from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 import pandas as pd
 import traceback
+from browser_profile import apply_profile, block_resources, transfer_report
+from replay import wrap_driver
 
 # --- Configuration ---
 base_url = "https://milskil.com"
 careers_url = f"{base_url}/careers/"
 
 chrome_options = Options()
+apply_profile(chrome_options, 'Milskil')
 chrome_options.add_argument("--headless")  # Uncomment to run in background
 chrome_options.add_argument("--no-sandbox")
 chrome_options.add_argument("--disable-dev-shm-usage")
@@ -27,7 +30,8 @@ chrome_options.add_argument("--disable-dev-shm-usage")
 try:
     # service = Service(executable_path=chromedriver_path) # Use if path is set
     # driver = webdriver.Chrome(service=service, options=chrome_options)
-    driver = webdriver.Chrome(options=chrome_options) # Assumes chromedriver is in PATH
+    driver = wrap_driver(webdriver.Chrome(options=chrome_options)) # Assumes chromedriver is in PATH
+    block_resources(driver)
     print("Chrome WebDriver initialized.")
 except Exception as e:
     print(f"Error initializing Chrome WebDriver: {e}")
@@ -164,5 +168,6 @@ finally:
     print("Switched back to main page context.")
     # Quit the driver
     print("Closing the browser...")
+    transfer_report(driver, 'Milskil')
     driver.quit()
     print("Browser closed.")
@@ -1,20 +1,24 @@
 import os
-import pandas as pd
+from job_records import JobRecordBuffer
 from bs4 import BeautifulSoup
 from seleniumbase import SB
-import time
+from waits import wait_for_dom_stable, wait_for_ready, wait_for_staleness
+from job_outputs import save_job_outputs
+from replay import wrap_sb
+from dom_extract import capture_html
 
 def scrape_job_data():
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
 
     url = 'https://newcastle.nsw.gov.au/about-us/careers/employment-opportunities'
     
     with SB(uc=True, headless=True) as sb:
+        wrap_sb(sb)
         sb.open(url)
         print(f"Scraping {url}")
         
         # Wait for page to load
-        time.sleep(1)
+        wait_for_ready(sb.driver)
         
         # Switch to the iframe containing the job listings
         try:
@@ -24,7 +28,7 @@ def scrape_job_data():
             print("Successfully switched to iframe")
             
             # Wait for jobs to load inside iframe
-            time.sleep(1)
+            wait_for_dom_stable(sb.driver)
             
         except Exception as e:
             print(f"Error switching to iframe: {e}")
@@ -45,7 +49,7 @@ def scrape_job_data():
                     sb.switch_to_frame(selector)
                     print(f"Successfully switched to iframe using selector: {selector}")
                     iframe_found = True
-                    time.sleep(1)
+                    wait_for_dom_stable(sb.driver)
                     break
                 except:
                     continue
@@ -59,7 +63,7 @@ def scrape_job_data():
             print(f"Scraping page {page_num}")
             
             # Get page source and parse with BeautifulSoup
-            soup = BeautifulSoup(sb.get_page_source(), 'html.parser')
+            soup = BeautifulSoup(capture_html(sb.driver, 'div.jobblock.block'), 'html.parser')
             
             # Find job containers using the structure from your HTML
             job_containers = soup.find_all('div', class_='jobblock block')
@@ -97,15 +101,7 @@ def scrape_job_data():
                     
                     company = 'Newcastle City Council'
                     
-                    new_data = pd.DataFrame({
-                        'Link': [link_full],
-                        'Job Title': [job_title],
-                        'Job Classification': [job_classification],
-                        'Location': [location],
-                        'Company': [company]
-                    })
-                    
-                    df = pd.concat([df, new_data], ignore_index=True)
+                    jobs.add(link_full, job_title, job_classification, location, company)
                     print(f"Scraped: {job_title} - {job_classification} - {location}")
                     
                 except Exception as e:
@@ -140,7 +136,8 @@ def scrape_job_data():
                     # Click the next button instead of navigating to URL (since we're in iframe)
                     try:
                         sb.click(next_button)
-                        time.sleep(1)
+                        wait_for_staleness(sb.driver, next_button)
+                        wait_for_dom_stable(sb.driver)
                         page_num += 1
                     except Exception as e:
                         print(f"Error clicking next button: {e}")
@@ -153,7 +150,7 @@ def scrape_job_data():
                 print(f"No more pages")
                 break
     
-    return df
+    return jobs.to_dataframe()
 
 def save_df_to_csv(df, output_dir):
     # Ensure the directory exists
@@ -165,6 +162,7 @@ def save_df_to_csv(df, output_dir):
 
     # Save the DataFrame to a CSV file
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
     
 # Create the .csv_files directory if it doesn't exist
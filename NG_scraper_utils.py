@@ -1,197 +1,93 @@
 import os
-import time
-import pandas as pd
-import json
+import argparse
 import traceback
-from seleniumbase import Driver
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from http_utils import FixtureSession, make_session
+from job_records import JobRecordBuffer
+from job_outputs import save_job_outputs
 
 # Global search URL to use as fallback
 SEARCH_URL = 'https://jobs.northropgrumman.com/careers/search?query=%2A&location=australia&domain=ngc.com&sort_by=relevance'
 
-def configure_driver():
-    """Configure SeleniumBase driver with undetected mode."""
-    driver = Driver(
-        uc=True,
-        headless=False,
-        agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
-    return driver
+# Positions API behind the careers page (the same data as <code id="smartApplyData">)
+POSITIONS_URL = 'https://jobs.northropgrumman.com/api/apply/v2/jobs'
+PAGE_SIZE = 10
 
-def wait_for_page_load(driver, timeout=30):
-    """Wait for the page to fully load."""
-    try:
-        WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.position-card[role='link']"))
-        )
-        print("Page loaded - position cards found")
-        return True
-    except TimeoutException:
-        print("Timeout waiting for position cards")
-        return False
+def positions_params(start):
+    return {
+        'domain': 'ngc.com',
+        'query': '*',
+        'location': 'australia',
+        'sort_by': 'relevance',
+        'start': start,
+        'num': PAGE_SIZE,
+    }
 
-def click_show_more_positions(driver, max_clicks=50):
-    """Clicks 'Show More Positions' button until all jobs are loaded."""
-    clicks = 0
-    consecutive_failures = 0
-    
-    while clicks < max_clicks and consecutive_failures < 3:
-        try:
-            button = driver.find_element(By.CSS_SELECTOR, "button.show-more-positions")
-            if button.is_displayed() and button.is_enabled():
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                time.sleep(1)
-                driver.execute_script("arguments[0].click();", button)
-                clicks += 1
-                consecutive_failures = 0
-                print(f"Clicked 'Show More Positions' ({clicks})")
-                time.sleep(4)
-            else:
-                consecutive_failures += 1
-                time.sleep(2)
-        except NoSuchElementException:
-            print("All jobs loaded (button gone)")
-            break
-        except Exception as e:
-            consecutive_failures += 1
-            if consecutive_failures >= 3: break
-            time.sleep(2)
-    return clicks
+def fetch_positions(session, start):
+    """Fetch one page of positions; returns (positions, total count)"""
+    response = session.get(POSITIONS_URL, params=positions_params(start), timeout=15)
+    response.raise_for_status()
+    data = response.json()
+    return data.get('positions', []), data.get('count', 0)
 
-def extract_job_id_from_json(driver):
-    """Extract job data from the JSON embedded in the page."""
-    try:
-        soup = BeautifulSoup(driver.page_source, 'lxml')
-        script_tag = soup.find('code', {'id': 'smartApplyData'})
-        
-        if script_tag:
-            json_text = script_tag.get_text(strip=True)
-            data = json.loads(json_text)
-            positions = data.get('positions', [])
-            
-            job_id_map = {}
-            for pos in positions:
-                title = pos.get('name', '')
-                job_id = pos.get('id', '')
-                location = pos.get('location', '').replace('Australia-', '')
-                key = f"{title}|{location}"
-                job_id_map[key] = {
-                    'id': job_id,
-                    'department': pos.get('department', 'N/A')
-                }
-            return job_id_map
-    except Exception as e:
-        print(f"Error extracting JSON: {e}")
-    return {}
+def job_link(pid):
+    return f"https://jobs.northropgrumman.com/careers?location=australia&pid={pid}&domain=ngc.com&sort_by=relevance"
 
-def extract_job_data_from_card(card, job_id_map):
-    """Extract job information. Defaults Link to SEARCH_URL if ID not found."""
-    try:
-        # Initialize with SEARCH_URL as requested if specific link isn't found
-        job_data = {
-            'Link': SEARCH_URL, 
-            'Job Title': 'N/A',
-            'Job Classification': 'N/A',
-            'Location': 'N/A',
-            'Company': 'Northrop Grumman'
-        }
-        
-        title_element = card.find('div', {'class': 'position-title'})
-        if title_element:
-            job_data['Job Title'] = title_element.get_text(strip=True)
-        
-        location_element = card.find('p', {'class': 'position-location'})
-        if location_element:
-            location = location_element.get_text(strip=True).replace('Australia-', '').strip()
-            if ' and ' in location:
-                location = location.split(' and ')[0].strip()
-            job_data['Location'] = location
-        
-        classification_element = card.find('div', {'class': 'position-priority-container'})
-        if classification_element:
-            job_data['Job Classification'] = classification_element.get_text(strip=True)
-        
-        # Mapping logic
-        key = f"{job_data['Job Title']}|{job_data['Location']}"
-        job_id = None
-        
-        if key in job_id_map:
-            job_id = job_id_map[key]['id']
-        else:
-            # Fallback: find by title only
-            for map_key, map_value in job_id_map.items():
-                if map_key.startswith(job_data['Job Title'] + "|"):
-                    job_id = map_value['id']
-                    break
-        
-        # If ID was found, construct the specific deep link
-        if job_id:
-            job_data['Link'] = f"https://jobs.northropgrumman.com/careers?location=australia&pid={job_id}&domain=ngc.com&sort_by=relevance"
-        
-        return job_data
-    except Exception as e:
-        print(f"Error extracting job card: {e}")
-        return None
+def clean_location(location):
+    location = (location or 'N/A').replace('Australia-', '').strip()
+    if ' and ' in location:
+        location = location.split(' and ')[0].strip()
+    return location
+
+def add_positions(positions, jobs, seen):
+    for pos in positions:
+        pid = pos.get('id')
+        if pid in seen:
+            continue
+        seen.add(pid)
+        jobs.add(job_link(pid) if pid else SEARCH_URL, pos.get('name', 'N/A').strip(),
+                 pos.get('department') or 'N/A', clean_location(pos.get('location')), 'Northrop Grumman')
+
+def scrape_job_data(session=None, job_classification_filter=None, location_filter=None, max_workers=4):
+    """Page the positions API with start/num; the first response carries the total count"""
+    session = session or make_session(pool_size=max_workers)
+    jobs = JobRecordBuffer()
+    seen = set()
 
-def scrape_job_cards_with_map(driver, job_id_map):
-    jobs_data = []
-    soup = BeautifulSoup(driver.page_source, 'lxml')
-    job_cards = soup.find_all('div', {'class': 'position-card', 'role': 'link'})
-    
-    if not job_cards:
-        job_cards = soup.find_all('div', {'data-test-id': lambda x: x and 'position-card-' in x})
-    
-    for idx, card in enumerate(job_cards):
-        job_data = extract_job_data_from_card(card, job_id_map)
-        if job_data:
-            jobs_data.append(job_data)
-    return jobs_data
+    positions, total = fetch_positions(session, 0)
+    add_positions(positions, jobs, seen)
+    print(f"Found {total} positions")
 
-def scrape_job_data(driver, job_classification_filter=None, location_filter=None):
-    print(f"Navigating to {SEARCH_URL}")
-    driver.get(SEARCH_URL)
-    
-    if not wait_for_page_load(driver):
-        print("Initial load failed...")
-    
-    time.sleep(5)
-    click_show_more_positions(driver)
-    
-    # Final page scroll to ensure all data is rendered
-    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-    time.sleep(3)
-    
-    job_id_map = extract_job_id_from_json(driver)
-    jobs_data = scrape_job_cards_with_map(driver, job_id_map)
-    
-    if job_classification_filter or location_filter:
-        filtered_jobs = []
-        for job in jobs_data:
-            match_class = not job_classification_filter or job_classification_filter.lower() in job['Job Classification'].lower()
-            match_loc = not location_filter or location_filter.lower() in job['Location'].lower()
-            if match_class and match_loc:
-                filtered_jobs.append(job)
-        jobs_data = filtered_jobs
-    
-    return pd.DataFrame(jobs_data)
+    starts = list(range(PAGE_SIZE, total, PAGE_SIZE))
+    if starts:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(starts))) as executor:
+            for positions, _ in executor.map(lambda start: fetch_positions(session, start), starts):
+                add_positions(positions, jobs, seen)
+
+    df = jobs.to_dataframe()
+    if job_classification_filter:
+        df = df[df['Job Classification'].str.contains(job_classification_filter, case=False, regex=False)]
+    if location_filter:
+        df = df[df['Location'].str.contains(location_filter, case=False, regex=False)]
+    return df.reset_index(drop=True)
 
 def save_df_to_csv(df, output_dir):
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     file_path = os.path.join(output_dir, f'NG_job_data.csv')
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Scrape Northrop Grumman Australia postings')
+    parser.add_argument('--fixtures', help='replay recorded responses from this directory instead of the network')
+    args = parser.parse_args()
+
     output_dir = './csv_files'
-    driver = None
     try:
-        driver = configure_driver()
-        df = scrape_job_data(driver)
+        session = FixtureSession(args.fixtures) if args.fixtures else None
+        df = scrape_job_data(session)
         if not df.empty:
             save_df_to_csv(df, output_dir)
         else:
@@ -199,6 +95,3 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Critical error: {e}")
         traceback.print_exc()
-    finally:
-        if driver:
-            driver.quit()
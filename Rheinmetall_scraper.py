@@ -8,16 +8,15 @@ import re
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+from http_utils import make_session
+from job_outputs import save_job_outputs
 
 # --- Configure logging ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Thread-safe session with connection pooling
-session = requests.Session()
-session.headers.update({
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36'
-})
+# Thread-safe session with connection pooling (and fixture record/replay under run_scrapers.py)
+session = make_session(pool_size=4)
 
 def construct_page_url(base_url, page_number):
     """Construct URL for a specific page number - optimized"""
@@ -143,6 +142,7 @@ def save_df_to_csv(df, output_dir):
 
     # Save the DataFrame to a CSV file
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
     logger.info(f"✅ Data saved to {file_path}")
     return file_path
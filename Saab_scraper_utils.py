@@ -10,10 +10,21 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium_stealth import stealth
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
+from driver_pool import lease_pooled_driver
+from waits import count, wait_for_count_increase, wait_for_dom_stable, wait_for_hidden
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
+from dom_extract import capture_html
 
 def configure_webdriver():
     """Configure and return an optimized Chrome webdriver."""
+    driver = lease_pooled_driver('Saab')
+    if driver:
+        driver.set_page_load_timeout(30)
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'Saab')
     options.add_argument('--headless')
     options.add_argument('--log-level=3')  # Reduce logging
     options.add_argument('--no-sandbox')
@@ -26,6 +37,7 @@ def configure_webdriver():
     options.add_experimental_option('useAutomationExtension', False)
     
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -42,7 +54,7 @@ def accept_cookies(driver):
         WebDriverWait(driver, 10).until(
             EC.element_to_be_clickable((By.ID, "CybotCookiebotDialogBodyLevelButtonLevelOptinAllowAll"))
         ).click()
-        time.sleep(1)
+        wait_for_hidden(driver, "#CybotCookiebotDialog", timeout=5)
     except:
         pass  # Continue if no cookie prompt appears
 
@@ -54,9 +66,11 @@ def click_show_more(driver):
         )
         
         if "Show" in button.text:
-            # Quick scroll and click
+            # Quick scroll and click, then wait for the extra results to render
+            previous = count(driver, "a.vacancy__item-link")
             driver.execute_script("arguments[0].scrollIntoView(); arguments[0].click();", button)
-            time.sleep(1)  # Minimal wait time
+            wait_for_count_increase(driver, "a.vacancy__item-link", previous, timeout=5)
+            wait_for_dom_stable(driver)
             return True
             
     except:
@@ -102,7 +116,7 @@ def scrape_job_data(driver):
         pass
     
     # Extract all jobs at once
-    soup = BeautifulSoup(driver.page_source, 'lxml')
+    soup = BeautifulSoup(capture_html(driver, 'a.vacancy__item-link'), 'lxml')
     job_boxes = soup.find_all('a', class_='item vacancy__item-link')
     
     # Process all jobs in a batch
@@ -122,6 +136,7 @@ def save_df_to_csv(df, output_dir='csv_files'):
     os.makedirs(output_dir, exist_ok=True)
     file_path = os.path.join(output_dir, 'Saab_job_data.csv')
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Saved {len(df)} jobs to {file_path}")
 
 def main():
@@ -140,6 +155,7 @@ def main():
         print(f"Error during execution: {e}")
     finally:
         if driver:
+            transfer_report(driver, 'Saab')
             driver.quit()
 
 if __name__ == "__main__":
@@ -1,13 +1,21 @@
 @echo off
-:: Clear existing CSV files in the csv_files directory
+:: Clear existing CSV and Parquet files in the csv_files directory
 echo Clearing existing CSV files...
 if exist csv_files\*.csv del /Q csv_files\*.csv
+if exist csv_files\*.parquet del /Q csv_files\*.parquet
 
-:: Execute all Python scripts in the current directory
-for %%f in (*.py) do (
-    echo Running script: %%f
-    python "%%f"
-)
+:: Execute all site scrapers in parallel (per-site logs go to logs\), leasing 4 warm Chrome instances
+:: to the browser scrapers instead of each one starting its own
+python run_scrapers.py -j 8 -b 4
+set SCRAPE_STATUS=%ERRORLEVEL%
+if not "%SCRAPE_STATUS%"=="0" echo WARNING: some scrapers failed or timed out, check logs\ before using this sweep
+
+:: Added, removed and changed jobs since the previous sweep (data\deltas)
+python job_delta.py
+
+:: Append this sweep to the date/site partitioned archive (data\archive) and compact old partitions
+python job_archive.py append
+python job_archive.py compact
 
 :: Set the directory to csv_files
 cd csv_files
@@ -16,10 +24,8 @@ cd csv_files
 set dtg=%DATE:~10,4%-%DATE:~4,2%-%DATE:~7,2%_%TIME:~0,2%-%TIME:~3,2%-%TIME:~6,2%
 set dtg=%dtg: =0%
 
-:: Copy all CSV files into a new file with date and time appended
-copy *.csv merge_JOB_%dtg%.csv
-
-:: Print completion message
-echo All CSV files have been merged into merge_JOB_%dtg%.csv
+:: Merge the per-site CSVs into one deduplicated file (plus a Parquet copy) with date and time appended
+python ..\merge_jobs.py --input-dir . --output merge_JOB_%dtg%.csv
 
-pause
\ No newline at end of file
+pause
+exit /b %SCRAPE_STATUS%
\ No newline at end of file
@@ -1,5 +1,5 @@
 import os
-import pandas as pd
+from job_records import JobRecordBuffer
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -9,15 +9,25 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium_stealth import stealth
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
-import time
+from driver_pool import lease_pooled_driver
+from waits import scroll_into_view, wait_for_dom_stable
+from dom_extract import iter_new_items
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
 
 def configure_webdriver():
+    driver = lease_pooled_driver('Sypaq')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'Sypaq')
     options.add_argument("--headless")
     options.add_argument('--log-level=1')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -33,12 +43,63 @@ def wait_for_jobs_to_load(driver):
         WebDriverWait(driver, 10).until(
             EC.presence_of_element_located((By.CLASS_NAME, "slide-up-item"))
         )
-        time.sleep(1)  # Additional wait to ensure dynamic content loads
+        wait_for_dom_stable(driver)  # cards slide in after the first one appears
     except TimeoutException:
         print("Timeout waiting for jobs to load")
 
+def click_load_more(driver):
+    """Click 'Load More' if Angular is still showing it; False once every job is listed"""
+    try:
+        load_more_button = driver.find_element(By.CSS_SELECTOR, '.load-more-data')
+    except NoSuchElementException:
+        print("No 'Load More' button found in DOM. Stopping.")
+        return False
+
+    # Angular uses ng-show, so the element might exist but be hidden
+    if not load_more_button.is_displayed():
+        print("Load More button is no longer visible. Stopping.")
+        return False
+
+    scroll_into_view(driver, load_more_button)
+    # Click it using JavaScript (safest for Angular elements)
+    driver.execute_script("arguments[0].click();", load_more_button)
+    print("Clicked 'Load More'")
+    return True
+
+def parse_cards(fragment, base_url, jobs):
+    soup = BeautifulSoup(fragment, 'lxml')
+    job_cards = soup.find_all('a', class_='card slide-up-item')
+    print(f"Found {len(job_cards)} new job cards")
+
+    for job_card in job_cards:
+        try:
+            # Extract job title
+            title_elem = job_card.find('span', class_='card-title')
+            job_title = title_elem.get_text(strip=True) if title_elem else "N/A"
+            
+            # Extract location
+            location_elem = job_card.find('span', class_='card-location')
+            location = location_elem.get_text(strip=True) if location_elem else "N/A"
+            
+            # Extract job link
+            job_link = base_url + '/careers-portal/' + job_card['href'] if job_card.get('href') else "N/A"
+            
+            # Extract job classification
+            classification_elem = job_card.find('span', class_='card-category')
+            job_classification = classification_elem.get_text(strip=True) if classification_elem else "N/A"
+
+            # Add company name
+            company = "Sypaq"
+
+            jobs.add(job_link, job_title, job_classification, location, company)
+            print(f"Scraped job: {job_title} - {location}")
+            
+        except Exception as e:
+            print(f"Error processing job card: {e}")
+            continue
+
 def scrape_job_data(driver):
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
    
     base_url = 'https://www.sypaq.com.au'
     job_url = base_url + '/careers-portal/#/jobs'
@@ -48,100 +109,14 @@ def scrape_job_data(driver):
     # Initial wait for page load
     wait_for_jobs_to_load(driver)
 
-    processed_jobs = set()  # Keep track of processed jobs
-
-    while True:
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'lxml')
-        job_cards = soup.find_all('a', class_='card slide-up-item')
-        
-        print(f"Found {len(job_cards)} job cards")
-        
-        if not job_cards:
-            print("No jobs found. Stopping.")
-            break
-            
-        # Process each job card
-        for job_card in job_cards:
-            try:
-                # Extract job title
-                title_elem = job_card.find('span', class_='card-title')
-                job_title = title_elem.get_text(strip=True) if title_elem else "N/A"
-                
-                # Extract location
-                location_elem = job_card.find('span', class_='card-location')
-                location = location_elem.get_text(strip=True) if location_elem else "N/A"
-                
-                # Create job identifier
-                job_identifier = f"{job_title}_{location}"
-                
-                # Skip if we've already processed this job
-                if job_identifier in processed_jobs:
-                    continue
-                
-                # Extract job link
-                job_link = base_url + '/careers-portal/' + job_card['href'] if job_card.get('href') else "N/A"
-                
-                # Extract job classification
-                classification_elem = job_card.find('span', class_='card-category')
-                job_classification = classification_elem.get_text(strip=True) if classification_elem else "N/A"
-
-                # Add company name
-                company = "Sypaq"
-
-                new_data = pd.DataFrame({
-                    'Link': [job_link],
-                    'Job Title': [job_title],
-                    'Job Classification': [job_classification],
-                    'Location': [location],
-                    'Company': [company]
-                })
-
-                df = pd.concat([df, new_data], ignore_index=True)
-                processed_jobs.add(job_identifier)
-                print(f"Scraped job: {job_title} - {location}")
-                
-            except Exception as e:
-                print(f"Error processing job card: {e}")
-                continue
-        
-        try:
-            # UPDATED: Look for the class name found in your HTML text
-            load_more_button = driver.find_element(By.CSS_SELECTOR, '.load-more-data')
-            
-            # Check if the button is actually visible 
-            # (Angular uses ng-show, so the element might exist but be hidden)
-            if not load_more_button.is_displayed():
-                print("Load More button is no longer visible. Stopping.")
-                break
-            
-            # Scroll to the button
-            driver.execute_script("arguments[0].scrollIntoView(true);", load_more_button)
-            time.sleep(1) # Short pause to let scroll settle
-            
-            # Click it using JavaScript (safest for Angular elements)
-            driver.execute_script("arguments[0].click();", load_more_button)
-            print("Clicked 'Load More'")
-            
-            # Wait for new content
-            # We wait for the number of job cards to increase
-            current_job_count = len(job_cards)
-            WebDriverWait(driver, 10).until(
-                lambda d: len(d.find_elements(By.CLASS_NAME, 'slide-up-item')) > current_job_count
-            )
-            time.sleep(2) # Extra buffer for text rendering
-            
-        except NoSuchElementException:
-            print("No 'Load More' button found in DOM. Stopping.")
-            break
-        except TimeoutException:
-            print("Clicked load more, but no new jobs appeared. Stopping.")
-            break
-        except Exception as e:
-            print(f"Error interacting with Load More button: {e}")
-            break
+    # Each round yields only the cards appended since the previous one
+    for fragment in iter_new_items(driver, 'a.card.slide-up-item', click_load_more, settle_ms=300):
+        parse_cards(fragment, base_url, jobs)
+
+    if not len(jobs):
+        print("No jobs found.")
             
-    return df
+    return jobs.to_dataframe()
 
 def save_df_to_csv(df, output_dir):
     if not os.path.exists(output_dir):
@@ -149,6 +124,7 @@ def save_df_to_csv(df, output_dir):
 
     file_path = os.path.join(output_dir, 'SYPAQ_job_data.csv')
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
     print(f"Total jobs scraped: {len(df)}")
 
@@ -163,4 +139,5 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"An error occurred: {e}")
     finally:
+        transfer_report(driver, 'Sypaq')
         driver.quit()
\ No newline at end of file
@@ -1,5 +1,5 @@
 import os
-import pandas as pd
+from job_records import JobRecordBuffer
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -9,15 +9,24 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 from selenium_stealth import stealth
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
-import time
+from driver_pool import lease_pooled_driver
+from waits import wait_for_network_idle, wait_for_ready
+from browser_profile import apply_profile, block_resources, transfer_report
+from job_outputs import save_job_outputs
 
 def configure_webdriver():
+    driver = lease_pooled_driver('anduril')
+    if driver:
+        return driver
+
     options = webdriver.ChromeOptions()
+    apply_profile(options, 'anduril')
     options.add_argument("--headless")
     options.add_argument('--log-level=1')
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
     driver = webdriver.Chrome(options=options)
+    block_resources(driver)
     stealth(driver,
             languages=["en-US", "en"],
             vendor="Google Inc.",
@@ -29,18 +38,19 @@ def configure_webdriver():
     return driver
 
 def scrape_job_data(driver, Job_Classification, location_filter):
-    df = pd.DataFrame(columns=['Link', 'Job Title', 'Job Classification', 'Location', 'Company'])
+    jobs = JobRecordBuffer()
 
     url = 'https://www.anduril.com/open-roles?search=australia'
     driver.get(url)
     print(f"Scraping {url}")
-    time.sleep(5)  # Increased wait time for page to fully load
+    wait_for_ready(driver)
+    wait_for_network_idle(driver)
 
     # Scroll to load all content
     last_height = driver.execute_script("return document.body.scrollHeight")
     while True:
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
+        wait_for_network_idle(driver, timeout=5)
         new_height = driver.execute_script("return document.body.scrollHeight")
         if new_height == last_height:
             break
@@ -55,7 +65,7 @@ def scrape_job_data(driver, Job_Classification, location_filter):
 
     if not job_items:
         print("No jobs found. Stopping.")
-        return df
+        return jobs.to_dataframe()
 
     for item in job_items:
         try:
@@ -79,20 +89,12 @@ def scrape_job_data(driver, Job_Classification, location_filter):
 
             print(f"Scraped job: {job_title} - {location}")
 
-            new_data = pd.DataFrame({
-                'Link': [link],
-                'Job Title': [job_title],
-                'Job Classification': [Job_Classification],
-                'Location': [location],
-                'Company': [company]
-            })
-
-            df = pd.concat([df, new_data], ignore_index=True)
+            jobs.add(link, job_title, Job_Classification, location, company)
 
         except Exception as e:
             print(f"Error scraping job: {e}")
 
-    return df
+    return jobs.to_dataframe()
 
 output_dir = '.\\csv_files'
 if not os.path.exists(output_dir):
@@ -105,6 +107,7 @@ def save_df_to_csv(df, output_dir):
     file_path = os.path.join(output_dir, 'Anduril_job_data.csv')
 
     df.to_csv(file_path, index=False)
+    save_job_outputs(df, file_path, __file__)
     print(f"Data saved to {file_path}")
     print(f"Total jobs scraped: {len(df)}")
 
@@ -114,4 +117,5 @@ if __name__ == "__main__":
         df = scrape_job_data(driver, 'Engineering', 'Australia')
         save_df_to_csv(df, output_dir)
     finally:
+        transfer_report(driver, 'anduril')
         driver.quit()
\ No newline at end of file
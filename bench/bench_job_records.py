@@ -0,0 +1,67 @@
+import argparse
+import os
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from job_records import JOB_COLUMNS, JobRecordBuffer
+
+def make_row(i):
+    return (f'https://example.com/job/{i}', f'Engineer {i}', 'Engineering', 'Adelaide, SA', 'Example')
+
+def concat_pattern(n):
+    """The per-row pattern the scrapers used before JobRecordBuffer"""
+    df = pd.DataFrame(columns=JOB_COLUMNS)
+    for i in range(n):
+        link, title, classification, location, company = make_row(i)
+        new_data = pd.DataFrame({
+            'Link': [link],
+            'Job Title': [title],
+            'Job Classification': [classification],
+            'Location': [location],
+            'Company': [company]
+        })
+        df = pd.concat([df, new_data], ignore_index=True)
+    return df
+
+def buffer_pattern(n):
+    jobs = JobRecordBuffer()
+    for i in range(n):
+        jobs.add(*make_row(i))
+    return jobs.to_dataframe()
+
+def time_it(func, n):
+    start = time.perf_counter()
+    df = func(n)
+    elapsed = time.perf_counter() - start
+    assert len(df) == n
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare per-row pd.concat against JobRecordBuffer')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--max-concat', type=int, default=10000,
+                        help='time the concat pattern up to this many rows and extrapolate it (quadratic) '
+                             'beyond; 0 times every size (default: 10000)')
+    args = parser.parse_args()
+
+    print(f"{'Rows':>8}{'concat (s)':>14}{'buffer (s)':>14}{'speed-up':>12}")
+    measured = None  # (rows, seconds) of the largest concat run actually timed
+    for n in args.sizes:
+        buffer_seconds = time_it(buffer_pattern, n)
+        if args.max_concat and n > args.max_concat:
+            if measured is None:
+                print(f"{n:>8}{'skipped':>14}{buffer_seconds:>14.3f}{'-':>12}")
+                continue
+            concat_seconds = measured[1] * (n / measured[0]) ** 2
+            print(f"{n:>8}{f'~{concat_seconds:.1f} est.':>14}{buffer_seconds:>14.3f}"
+                  f"{f'~{concat_seconds / buffer_seconds:.0f}x':>12}")
+            continue
+        concat_seconds = time_it(concat_pattern, n)
+        if measured is None or n > measured[0]:
+            measured = (n, concat_seconds)
+        print(f"{n:>8}{concat_seconds:>14.3f}{buffer_seconds:>14.3f}{concat_seconds / buffer_seconds:>11.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,281 @@
+import argparse
+import functools
+import importlib
+import inspect
+import json
+import os
+import runpy
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+from run_scrapers import discover_scrapers, site_name
+
+RESULTS_DIR = os.path.join(REPO_DIR, 'bench', 'results')
+DEFAULT_FIXTURES = os.path.join(REPO_DIR, 'fixtures')
+MIN_REGRESSION_SECONDS = 0.05  # ignore noise on phases that barely register
+
+PHASES = ['driver_startup', 'navigation', 'waits', 'http', 'dom_capture', 'parsing', 'dataframe', 'csv_write']
+# Only meaningful against page snapshots; without them a browser site times the stand-in's 404s
+BROWSER_PHASES = ['driver_startup', 'navigation', 'waits', 'dom_capture']
+
+# (module, attribute path, phase). Whatever is importable gets timed; a site that never
+# touches Selenium simply reports zero for the browser phases
+INSTRUMENTED = [
+    ('selenium.webdriver.chromium.webdriver', 'ChromiumDriver.__init__', 'driver_startup'),
+    ('seleniumbase', 'SB', 'driver_startup'),
+    ('selenium.webdriver.remote.webdriver', 'WebDriver.get', 'navigation'),
+    ('selenium.webdriver.support.wait', 'WebDriverWait.until', 'waits'),
+    ('waits', 'wait_until', 'waits'),
+    ('waits', '_async_wait', 'waits'),
+    ('requests.sessions', 'Session.request', 'http'),
+    ('selenium.webdriver.remote.webdriver', 'WebDriver.page_source', 'dom_capture'),
+    ('dom_extract', 'capture_html', 'dom_capture'),
+    ('dom_extract', 'capture_new_html', 'dom_capture'),
+    ('dom_extract', 'extract_rows', 'dom_capture'),
+    ('bs4', 'BeautifulSoup.__init__', 'parsing'),
+    ('lxml.html', 'fromstring', 'parsing'),
+    ('job_records', 'JobRecordBuffer.to_dataframe', 'dataframe'),
+    ('pandas', 'DataFrame.to_csv', 'csv_write'),
+]
+
+class PhaseTimer:
+    """Cumulative seconds per phase; a call made while another timed call is running is not counted twice.
+
+    Time is summed over worker threads, so a site that fetches pages concurrently can
+    report more http seconds than wall seconds.
+    """
+
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.rows_written = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def wrap(self, func, phase):
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            if getattr(self._local, 'active', False):
+                return func(*args, **kwargs)
+            self._local.active = True
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._local.active = False
+                with self._lock:
+                    self.seconds[phase] += elapsed
+                    self.calls[phase] += 1
+        return timed
+
+    def instrument(self):
+        for module_name, path, phase in INSTRUMENTED:
+            try:
+                owner = importlib.import_module(module_name)
+            except ImportError:
+                continue
+            *parents, name = path.split('.')
+            for parent in parents:
+                owner = getattr(owner, parent)
+            original = inspect.getattr_static(owner, name, None)  # properties stay properties
+            if isinstance(original, property):
+                setattr(owner, name, property(self.wrap(original.fget, phase)))
+            elif original is not None:
+                setattr(owner, name, self.wrap(original, phase))
+
+        # count what actually reaches the CSV
+        import pandas as pd
+        to_csv = pd.DataFrame.to_csv
+        def counting_to_csv(df, *args, **kwargs):
+            self.rows_written += len(df)
+            return to_csv(df, *args, **kwargs)
+        pd.DataFrame.to_csv = counting_to_csv
+
+def peak_memory_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+def run_child(script, out_path):
+    """Inside the child interpreter: instrument, run the site module as __main__, dump timings"""
+    sys.path.insert(0, REPO_DIR)
+    timer = PhaseTimer()
+    timer.instrument()
+    status = 'ok'
+    sys.argv = [script]
+    start = time.perf_counter()
+    try:
+        runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:
+        status = 'ok' if not e.code else 'failed'
+    except Exception as e:
+        print(f"bench: {site_name(script)} raised {e!r}")
+        status = 'failed'
+    wall = time.perf_counter() - start
+
+    # a wait that ran out its timeout (e.g. a load-more button missing from a snapshot) is
+    # reported on its own rather than as time spent waiting for the page
+    waits = sys.modules.get('waits')
+    timed_out = [entry['seconds'] for entry in waits.WAIT_LOG if not entry['ok']] if waits else []
+    phases = {phase: round(timer.seconds.get(phase, 0.0), 4) for phase in PHASES}
+    phases['waits'] = round(max(phases['waits'] - sum(timed_out), 0.0), 4)
+    with open(out_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'status': status,
+            'wall': round(wall, 4),
+            'phases': phases,
+            'wait_timeouts': {'count': len(timed_out), 'seconds': round(sum(timed_out), 4)},
+            'other': round(max(wall - sum(phases.values()) - sum(timed_out), 0.0), 4),
+            'calls': dict(timer.calls),
+            'rows': timer.rows_written,
+            'peak_memory_mb': peak_memory_mb(),
+        }, f)
+
+def fixture_kinds(fixture_root):
+    """site name (lowercased fixture directory, e.g. fixtures/workday/cae) -> entry kinds it holds"""
+    kinds = defaultdict(set)
+    for directory, _, files in os.walk(fixture_root):
+        if 'index.json' not in files:
+            continue
+        with open(os.path.join(directory, 'index.json'), 'r', encoding='utf-8') as f:
+            kinds[os.path.basename(directory).lower()].update(entry.get('kind', 'http') for entry in json.load(f))
+    return kinds
+
+def sites_with_fixtures(scripts, fixture_root):
+    """Sites whose name matches a fixture directory"""
+    names = fixture_kinds(fixture_root)
+    return [script for script in scripts if site_name(script).lower() in names]
+
+def used_browser(result):
+    return any(result.get('phases', {}).get(phase) for phase in BROWSER_PHASES)
+
+def bench_site(script, env, timeout, log_dir):
+    site = site_name(script)
+    with tempfile.TemporaryDirectory() as work_dir:
+        out_path = os.path.join(work_dir, 'result.json')
+        with open(os.path.join(log_dir, f'{site}.log'), 'w', encoding='utf-8', errors='replace') as log:
+            try:
+                subprocess.run([sys.executable, os.path.abspath(__file__), '--child', script, out_path],
+                               cwd=work_dir, env=env, stdout=log, stderr=subprocess.STDOUT, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                return {'status': 'timeout'}
+        if not os.path.exists(out_path):
+            return {'status': 'error'}
+        with open(out_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+def print_results(results, unsnapshotted=()):
+    header = ''.join(f"{phase[:11]:>12}" for phase in PHASES)
+    print(f"\n{'Site':<14}{'Status':<9}{'Wall':>8}{header}{'Timeouts':>14}{'Rows':>7}{'MB':>8}")
+    for site, result in sorted(results.items()):
+        if 'phases' not in result:
+            print(f"{site:<14}{result['status']:<9}")
+            continue
+        phases = ''.join(f"{result['phases'][phase]:>12.3f}" for phase in PHASES)
+        timeouts = result.get('wait_timeouts') or {'count': 0, 'seconds': 0.0}
+        timeouts = f"{timeouts['count']} / {timeouts['seconds']:.1f}s"
+        memory = result.get('peak_memory_mb')
+        print(f"{site:<14}{result['status']:<9}{result['wall']:>8.2f}{phases}{timeouts:>14}{result['rows']:>7}"
+              f"{memory if memory is None else round(memory):>8}")
+    if unsnapshotted:
+        print(f"No page snapshots for {', '.join(unsnapshotted)}: their browser phases time pages the "
+              "stand-in could not serve (record some with run_scrapers.py --record)")
+
+def find_regressions(results, baseline, threshold):
+    """Wall, phase or memory figures that grew by more than threshold against the baseline run"""
+    regressions = []
+    for site, result in results.items():
+        before = baseline.get('sites', {}).get(site)
+        if not before or 'phases' not in result or 'phases' not in before:
+            continue
+        pairs = [('wall', before['wall'], result['wall'])]
+        pairs += [(phase, before['phases'].get(phase), result['phases'][phase]) for phase in PHASES
+                  if before['phases'].get(phase) is not None]
+        for name, old, new in pairs:
+            if new - old > MIN_REGRESSION_SECONDS and new > old * (1 + threshold):
+                regressions.append(f"{site} {name}: {old:.3f}s -> {new:.3f}s")
+        old_mb, new_mb = before.get('peak_memory_mb'), result.get('peak_memory_mb')
+        if old_mb and new_mb and new_mb > old_mb * (1 + threshold):
+            regressions.append(f"{site} peak memory: {old_mb:.0f} MB -> {new_mb:.0f} MB")
+    return regressions
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == '--child':
+        run_child(sys.argv[2], sys.argv[3])
+        return 0
+
+    parser = argparse.ArgumentParser(description='Benchmark site scrapers end to end against replayed fixtures')
+    parser.add_argument('sites', nargs='*', help='only these sites (default: every site with fixtures)')
+    parser.add_argument('--fixtures', default=DEFAULT_FIXTURES, help='fixture root to replay from')
+    parser.add_argument('--repeat', type=int, default=1, help='runs per site; the fastest is kept')
+    parser.add_argument('--timeout', type=int, default=300, help='seconds allowed per site run')
+    parser.add_argument('--out', help=f'results JSON (default: {RESULTS_DIR}/<commit>.json)')
+    parser.add_argument('--baseline', help='results JSON from an earlier commit to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='flag figures that grew by more than this fraction (default: 0.2)')
+    args = parser.parse_args()
+
+    from replay import REPLAY_ENV, FixtureServer
+
+    scripts = discover_scrapers(REPO_DIR, args.sites)
+    if not args.sites:
+        scripts = sites_with_fixtures(scripts, args.fixtures)
+    if not scripts:
+        print("No sites to benchmark.")
+        return 1
+
+    log_dir = os.path.join(RESULTS_DIR, 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    kinds = fixture_kinds(args.fixtures)
+    results = {}
+    unsnapshotted = []
+    with FixtureServer(args.fixtures) as server:
+        env = dict(os.environ, **{REPLAY_ENV: server.url})
+        for script in scripts:
+            runs = [bench_site(script, env, args.timeout, log_dir) for _ in range(max(1, args.repeat))]
+            ok_runs = [run for run in runs if run.get('status') == 'ok']
+            results[site_name(script)] = min(ok_runs, key=lambda run: run['wall']) if ok_runs else runs[-1]
+            if used_browser(results[site_name(script)]) and 'snapshot' not in kinds.get(site_name(script).lower(), ()):
+                unsnapshotted.append(site_name(script))
+            print(f"{site_name(script)}: {results[site_name(script)]['status']}")
+
+    print_results(results, unsnapshotted)
+
+    commit = git_commit()
+    out_path = args.out or os.path.join(RESULTS_DIR, f'{commit}.json')
+    with open(out_path, 'w', encoding='utf-8') as f:
+        json.dump({'commit': commit, 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   'python': sys.version.split()[0], 'sites': results}, f, indent=2)
+    print(f"\nResults saved to {out_path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = find_regressions(results, baseline, args.threshold)
+        print(f"Compared with {baseline.get('commit', args.baseline)} at +{args.threshold:.0%}: "
+              f"{len(regressions)} regression(s)")
+        for regression in regressions:
+            print(f"  REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
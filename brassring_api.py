@@ -0,0 +1,117 @@
+import argparse
+import logging
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree, html
+from http_utils import FixtureSession, make_session
+from job_records import JobRecordBuffer
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = 'https://krb-sjobs.brassring.com'
+
+# One entry per TGnewUI site. Each job comes back as a list of Questions;
+# the *_question keys name the ones holding the columns we keep
+BRASSRING_SITES = {
+    'LMA': {
+        'partner_id': '30122',
+        'site_id': '6621',
+        'location': 'Australia',
+        'keyword_fields': 'JobTitle,FORMTEXT5',
+        'location_fields': 'FORMTEXT2',
+        'title_question': 'jobtitle',
+        'location_question': 'formtext2',
+        'classification_question': 'formtext5',
+        'company': 'LMA',
+    },
+}
+
+VERIFICATION_TOKEN = etree.XPath("string(//input[@name='__RequestVerificationToken']/@value)")
+SESSION_VALUE = re.compile(r'"encryptedSessionValue"\s*:\s*"([^"]*)"', re.IGNORECASE)
+
+def home_url(config):
+    return f"{BASE_URL}/TGnewUI/Search/Home/Home?partnerid={config['partner_id']}&siteid={config['site_id']}"
+
+def matched_jobs_url():
+    return f"{BASE_URL}/TgNewUI/Search/Ajax/MatchedJobs"
+
+def open_search(session, config):
+    """GET the search home once for its session cookie, anti-forgery token and encrypted session value"""
+    response = session.get(home_url(config), timeout=15)
+    response.raise_for_status()
+    token = VERIFICATION_TOKEN(html.fromstring(response.text))
+    match = SESSION_VALUE.search(response.text)
+    return {'token': token, 'session_value': match.group(1) if match else ''}
+
+def search_body(config, search, page):
+    return {
+        'partnerId': config['partner_id'],
+        'siteId': config['site_id'],
+        'keyword': '',
+        'location': config.get('location', ''),
+        'keywordCustomSolrFields': config.get('keyword_fields', ''),
+        'locationCustomSolrFields': config.get('location_fields', ''),
+        'facetfilterfields': {'Facet': []},
+        'powersearchoptions': {'PowerSearchOption': []},
+        'SortType': 'LastUpdated',
+        'pageNumber': page,
+        'encryptedSessionValue': search['session_value'],
+    }
+
+def fetch_page(session, config, search, page):
+    """POST one MatchedJobs page and return the decoded JSON"""
+    headers = {'Accept': 'application/json'}
+    if search['token']:
+        headers['RFT'] = search['token']
+    response = session.post(matched_jobs_url(), json=search_body(config, search, page), timeout=15, headers=headers)
+    response.raise_for_status()
+    return response.json()
+
+def _job_list(data):
+    return (data.get('Jobs') or {}).get('Job') or []
+
+def parse_jobs(data, config, jobs):
+    for job in _job_list(data):
+        answers = {question.get('QuestionName', '').lower(): question.get('Value') or ''
+                   for question in job.get('Questions', [])}
+        jobs.add(job.get('Link') or 'N/A', answers.get(config['title_question'], '').strip() or 'N/A',
+                 answers.get(config['classification_question'], '').strip() or 'N/A',
+                 answers.get(config['location_question'], '').strip() or 'N/A', config['company'])
+
+def scrape_brassring_site(config, session=None, max_workers=4):
+    """Page one carries JobsCount; the remaining pageNumbers are posted concurrently"""
+    session = session or make_session(pool_size=max_workers)
+    jobs = JobRecordBuffer()
+
+    search = open_search(session, config)
+    first = fetch_page(session, config, search, 1)
+    total = first.get('JobsCount', 0)
+    page_size = len(_job_list(first))
+    parse_jobs(first, config, jobs)
+
+    last_page = math.ceil(total / page_size) if page_size else 1
+    logger.info(f"{config['company']}: {total} jobs over {last_page} pages")
+
+    pages = list(range(2, last_page + 1))
+    if pages:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as executor:
+            for data in executor.map(lambda page: fetch_page(session, config, search, page), pages):
+                parse_jobs(data, config, jobs)
+
+    return jobs.to_dataframe()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Scrape a Brassring TGnewUI site over its MatchedJobs endpoint')
+    parser.add_argument('site', choices=sorted(BRASSRING_SITES))
+    parser.add_argument('--fixtures', help='replay recorded responses from this directory instead of the network')
+    args = parser.parse_args()
+
+    session = FixtureSession(args.fixtures) if args.fixtures else None
+    df = scrape_brassring_site(BRASSRING_SITES[args.site], session=session)
+    print(df.to_string(index=False))
+    print(f"Total jobs: {len(df)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+import argparse
+import json
+import os
+
+# Set to 0 to load pages in full, e.g. for the unblocked half of a bytes-saved comparison
+BLOCK_ENV = 'SCRAPER_BLOCK_RESOURCES'
+# Extra tracker/ads domains, one per line, on top of TRACKER_DOMAINS
+BLOCKLIST_ENV = 'SCRAPER_BLOCKLIST'
+# Append each site's transfer report to this JSON-lines file
+TRANSFER_LOG_ENV = 'SCRAPER_TRANSFER_LOG'
+
+# We only ever read text, so none of these are needed to scrape a careers page
+BLOCKED_EXTENSIONS = [
+    'png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp',
+    'woff', 'woff2', 'ttf', 'otf', 'eot',
+    'mp4', 'webm', 'mov', 'm3u8', 'mp3', 'ogg', 'wav',
+]
+# setBlockedURLs wildcards match the whole URL, so cache-busted assets (logo.png?v=3) need their own pattern
+BLOCKED_RESOURCES = [pattern for ext in BLOCKED_EXTENSIONS for pattern in (f'*.{ext}', f'*.{ext}?*')]
+
+TRACKER_DOMAINS = [
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net', 'googlesyndication.com',
+    'adservice.google.com', 'connect.facebook.net', 'facebook.com/tr', 'snap.licdn.com',
+    'px.ads.linkedin.com', 'bat.bing.com', 'clarity.ms', 'hotjar.com', 'static.hotjar.com',
+    'script.crazyegg.com', 'js.hs-analytics.net', 'js.hs-scripts.com', 'cdn.segment.com',
+    'js-agent.newrelic.com', 'bam.nr-data.net', 'youtube.com/embed', 'player.vimeo.com',
+]
+
+# Per-site exceptions: page_load_strategy 'normal' where a script reads the page before waiting for anything
+SITE_OVERRIDES = {
+    # reads the ELMO iframe's page_source as soon as #section-list exists
+    'Milskil': {'page_load_strategy': 'normal'},
+}
+
+def blocking_enabled():
+    return os.environ.get(BLOCK_ENV, '1') != '0'
+
+def _settings(site):
+    return SITE_OVERRIDES.get(site, {})
+
+def blocked_patterns():
+    domains = list(TRACKER_DOMAINS)
+    extra = os.environ.get(BLOCKLIST_ENV)
+    if extra and os.path.exists(extra):
+        with open(extra, 'r', encoding='utf-8') as f:
+            domains += [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    return BLOCKED_RESOURCES + [f'*{domain}*' for domain in domains]
+
+def apply_profile(options, site=None):
+    """Eager page loads and performance logging (for the transfer report) on ChromeOptions"""
+    options.page_load_strategy = _settings(site).get('page_load_strategy', 'eager')
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+def block_resources(driver):
+    """Network.setBlockedURLs for images, fonts, media and trackers on this session's page"""
+    if not blocking_enabled():
+        return
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_patterns()})
+    except Exception as e:  # older drivers without CDP; scrape unblocked rather than fail
+        print(f"Could not enable resource blocking: {e}")
+
+def transfer_report(driver, site):
+    """Bytes received and requests blocked over the whole session, from Chrome's performance log"""
+    received, requests, blocked = 0, 0, 0
+    try:
+        entries = driver.get_log('performance')
+    except Exception:  # no performance log on this session
+        entries = []
+    for entry in entries:
+        message = json.loads(entry['message'])['message']
+        if message['method'] == 'Network.loadingFinished':
+            requests += 1
+            received += message['params'].get('encodedDataLength', 0)
+        elif message['method'] == 'Network.loadingFailed' and message['params'].get('blockedReason'):
+            blocked += 1
+
+    report = {'site': site, 'blocking': blocking_enabled(), 'bytes': int(received),
+              'requests': requests, 'blocked': blocked}
+    print(f"Transfer: {received / 1024:.0f} KB over {requests} requests, {blocked} blocked")
+
+    log_path = os.environ.get(TRANSFER_LOG_ENV)
+    if log_path:
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(report) + '\n')
+    return report
+
+def _load_reports(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return {report['site']: report for report in map(json.loads, f) if report.get('site')}
+
+def compare(blocked_log, unblocked_log):
+    """Per-site bytes saved between a blocked sweep and an unblocked one"""
+    blocked, unblocked = _load_reports(blocked_log), _load_reports(unblocked_log)
+    total_saved = 0
+    for site in sorted(blocked.keys() & unblocked.keys()):
+        saved = unblocked[site]['bytes'] - blocked[site]['bytes']
+        total_saved += saved
+        print(f"{site:<20}{unblocked[site]['bytes'] / 1024:>10.0f} KB -> {blocked[site]['bytes'] / 1024:>8.0f} KB"
+              f"  saved {saved / 1024:>8.0f} KB ({blocked[site]['blocked']} requests blocked)")
+    print(f"{'Total':<20}saved {total_saved / 1024 / 1024:.1f} MB")
+    return total_saved
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare transfer logs from a blocked and an unblocked sweep')
+    parser.add_argument('blocked_log')
+    parser.add_argument('unblocked_log')
+    args = parser.parse_args()
+    compare(args.blocked_log, args.unblocked_log)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import argparse
+import logging
+import math
+import re
+from concurrent.futures import ThreadPoolExecutor
+from http_utils import FixtureSession, make_session
+from job_records import JobRecordBuffer
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 25
+
+# One entry per *.csod.com career site. location/classification, when set,
+# replace whatever the requisition carries (MCC reports every job as Newcastle)
+CSOD_SITES = {
+    'MCC': {
+        'host': 'maitlandcouncil.csod.com',
+        'client': 'maitlandcouncil',
+        'career_site_id': 1,
+        'location': 'Newcastle',
+        'classification': 'Not specified',
+        'company': 'Maitland Council',
+    },
+}
+
+# The career site page embeds csod.context = {..., "token": "...", "cloud": "https://..."}
+CONTEXT_FIELD = r'"{}"\s*:\s*"([^"]+)"'
+TOKEN = re.compile(CONTEXT_FIELD.format('token'))
+CLOUD = re.compile(CONTEXT_FIELD.format('cloud'))
+
+class CsodTokenMissing(Exception):
+    pass
+
+def home_url(config):
+    return f"https://{config['host']}/ux/ats/careersite/{config['career_site_id']}/home?c={config['client']}"
+
+def job_link(config, requisition):
+    return (f"https://{config['host']}/ux/ats/careersite/{config['career_site_id']}/home/requisition/"
+            f"{requisition.get('requisitionId', '')}?c={config['client']}")
+
+def open_search(session, config):
+    """One GET of the career site for the bearer token and the regional API host it is valid for"""
+    response = session.get(home_url(config), timeout=15)
+    response.raise_for_status()
+    token, cloud = TOKEN.search(response.text), CLOUD.search(response.text)
+    if not token or not cloud:
+        raise CsodTokenMissing(f"No csod.context token on {home_url(config)}")
+    return {'token': token.group(1), 'api': f"{cloud.group(1).rstrip('/')}/rec-job-search/external/jobs"}
+
+def search_body(config, page):
+    return {
+        'careerSiteId': config['career_site_id'],
+        'careerSitePageId': config['career_site_id'],
+        'pageNumber': page,
+        'pageSize': PAGE_SIZE,
+        'cultureId': 1,
+        'cultureName': 'en-US',
+        'searchText': config.get('search_text', ''),
+        'states': [],
+        'countryCodes': config.get('country_codes', []),
+        'cities': [],
+        'placeID': '',
+        'radius': None,
+        'postingsWithinDays': None,
+        'customFieldCheckboxKeys': [],
+        'customFieldDropdowns': [],
+        'customFieldRadios': [],
+    }
+
+def fetch_page(session, config, search, page):
+    """POST one page of the job search and return its data block"""
+    headers = {'Accept': 'application/json', 'Authorization': f"Bearer {search['token']}"}
+    response = session.post(search['api'], json=search_body(config, page), timeout=15, headers=headers)
+    response.raise_for_status()
+    return response.json().get('data') or {}
+
+def _location(requisition):
+    places = requisition.get('locations') or []
+    if not places:
+        return 'N/A'
+    place = places[0]
+    return ', '.join(part for part in (place.get('city'), place.get('state')) if part) or 'N/A'
+
+def parse_requisitions(data, config, jobs):
+    for requisition in data.get('requisitions', []):
+        jobs.add(job_link(config, requisition), (requisition.get('displayJobTitle') or '').strip(),
+                 config.get('classification') or 'N/A',
+                 config.get('location') or _location(requisition), config['company'])
+
+def scrape_csod_site(config, session=None, max_workers=4):
+    """Page one carries totalCount; the remaining pages are posted concurrently with the same token"""
+    session = session or make_session(pool_size=max_workers)
+    jobs = JobRecordBuffer()
+
+    search = open_search(session, config)
+    first = fetch_page(session, config, search, 1)
+    total = first.get('totalCount', 0)
+    parse_requisitions(first, config, jobs)
+
+    last_page = math.ceil(total / PAGE_SIZE)
+    logger.info(f"{config['company']}: {total} requisitions over {max(last_page, 1)} pages")
+
+    pages = list(range(2, last_page + 1))
+    if pages:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as executor:
+            for data in executor.map(lambda page: fetch_page(session, config, search, page), pages):
+                parse_requisitions(data, config, jobs)
+
+    return jobs.to_dataframe()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Scrape a Cornerstone (csod.com) career site over its job search API')
+    parser.add_argument('site', choices=sorted(CSOD_SITES))
+    parser.add_argument('--fixtures', help='replay recorded responses from this directory instead of the network')
+    args = parser.parse_args()
+
+    session = FixtureSession(args.fixtures) if args.fixtures else None
+    df = scrape_csod_site(CSOD_SITES[args.site], session=session)
+    print(df.to_string(index=False))
+    print(f"Total jobs: {len(df)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import logging
+from waits import wait_for_count_increase, wait_for_dom_stable
+
+logger = logging.getLogger(__name__)
+
+# Runs in the page: for every container, resolve each field's selector and
+# read its text or attribute, returning plain row objects in one round-trip
+_EXTRACT_JS = """
+const [containerCss, fields] = arguments;
+const read = (el, attr) => {
+    if (!el) return null;
+    if (!attr) return (el.innerText || el.textContent || '').trim();
+    // same as Selenium's get_attribute: prefer the live property (absolute href/src)
+    const value = (attr in el && typeof el[attr] === 'string') ? el[attr] : el.getAttribute(attr);
+    return value === null ? null : value.trim();
+};
+return Array.from(document.querySelectorAll(containerCss), container => {
+    const row = {};
+    for (const field of fields) {
+        const matches = field.css ? container.querySelectorAll(field.css) : [container];
+        row[field.name] = read(matches[field.index] || null, field.attr);
+    }
+    return row;
+});
+"""
+
+def _field_spec(name, spec):
+    """'css' reads text, ('css', 'attr') reads an attribute, a dict may also pick the nth match"""
+    if isinstance(spec, str):
+        spec = {'css': spec}
+    elif isinstance(spec, (tuple, list)):
+        spec = {'css': spec[0], 'attr': spec[1]}
+    return {'name': name, 'css': spec.get('css', ''), 'attr': spec.get('attr'), 'index': spec.get('index', 0)}
+
+def extract_rows(driver, container_css, fields):
+    """Read every field of every container matching container_css with a single execute_script.
+
+    fields maps output names to specs, e.g.
+        {'title': 'h3 a', 'link': ('h3 a', 'href'), 'clearance': {'css': 'div.meta', 'index': 1}}
+    An empty css means the container itself. Fields that do not match come back as None.
+    """
+    specs = [_field_spec(name, spec) for name, spec in fields.items()]
+    rows = driver.execute_script(_EXTRACT_JS, container_css, specs)
+    return rows or []
+
+# outerHTML of every match in document order, skipping matches inside one already taken
+_OUTER_HTML_JS = """
+const kept = [];
+for (const el of document.querySelectorAll(arguments[0])) {
+    if (!kept.some(outer => outer.contains(el))) kept.push(el);
+}
+return kept.map(el => el.outerHTML).join('');
+"""
+
+# outerHTML of the matches from index start on, and how many match in total
+_NEW_NODES_JS = """
+const [itemCss, start] = arguments;
+const items = document.querySelectorAll(itemCss);
+let html = '';
+for (let i = start; i < items.length; i++) html += items[i].outerHTML;
+return [html, items.length];
+"""
+
+def capture_html(driver, container_css):
+    """outerHTML of the elements matching container_css only, instead of the whole driver.page_source.
+
+    container_css may be a selector list naming the results and whatever else the parser
+    reads, e.g. 'li.job-result-item, a[rel="next"]'. If nothing matches (the markup has
+    changed) the whole page is returned, so the parser still sees everything.
+    """
+    html = driver.execute_script(_OUTER_HTML_JS, container_css) or ''
+    if not html:
+        logger.warning(f"nothing matches {container_css}, capturing the whole page")
+        return driver.page_source
+    logger.debug(f"captured {len(html)} chars of {container_css}")
+    return html
+
+def capture_new_html(driver, item_css, start=0):
+    """outerHTML of the items matching item_css that come after the first start of them.
+
+    Returns (html, total) so the caller can pass total back as the next start; on a
+    list that only grows (load more, infinite scroll) each item crosses the wire once.
+    """
+    html, total = driver.execute_script(_NEW_NODES_JS, item_css, start)
+    logger.debug(f"captured {len(html)} chars for {total - start} new {item_css}")
+    return html, total
+
+def iter_new_items(driver, item_css, load_more, timeout=10, settle_ms=0):
+    """Yield the outerHTML of newly appended item_css nodes, one fragment per load-more round.
+
+    load_more(driver) clicks whatever fetches the next batch and returns False once there
+    is nothing left to load. The high-water mark is the number of items already yielded,
+    so every item is transferred and parsed exactly once however long the list grows.
+    """
+    captured = 0
+    while True:
+        html, total = capture_new_html(driver, item_css, captured)
+        if total > captured:
+            captured = total
+            yield html
+        if not load_more(driver):
+            return
+        if not wait_for_count_increase(driver, item_css, captured, timeout):
+            logger.info(f"load more added no {item_css} within {timeout}s, stopping at {captured}")
+            return
+        if settle_ms:
+            wait_for_dom_stable(driver, 'body', quiet_ms=settle_ms)
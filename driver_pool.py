@@ -0,0 +1,191 @@
+import os
+import queue
+import socket
+import threading
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium_stealth import stealth
+from browser_profile import apply_profile, block_resources
+from replay import record_dir, replay_server, wrap_driver
+
+# run_scrapers.py sets this for the child process that holds a lease
+DEBUGGER_ADDRESS_ENV = 'SCRAPER_DEBUGGER_ADDRESS'
+
+def apply_stealth(driver):
+    stealth(driver,
+            languages=["en-US", "en"],
+            vendor="Google Inc.",
+            platform="Win32",
+            webgl_vendor="Intel Inc.",
+            renderer="Intel Iris OpenGL Engine",
+            fix_hairline=True,
+            )
+
+def pool_chrome_options(port, headless=True):
+    """Standard stealth options used by the site scrapers, plus a DevTools port to attach to"""
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument('--log-level=3')
+    options.add_argument('--disable-background-networking')
+    options.add_argument(f'--remote-debugging-port={port}')
+    options.add_argument('--remote-allow-origins=*')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    return options
+
+def lease_pooled_driver(site=None):
+    """Attach to the warm browser leased by run_scrapers.py, or return None when running standalone.
+
+    Under run_scrapers.py --record/--replay the driver is always returned (a fresh one if
+    there is no pool), wrapped so pages are snapshotted to, or loaded from, fixtures.
+    """
+    address = os.environ.get(DEBUGGER_ADDRESS_ENV)
+    driver = _attach(address, site) if address else None
+    if record_dir() or replay_server():
+        return wrap_driver(driver or _launch(site))
+    return driver
+
+def _attach(address, site):
+    options = apply_profile(webdriver.ChromeOptions(), site)
+    options.debugger_address = address
+    try:
+        driver = webdriver.Chrome(options=options)
+    except WebDriverException as e:
+        print(f"Could not attach to pooled browser at {address}, launching a fresh one: {e}")
+        return None
+
+    apply_stealth(driver)
+    block_resources(driver)
+    print(f"Using pooled browser at {address}")
+    return driver
+
+def _launch(site):
+    options = apply_profile(webdriver.ChromeOptions(), site)
+    options.add_argument("--headless")
+    options.add_argument('--log-level=3')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    driver = webdriver.Chrome(options=options)
+    apply_stealth(driver)
+    block_resources(driver)
+    return driver
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+class PooledBrowser:
+    """One warm Chrome instance; the pool keeps its own controlling session for resets"""
+
+    def __init__(self, headless=True):
+        self.headless = headless
+        self.port = _free_port()
+        self.driver = webdriver.Chrome(options=pool_chrome_options(self.port, headless))
+        apply_stealth(self.driver)
+        self.driver.get('about:blank')
+        self.leases = 0
+
+    @property
+    def debugger_address(self):
+        return f'127.0.0.1:{self.port}'
+
+    def is_alive(self):
+        try:
+            self.driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    def reset(self):
+        """Drop everything the last lease left behind: extra tabs, frames, cookies and storage"""
+        driver = self.driver
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            try:
+                driver.switch_to.window(handle)
+                self._clear_origin_storage()
+                driver.close()
+            except WebDriverException:
+                pass
+
+        driver.switch_to.window(handles[0])
+        driver.switch_to.default_content()
+        self._clear_origin_storage()
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+        driver.delete_all_cookies()
+        driver.get('about:blank')
+
+    def _clear_origin_storage(self):
+        try:
+            origin = self.driver.execute_script("return window.location.origin")
+            if origin and origin.startswith('http'):
+                self.driver.execute_cdp_cmd('Storage.clearDataForOrigin', {
+                    'origin': origin,
+                    'storageTypes': 'all',
+                })
+        except WebDriverException:
+            pass
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+
+class DriverPool:
+    """Keeps N stealth-configured Chrome instances warm and hands them out as leases"""
+
+    def __init__(self, size, headless=True):
+        self.size = size
+        self.headless = headless
+        self._idle = queue.Queue()
+        self._browsers = []
+        self._lock = threading.Lock()
+
+    def start(self):
+        for _ in range(self.size):
+            browser = PooledBrowser(self.headless)
+            self._browsers.append(browser)
+            self._idle.put(browser)
+        print(f"Driver pool started with {self.size} browsers")
+        return self
+
+    @contextmanager
+    def lease(self, timeout=None):
+        """Yield a warm browser; it is reset (or replaced if it died) before going back in the pool"""
+        browser = self._idle.get(timeout=timeout)
+        browser.leases += 1
+        try:
+            yield browser
+        finally:
+            self._idle.put(self._recycle(browser))
+
+    def _recycle(self, browser):
+        if browser.is_alive():
+            try:
+                browser.reset()
+                return browser
+            except WebDriverException as e:
+                print(f"Resetting pooled browser failed, replacing it: {e}")
+
+        browser.quit()
+        replacement = PooledBrowser(self.headless)
+        with self._lock:
+            self._browsers = [b for b in self._browsers if b is not browser] + [replacement]
+        return replacement
+
+    def stop(self):
+        with self._lock:
+            for browser in self._browsers:
+                browser.quit()
+            self._browsers = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,110 @@
+import json
+import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode
+from urllib3.util.retry import Retry
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+def make_session(pool_size=16, retries=2):
+    """requests.Session with a connection pool large enough for the page fetch threads.
+
+    Under run_scrapers.py --record the session saves every response as a fixture, and
+    under --replay it sends every request to the local stand-in server instead.
+    """
+    from replay import RecordingSession, ReplayAdapter, record_dir, replay_server
+
+    session = RecordingSession(record_dir()) if record_dir() else requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                  allowed_methods=None)
+    if replay_server():
+        adapter = ReplayAdapter(replay_server(), pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    else:
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept-Language': 'en-AU,en;q=0.9',
+    })
+    return session
+
+class FixtureMissing(Exception):
+    pass
+
+def request_key(method, url, params=None, data=None, json_body=None):
+    """Stable key for matching a request against a recorded fixture"""
+    if params:
+        url = f"{url}{'&' if '?' in url else '?'}{urlencode(sorted(params.items()), doseq=True)}"
+    body = ''
+    if json_body is not None:
+        body = json.dumps(json_body, sort_keys=True, separators=(',', ':'))
+    elif isinstance(data, dict):
+        body = urlencode(sorted(data.items()), doseq=True)
+    elif data:
+        body = data.decode('utf-8') if isinstance(data, bytes) else str(data)
+    return f"{method.upper()} {url} {body}".rstrip()
+
+class FixtureResponse:
+    def __init__(self, url, status_code, content, headers=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = 'utf-8'
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors='replace')
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} for fixture {self.url}", response=self)
+
+class FixtureSession:
+    """Drop-in for requests.Session that answers from a recorded fixture directory.
+
+    The directory holds an index.json list of {"method", "url", "params", "json",
+    "data", "status", "file"} entries; each file is the raw response body.
+    """
+
+    def __init__(self, fixture_dir):
+        self.fixture_dir = fixture_dir
+        self.headers = {}
+        self.cookies = requests.cookies.RequestsCookieJar()
+        with open(os.path.join(fixture_dir, 'index.json'), 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+        self._responses = {}
+        for entry in entries:
+            key = request_key(entry.get('method', 'GET'), entry['url'], entry.get('params'),
+                              entry.get('data'), entry.get('json'))
+            self._responses[key] = entry
+
+    def request(self, method, url, params=None, data=None, json=None, **kwargs):
+        key = request_key(method, url, params, data, json)
+        entry = self._responses.get(key)
+        if entry is None:
+            raise FixtureMissing(f"No fixture recorded for {key}")
+        with open(os.path.join(self.fixture_dir, entry['file']), 'rb') as f:
+            content = f.read()
+        return FixtureResponse(url, entry.get('status', 200), content, entry.get('headers'))
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def close(self):
+        pass
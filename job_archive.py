@@ -0,0 +1,182 @@
+import argparse
+import json
+import os
+import re
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, timedelta
+from job_parquet import COMPRESSION, DICTIONARY_COLUMNS, _pyarrow, load_jobs, rows_to_table
+from job_records import JOB_COLUMNS
+from merge_jobs import read_rows, site_csvs
+from run_scrapers import csv_site
+
+# <root>/<Site>/<YYYY-MM-DD>/part-<time>-<id>.parquet for each sweep, compacted into
+# <root>/<Site>/<YYYY-MM>/compacted-<time>-<id>.parquet; manifest.json lists every live file
+DEFAULT_ARCHIVE = os.path.join('data', 'archive')
+MANIFEST = 'manifest.json'
+ARCHIVE_COLUMNS = ['Sweep Date', 'Site'] + JOB_COLUMNS
+COMPACT_AFTER_DAYS = 7
+
+def load_manifest(root):
+    path = os.path.join(root, MANIFEST)
+    if not os.path.exists(path):
+        return {'version': 1, 'files': []}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_manifest(root, manifest):
+    """Replace the manifest in one step; a file it does not list is not part of the archive"""
+    path = os.path.join(root, MANIFEST)
+    with open(path + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(path + '.tmp', path)
+
+def file_stamp(time_format):
+    """Time plus a random suffix: two runs in the same second must never write the same file"""
+    return f"{time.strftime(time_format)}-{uuid.uuid4().hex[:8]}"
+
+def _write(root, relative_path, table):
+    _, pq = _pyarrow()
+    path = os.path.join(root, relative_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(table, path, compression=COMPRESSION, use_dictionary=DICTIONARY_COLUMNS)
+    return os.path.getsize(path)
+
+def append_sweep(input_dir, root=DEFAULT_ARCHIVE, sweep_date=None):
+    """Add one new partition file per site CSV in input_dir; existing files are never touched"""
+    sweep_date = sweep_date or date.today().isoformat()
+    stamp = file_stamp('%H%M%S')
+    manifest = load_manifest(root)
+    added = []
+    for path in site_csvs(input_dir):
+        site = csv_site(path)
+        rows = [(sweep_date, site) + row for row in read_rows(path)]
+        if not rows:
+            continue
+        relative_path = f"{site}/{sweep_date}/part-{stamp}.parquet"
+        size = _write(root, relative_path, rows_to_table(rows, ARCHIVE_COLUMNS))
+        entry = {'path': relative_path, 'site': site, 'min_date': sweep_date, 'max_date': sweep_date,
+                 'rows': len(rows), 'bytes': size, 'compacted': False}
+        manifest['files'].append(entry)
+        added.append(entry)
+    save_manifest(root, manifest)
+    return added
+
+def compact(root=DEFAULT_ARCHIVE, older_than_days=COMPACT_AFTER_DAYS):
+    """Rewrite each site's files for a month into one, once they are older than older_than_days.
+
+    The new file is written and the manifest swapped to it before the old files are
+    deleted, so an interrupted compaction leaves orphans at worst, never lost rows.
+    """
+    pa, pq = _pyarrow()
+    cutoff = (date.today() - timedelta(days=older_than_days)).isoformat()
+    manifest = load_manifest(root)
+
+    groups = defaultdict(list)
+    for entry in manifest['files']:
+        if entry['max_date'] < cutoff and entry['min_date'][:7] == entry['max_date'][:7]:
+            groups[(entry['site'], entry['min_date'][:7])].append(entry)
+
+    compacted = []
+    for (site, month), entries in sorted(groups.items()):
+        if len(entries) < 2:
+            continue
+        table = pa.concat_tables(pq.read_table(os.path.join(root, entry['path'])) for entry in entries)
+        relative_path = f"{site}/{month}/compacted-{file_stamp('%Y%m%d%H%M%S')}.parquet"
+        size = _write(root, relative_path, table.combine_chunks())
+        merged = {'path': relative_path, 'site': site,
+                  'min_date': min(entry['min_date'] for entry in entries),
+                  'max_date': max(entry['max_date'] for entry in entries),
+                  'rows': table.num_rows, 'bytes': size, 'compacted': True}
+        old_paths = {entry['path'] for entry in entries}
+        manifest['files'] = [entry for entry in manifest['files'] if entry['path'] not in old_paths] + [merged]
+        save_manifest(root, manifest)
+        for old_path in old_paths:
+            os.remove(os.path.join(root, old_path))
+            _remove_empty_dirs(root, os.path.dirname(old_path))
+        compacted.append((merged, len(entries)))
+    return compacted
+
+def _remove_empty_dirs(root, relative_dir):
+    while relative_dir:
+        path = os.path.join(root, relative_dir)
+        if os.listdir(path):
+            return
+        os.rmdir(path)
+        relative_dir = os.path.dirname(relative_dir)
+
+def prune(manifest, sites=None, start=None, end=None):
+    """Manifest entries that can hold rows for these sites between start and end (inclusive)"""
+    wanted = {site.lower() for site in sites} if sites else None
+    return [entry for entry in manifest['files']
+            if (wanted is None or entry['site'].lower() in wanted)
+            and (start is None or entry['max_date'] >= start)
+            and (end is None or entry['min_date'] <= end)]
+
+def query(root=DEFAULT_ARCHIVE, sites=None, start=None, end=None, columns=None):
+    """Archived postings, reading only the partition files the manifest says can match"""
+    entries = prune(load_manifest(root), sites, start, end)
+    filters = []
+    if start:
+        filters.append(('Sweep Date', '>=', start))
+    if end:
+        filters.append(('Sweep Date', '<=', end))
+    if sites:
+        filters.append(('Site', 'in', [entry['site'] for entry in entries] or list(sites)))
+    df = load_jobs([os.path.join(root, entry['path']) for entry in entries], columns=columns, filters=filters or None)
+    return df, entries
+
+def quarter_range(quarter):
+    """'2026Q3' -> ('2026-07-01', '2026-09-30')"""
+    match = re.fullmatch(r'(\d{4})-?Q([1-4])', quarter.upper())
+    if not match:
+        raise argparse.ArgumentTypeError(f"expected a quarter like 2026Q3, got {quarter}")
+    year, q = int(match.group(1)), int(match.group(2))
+    first = date(year, 3 * q - 2, 1)
+    last = date(year + (q == 4), 1 if q == 4 else 3 * q + 1, 1) - timedelta(days=1)
+    return first.isoformat(), last.isoformat()
+
+def main():
+    parser = argparse.ArgumentParser(description='Append sweeps to, compact and query the partitioned job archive')
+    parser.add_argument('--root', default=DEFAULT_ARCHIVE, help='archive directory')
+    commands = parser.add_subparsers(dest='command', required=True)
+    append = commands.add_parser('append', help="archive this sweep's per-site CSVs")
+    append.add_argument('--input-dir', default='csv_files')
+    append.add_argument('--date', help='sweep date YYYY-MM-DD (default: today)')
+    squash = commands.add_parser('compact', help='merge small daily files into one file per site and month')
+    squash.add_argument('--older-than', type=int, default=COMPACT_AFTER_DAYS, help='days a partition must age first')
+    find = commands.add_parser('query', help='postings for some sites over a date range')
+    find.add_argument('sites', nargs='*')
+    find.add_argument('--start', help='first sweep date YYYY-MM-DD')
+    find.add_argument('--end', help='last sweep date YYYY-MM-DD')
+    find.add_argument('--quarter', type=quarter_range, help='e.g. 2026Q3, instead of --start/--end')
+    find.add_argument('--output', help='write the result to this CSV instead of printing it')
+    args = parser.parse_args()
+
+    if _pyarrow() is None:
+        print("pyarrow is not installed (pip install pyarrow)")
+        return 1
+
+    if args.command == 'append':
+        added = append_sweep(args.input_dir, args.root, args.date)
+        print(f"Archived {sum(entry['rows'] for entry in added)} postings from {len(added)} sites under {args.root}")
+    elif args.command == 'compact':
+        compacted = compact(args.root, args.older_than)
+        for merged, count in compacted:
+            print(f"{merged['path']}: {count} files, {merged['rows']} rows, {merged['bytes'] / 1024:.0f} KB")
+        print(f"Compacted {len(compacted)} site-months")
+    else:
+        start, end = args.quarter or (args.start, args.end)
+        total = len(load_manifest(args.root)['files'])
+        df, entries = query(args.root, args.sites, start, end)
+        print(f"Read {len(entries)} of {total} partition files: {len(df)} postings")
+        if args.output:
+            df.to_csv(args.output, index=False)
+        else:
+            print(df.to_string(index=False))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
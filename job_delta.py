@@ -0,0 +1,126 @@
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from job_records import JOB_COLUMNS, content_hash, job_key
+from merge_jobs import read_rows, site_csvs
+from run_scrapers import csv_site
+
+logger = logging.getLogger(__name__)
+
+# Where the previous sweep is kept (csv_files is wiped at the start of every run)
+DEFAULT_SNAPSHOT = os.path.join('data', 'snapshot.csv')
+DEFAULT_DELTA_DIR = os.path.join('data', 'deltas')
+SNAPSHOT_COLUMNS = ['Site', 'Key', 'Hash'] + JOB_COLUMNS
+
+def sweep_rows(paths):
+    """(site, key, hash, row) for every job in a sweep's per-site CSVs, first occurrence of a key only"""
+    seen = set()
+    for path in paths:
+        site = csv_site(path)
+        for row in read_rows(path):
+            link, title, classification, location, company = row
+            key = job_key(link, title, location, company)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield site, key, content_hash(title, classification, location, company), row
+
+def load_snapshot(path):
+    """key -> (site, hash, row) for the previous sweep; the build side of the hash join"""
+    previous = {}
+    if not os.path.exists(path):
+        return previous
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for site, key, digest, *row in reader:
+            previous[bytes.fromhex(key)] = (site, bytes.fromhex(digest), tuple(row))
+    return previous
+
+def _record(row):
+    return dict(zip(JOB_COLUMNS, row))
+
+def diff_sweep(previous, current, snapshot_writer=None):
+    """Probe previous with every current job once: unseen keys are added, a different hash is changed.
+
+    Keys left over belong to removed jobs, but only for sites the current sweep covered;
+    a site with no results this time is carried forward rather than reported as emptied.
+    Each current row is also written to snapshot_writer as it is read.
+    """
+    sites = defaultdict(lambda: {'added': [], 'removed': [], 'changed': []})
+    covered = set()
+    for site, key, digest, row in current:
+        covered.add(site)
+        if snapshot_writer:
+            snapshot_writer.writerow([site, key.hex(), digest.hex(), *row])
+        before = previous.pop(key, None)
+        if before is None:
+            sites[site]['added'].append(_record(row))
+        elif before[1] != digest:
+            fields = [column for column, old, new in zip(JOB_COLUMNS, before[2], row) if old != new]
+            sites[site]['changed'].append({'before': _record(before[2]), 'after': _record(row), 'fields': fields})
+
+    for key, (site, digest, row) in previous.items():
+        if site in covered:
+            sites[site]['removed'].append(_record(row))
+        elif snapshot_writer:
+            snapshot_writer.writerow([site, key.hex(), digest.hex(), *row])
+    return dict(sites)
+
+def summarise(sites):
+    summary = {site: {kind: len(records) for kind, records in delta.items()} for site, delta in sorted(sites.items())}
+    overall = {kind: sum(counts[kind] for counts in summary.values()) for kind in ('added', 'removed', 'changed')}
+    return summary, overall
+
+def run_delta(input_dir, snapshot_path=DEFAULT_SNAPSHOT, delta_dir=DEFAULT_DELTA_DIR):
+    """Diff the sweep in input_dir against the snapshot, write the delta JSON and roll the snapshot forward"""
+    paths = site_csvs(input_dir)
+    previous = load_snapshot(snapshot_path)
+    previous_at = (time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(os.path.getmtime(snapshot_path)))
+                   if os.path.exists(snapshot_path) else None)
+
+    for directory in (os.path.dirname(snapshot_path), delta_dir):
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+    temp_path = snapshot_path + '.tmp'
+    with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(SNAPSHOT_COLUMNS)
+        sites = diff_sweep(previous, sweep_rows(paths), writer)
+    os.replace(temp_path, snapshot_path)
+
+    summary, overall = summarise(sites)
+    sweep_at = time.strftime('%Y-%m-%d %H:%M:%S')
+    # microseconds keep two sweeps in the same second from overwriting each other's delta
+    delta_path = os.path.join(delta_dir, f"delta_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S-%f')}.json")
+    with open(delta_path, 'w', encoding='utf-8') as f:
+        json.dump({'sweep': sweep_at, 'previous': previous_at, 'overall': overall,
+                   'summary': summary, 'sites': sites}, f, indent=1)
+    return delta_path, summary, overall
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Added, removed and changed jobs since the previous sweep')
+    parser.add_argument('--input-dir', default='csv_files', help='directory holding this sweep\'s per-site CSVs')
+    parser.add_argument('--snapshot', default=DEFAULT_SNAPSHOT, help='previous sweep, replaced by this one')
+    parser.add_argument('--out-dir', default=DEFAULT_DELTA_DIR, help='directory for delta_<timestamp>.json')
+    args = parser.parse_args()
+
+    if not site_csvs(args.input_dir):
+        print(f"No CSV files in {args.input_dir}")
+        return 1
+    delta_path, summary, overall = run_delta(args.input_dir, args.snapshot, args.out_dir)
+    for site, counts in summary.items():
+        print(f"{site:<20}+{counts['added']:<6}-{counts['removed']:<6}~{counts['changed']}")
+    print(f"{'Overall':<20}+{overall['added']:<6}-{overall['removed']:<6}~{overall['changed']}")
+    print(f"Delta saved to {delta_path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+import logging
+import os
+from job_parquet import save_df_to_parquet
+from job_store import store_jobs
+from run_scrapers import site_name
+
+logger = logging.getLogger(__name__)
+
+def save_job_outputs(df, csv_path, module_file):
+    """Write a scraper's results (already saved to csv_path) through to the job store and a
+    Parquet file beside the CSV, labelled site_name(module_file).
+
+    Both are copies of the CSV, so an error in either is logged and the scrape still succeeds.
+    """
+    site = site_name(module_file)
+    try:
+        store_jobs(df, site)
+    except Exception:
+        logger.exception(f"{site}: could not update the job store")
+    try:
+        save_df_to_parquet(df, os.path.splitext(csv_path)[0] + '.parquet')
+    except Exception:
+        logger.exception(f"{site}: could not write the Parquet copy of {csv_path}")
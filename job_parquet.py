@@ -0,0 +1,143 @@
+import argparse
+import glob
+import logging
+import os
+import sys
+import time
+from job_records import JOB_COLUMNS, canonical_column
+
+logger = logging.getLogger(__name__)
+
+# Few distinct values per file: stored once per row group, loaded as pandas categoricals
+# (Site and Sweep Date only occur in the archive, see job_archive.py)
+DICTIONARY_COLUMNS = ['Job Classification', 'Location', 'Company', 'Site', 'Sweep Date']
+COMPRESSION = 'zstd'
+
+def _pyarrow():
+    """(pyarrow, pyarrow.parquet), or None when pyarrow is not installed"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        return None
+    return pa, pq
+
+def job_schema(columns=JOB_COLUMNS):
+    pa, _ = _pyarrow()
+    return pa.schema([(column, pa.dictionary(pa.int32(), pa.string()) if column in DICTIONARY_COLUMNS else pa.string())
+                      for column in columns])
+
+def rows_to_table(rows, columns=JOB_COLUMNS):
+    """Arrow table from row tuples in column order, dictionary-encoding the repetitive columns"""
+    pa, _ = _pyarrow()
+    schema = job_schema(columns)
+    arrays = []
+    for index, field in enumerate(schema):
+        values = pa.array([row[index] for row in rows], type=pa.string())
+        arrays.append(values.dictionary_encode() if pa.types.is_dictionary(field.type) else values)
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+def df_to_table(df):
+    df = df.rename(columns=canonical_column).reindex(columns=JOB_COLUMNS).fillna('').astype(str)
+    return rows_to_table(list(df.itertuples(index=False, name=None)))
+
+class ParquetJobWriter:
+    """Appends row batches to a Parquet file as they arrive; a no-op without pyarrow"""
+
+    def __init__(self, path, columns=JOB_COLUMNS):
+        self.path = path
+        self.columns = columns
+        self._writer = None
+        modules = _pyarrow()
+        if modules is None:
+            logger.warning(f"pyarrow is not installed, skipping {path}")
+            return
+        self._writer = modules[1].ParquetWriter(path, job_schema(columns), compression=COMPRESSION,
+                                                use_dictionary=DICTIONARY_COLUMNS)
+
+    def write(self, rows):
+        if self._writer is None or not rows:
+            return
+        self._writer.write_table(rows_to_table(rows, self.columns))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+def save_df_to_parquet(df, file_path):
+    """Parquet copy of a scraper's DataFrame next to its CSV; skipped (not failed) without pyarrow"""
+    modules = _pyarrow()
+    if modules is None:
+        return None
+    directory = os.path.dirname(file_path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    modules[1].write_table(df_to_table(df), file_path, compression=COMPRESSION, use_dictionary=DICTIONARY_COLUMNS)
+    return file_path
+
+def parquet_files(paths):
+    """Expand directories to the *.parquet files inside them"""
+    if isinstance(paths, str):
+        paths = [paths]
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found.extend(sorted(glob.glob(os.path.join(path, '**', '*.parquet'), recursive=True)))
+        else:
+            found.append(path)
+    return found
+
+def load_jobs(paths, columns=None, filters=None):
+    """One DataFrame from any number of job Parquet files, dictionary columns as categoricals.
+
+    columns and filters (pyarrow syntax, e.g. [('Company', '=', 'CAE')]) are pushed down
+    to the reader, so unneeded columns and row groups are never decoded.
+    """
+    modules = _pyarrow()
+    if modules is None:
+        raise ImportError("load_jobs needs pyarrow (pip install pyarrow)")
+    pq = modules[1]
+    files = parquet_files(paths)
+    if not files:
+        import pandas as pd
+        return pd.DataFrame(columns=columns or JOB_COLUMNS)
+    read_dictionary = [column for column in DICTIONARY_COLUMNS if columns is None or column in columns]
+    table = pq.ParquetDataset(files, filters=filters, read_dictionary=read_dictionary).read(columns=columns)
+    return table.to_pandas()
+
+def convert_csvs(paths):
+    """Write a .parquet next to each CSV, e.g. to back-fill an existing archive"""
+    import pandas as pd
+    for path in paths:
+        target = os.path.splitext(path)[0] + '.parquet'
+        save_df_to_parquet(pd.read_csv(path, dtype=str, keep_default_na=False), target)
+        print(f"{path} -> {target}")
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Convert job CSVs to Parquet or time loading Parquet job files')
+    commands = parser.add_subparsers(dest='command', required=True)
+    convert = commands.add_parser('convert', help='write a .parquet next to each CSV')
+    convert.add_argument('paths', nargs='+')
+    load = commands.add_parser('load', help='load Parquet files or directories and report size and time')
+    load.add_argument('paths', nargs='+')
+    args = parser.parse_args()
+
+    if _pyarrow() is None:
+        print("pyarrow is not installed (pip install pyarrow)")
+        return 1
+    if args.command == 'convert':
+        convert_csvs(args.paths)
+        return 0
+
+    start = time.perf_counter()
+    df = load_jobs(args.paths)
+    elapsed = time.perf_counter() - start
+    print(df.head().to_string(index=False))
+    print(f"Loaded {len(df)} jobs from {len(parquet_files(args.paths))} files in {elapsed:.3f}s "
+          f"({df.memory_usage(deep=True).sum() / 1024 / 1024:.1f} MB in memory)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
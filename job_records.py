@@ -0,0 +1,115 @@
+import csv
+import hashlib
+import os
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import pandas as pd
+
+JOB_COLUMNS = ['Link', 'Job Title', 'Job Classification', 'Location', 'Company']
+
+# Headers some sources write for a JOB_COLUMNS column (jobtools sites say Job Category)
+COLUMN_ALIASES = {
+    'Job Category': 'Job Classification',
+    'Classification': 'Job Classification',
+    'Title': 'Job Title',
+    'URL': 'Link',
+    'Job Link': 'Link',
+}
+
+# Query parameters that change per visit or per referrer but not per job, matched by
+# exact name so e.g. referenceId, refNo and sourceId are kept; plus any utm_* parameter
+TRACKING_PARAMS = frozenset(('source', 'src', 'ref', 'gclid', 'fbclid', 'mc_cid', 'mc_eid'))
+TRACKING_PREFIX = 'utm_'
+
+def canonical_column(name):
+    name = name.strip()
+    return COLUMN_ALIASES.get(name, name)
+
+def canonical_link(link):
+    """Link with the host lowercased, fragment, trailing slash and tracking parameters removed"""
+    link = (link or '').strip()
+    if not link.startswith(('http://', 'https://')):
+        return link
+    parts = urlsplit(link)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIX)]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/') or '/',
+                       urlencode(sorted(query)), ''))
+
+def job_key(link, job_title='', location='', company=''):
+    """Stable 16-byte identity of a posting: its canonical link, or title/location/company without one"""
+    link = canonical_link(link)
+    if link.startswith('http'):
+        identity = link
+    else:
+        identity = '\x1f'.join(part.strip().lower() for part in (job_title, location, company))
+    return hashlib.blake2b(identity.encode('utf-8'), digest_size=16).digest()
+
+def content_hash(job_title, job_classification, location, company):
+    """8-byte digest of the fields that can change while the link (the job_key) stays the same"""
+    content = '\x1f'.join(part.strip() for part in (job_title, job_classification, location, company))
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=8).digest()
+
+class JobRecord:
+    """One scraped posting; __slots__ keeps per-row overhead to five pointers"""
+    __slots__ = ('link', 'job_title', 'job_classification', 'location', 'company')
+
+    def __init__(self, link, job_title, job_classification, location, company):
+        self.link = link
+        self.job_title = job_title
+        self.job_classification = job_classification
+        self.location = location
+        self.company = company
+
+    def as_tuple(self):
+        return (self.link, self.job_title, self.job_classification, self.location, self.company)
+
+class JobRecordBuffer:
+    """Collects rows as tuples and builds the DataFrame (or CSV) once at the end.
+
+    Replaces the per-job pd.DataFrame + pd.concat pattern, which copies the
+    whole frame on every row and is quadratic in the number of jobs.
+    """
+
+    def __init__(self, columns=None):
+        self.columns = list(columns or JOB_COLUMNS)
+        self._rows = []
+
+    def add(self, *values):
+        """Append one row, values in column order"""
+        if len(values) != len(self.columns):
+            raise ValueError(f"Expected {len(self.columns)} values, got {len(values)}")
+        self._rows.append(values)
+
+    def add_record(self, record):
+        self._rows.append(record.as_tuple())
+
+    def extend(self, rows):
+        """Append rows given as tuples (column order) or dicts keyed by column name"""
+        for row in rows:
+            if isinstance(row, dict):
+                self._rows.append(tuple(row.get(col, '') for col in self.columns))
+            elif isinstance(row, JobRecord):
+                self._rows.append(row.as_tuple())
+            else:
+                self.add(*row)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def to_dataframe(self):
+        return pd.DataFrame.from_records(self._rows, columns=self.columns)
+
+    def write_csv(self, file_path):
+        """Stream rows straight to CSV without building a DataFrame"""
+        directory = os.path.dirname(file_path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.columns)
+            writer.writerows(self._rows)
+        return file_path
@@ -0,0 +1,183 @@
+import argparse
+import csv
+import logging
+import os
+import sqlite3
+import sys
+import time
+from job_records import JOB_COLUMNS, canonical_column, job_key
+
+logger = logging.getLogger(__name__)
+
+# Path of the store; relative to the scraper's working directory like csv_files
+JOB_DB_ENV = 'SCRAPER_JOB_DB'
+DEFAULT_DB = os.path.join('data', 'jobs.db')
+BATCH_ROWS = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id BLOB PRIMARY KEY,
+    site TEXT NOT NULL,
+    link TEXT,
+    job_title TEXT,
+    job_classification TEXT,
+    location TEXT,
+    company TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    removed_at TEXT,
+    last_sweep INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS jobs_site ON jobs (site, last_seen);
+CREATE INDEX IF NOT EXISTS jobs_company ON jobs (company);
+CREATE INDEX IF NOT EXISTS jobs_location ON jobs (location);
+CREATE INDEX IF NOT EXISTS jobs_first_seen ON jobs (first_seen);
+CREATE INDEX IF NOT EXISTS jobs_removed_at ON jobs (removed_at);
+"""
+# Stores created before last_sweep existed get the column on first connect
+SWEEP_INDEX = 'CREATE INDEX IF NOT EXISTS jobs_site_sweep ON jobs (site, last_sweep)'
+
+UPSERT = """
+INSERT INTO jobs (job_id, site, link, job_title, job_classification, location, company, first_seen, last_seen, last_sweep)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (job_id) DO UPDATE SET
+    site = excluded.site,
+    link = excluded.link,
+    job_title = excluded.job_title,
+    job_classification = excluded.job_classification,
+    location = excluded.location,
+    company = excluded.company,
+    last_seen = excluded.last_seen,
+    last_sweep = excluded.last_sweep,
+    removed_at = NULL
+"""
+
+def db_path():
+    """The store to write through to, or None under --replay unless a path is given explicitly"""
+    path = os.environ.get(JOB_DB_ENV)
+    if path is not None:
+        return path or None
+    from replay import replay_server
+    return None if replay_server() else DEFAULT_DB
+
+def connect(path=None):
+    path = path or DEFAULT_DB
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    # scrapers run in parallel processes; WAL lets them read while one writes
+    conn = sqlite3.connect(path, timeout=60)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.executescript(SCHEMA)
+    if 'last_sweep' not in {row[1] for row in conn.execute('PRAGMA table_info(jobs)')}:
+        conn.execute('ALTER TABLE jobs ADD COLUMN last_sweep INTEGER NOT NULL DEFAULT 0')
+    conn.execute(SWEEP_INDEX)
+    return conn
+
+def now():
+    return time.strftime('%Y-%m-%d %H:%M:%S')
+
+def canonical_rows(df):
+    """(link, title, classification, location, company) tuples from a scraper DataFrame"""
+    df = df.rename(columns=canonical_column).reindex(columns=JOB_COLUMNS)
+    for row in df.fillna('').astype(str).itertuples(index=False, name=None):
+        yield tuple(value.strip() for value in row)
+
+def next_sweep(conn, site):
+    """Per-site sweep number; removals compare these, since two sweeps can share a seen_at second"""
+    return conn.execute('SELECT COALESCE(MAX(last_sweep), 0) + 1 FROM jobs WHERE site = ?', (site,)).fetchone()[0]
+
+def upsert_jobs(conn, site, rows, seen_at=None):
+    """Upsert rows in BATCH_ROWS transactions, then mark the site's jobs not seen this sweep as removed"""
+    seen_at = seen_at or now()
+    sweep = next_sweep(conn, site)
+    batch, total = [], 0
+    for link, title, classification, location, company in rows:
+        batch.append((job_key(link, title, location, company), site, link, title, classification,
+                      location, company, seen_at, seen_at, sweep))
+        if len(batch) >= BATCH_ROWS:
+            with conn:
+                conn.executemany(UPSERT, batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        with conn:
+            conn.executemany(UPSERT, batch)
+        total += len(batch)
+
+    removed = 0
+    if total:
+        # an empty result is far more likely a broken scraper than a site with no jobs
+        with conn:
+            removed = conn.execute("UPDATE jobs SET removed_at = ? WHERE site = ? AND last_sweep < ? AND removed_at IS NULL",
+                                   (seen_at, site, sweep)).rowcount
+    return total, removed
+
+def store_jobs(df, site):
+    """Write one scraper's results through to the job store; never fails the scrape"""
+    path = db_path()
+    if path is None:
+        return None
+    try:
+        conn = connect(path)
+        try:
+            total, removed = upsert_jobs(conn, site, canonical_rows(df))
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"Could not update job store {path}: {e}")
+        return None
+    print(f"Job store {path}: {total} {site} jobs upserted, {removed} marked removed")
+    return total, removed
+
+def query(conn, since=None, removed=False, company=None, location=None):
+    """Jobs first seen (or removed) on or after since, optionally for one company/location"""
+    column = 'removed_at' if removed else 'first_seen'
+    clauses, params = [f'{column} >= ?'], [since or time.strftime('%Y-%m-%d')]
+    if not removed:
+        clauses.append('removed_at IS NULL')
+    if company:
+        clauses.append('company = ?')
+        params.append(company)
+    if location:
+        clauses.append('location = ?')
+        params.append(location)
+    sql = (f"SELECT link, job_title, job_classification, location, company, first_seen, last_seen, removed_at "
+           f"FROM jobs WHERE {' AND '.join(clauses)} ORDER BY {column}, company")
+    return conn.execute(sql, params)
+
+def import_csvs(conn, paths):
+    """Load existing per-site CSVs, e.g. to seed the store from an old sweep"""
+    from merge_jobs import read_rows
+    from run_scrapers import csv_site
+    for path in paths:
+        site = csv_site(path)
+        total, removed = upsert_jobs(conn, site, read_rows(path))
+        print(f"{path}: {total} jobs, {removed} marked removed")
+
+def main():
+    parser = argparse.ArgumentParser(description='Query or load the SQLite job store')
+    parser.add_argument('--db', default=os.environ.get(JOB_DB_ENV) or DEFAULT_DB)
+    commands = parser.add_subparsers(dest='command', required=True)
+    for name, help_text in (('new', 'jobs first seen since a date'), ('removed', 'jobs removed since a date')):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument('--since', help='YYYY-MM-DD[ HH:MM:SS] (default: today)')
+        command.add_argument('--company')
+        command.add_argument('--location')
+    load = commands.add_parser('import', help='upsert per-site CSV files')
+    load.add_argument('paths', nargs='+')
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    if args.command == 'import':
+        import_csvs(conn, args.paths)
+        return 0
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(JOB_COLUMNS + ['First Seen', 'Last Seen', 'Removed At'])
+    writer.writerows(query(conn, args.since, args.command == 'removed', args.company, args.location))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import argparse
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from lxml import etree, html
+from http_utils import FixtureSession, make_session
+from job_records import JobRecordBuffer
+
+logger = logging.getLogger(__name__)
+
+BASE_URL = 'https://clientapps.jobadder.com'
+
+# Boards differ only in which <li> of a card holds classification and location
+JOBADDER_SITES = {
+    'Kongsberg': {
+        'board': '40037/kongsberg-defence-australia',
+        'classification_index': 1,
+        'location_index': 2,
+        'missing': '',
+        'company': 'Kongsberg',
+    },
+    'COAL': {
+        'board': '12102/goal-group',
+        'classification_index': 0,
+        'location_index': 2,
+        'missing': 'Not Specified',
+        'company': 'Coal Group',
+    },
+}
+
+CARDS = etree.XPath("//div[contains(concat(' ', normalize-space(@class), ' '), ' pricing-item ')"
+                    " and contains(concat(' ', normalize-space(@class), ' '), ' price_item2 ')]")
+TITLE_LINK = etree.XPath(".//a[contains(concat(' ', normalize-space(@class), ' '), ' viewjob ')]")
+LIST_ITEMS = etree.XPath(".//ul//li")
+PAGER_LINKS = etree.XPath("//a[contains(@href, 'page=')]/@href")
+PAGE_NUMBER = re.compile(r'[?&]page=(\d+)')
+
+def board_url(config):
+    return f"{BASE_URL}/{config['board']}"
+
+def fetch_page(session, config, page):
+    params = {'page': page} if page > 1 else None
+    response = session.get(board_url(config), params=params, timeout=15)
+    response.raise_for_status()
+    return html.fromstring(response.text)
+
+def last_page_linked(tree):
+    """Highest page number the pager links to (the pager may only show a window)"""
+    numbers = [int(m.group(1)) for href in PAGER_LINKS(tree) for m in [PAGE_NUMBER.search(href)] if m]
+    return max(numbers, default=1)
+
+def parse_cards(tree, config, jobs):
+    missing = config.get('missing', '')
+    for card in CARDS(tree):
+        links = TITLE_LINK(card)
+        if not links:
+            continue
+
+        items = [li.text_content().strip() for li in LIST_ITEMS(card)]
+        classification_index = config['classification_index']
+        location_index = config['location_index']
+        job_classification = items[classification_index] if len(items) > classification_index else missing
+        location = items[location_index] if len(items) > location_index else missing
+
+        href = links[0].get('href')
+        jobs.add(urljoin(BASE_URL, href) if href else '', links[0].text_content().strip(),
+                 job_classification, location, config['company'])
+
+def scrape_jobadder_site(config, session=None, max_workers=4):
+    """Parse page one, then fetch every page the pager reveals concurrently, widening as it goes"""
+    session = session or make_session(pool_size=max_workers)
+    jobs = JobRecordBuffer()
+
+    first = fetch_page(session, config, 1)
+    parse_cards(first, config, jobs)
+    fetched = 1
+    last = last_page_linked(first)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while last > fetched:
+            pages = list(range(fetched + 1, last + 1))
+            trees = list(executor.map(lambda page: fetch_page(session, config, page), pages))
+            for tree in trees:
+                parse_cards(tree, config, jobs)
+            fetched = last
+            last = max(last, last_page_linked(trees[-1]))
+
+    logger.info(f"{config['company']}: {len(jobs)} jobs over {fetched} pages")
+    return jobs.to_dataframe()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Scrape a JobAdder client-apps board over plain HTTP')
+    parser.add_argument('site', choices=sorted(JOBADDER_SITES))
+    parser.add_argument('--fixtures', help='replay recorded responses from this directory instead of the network')
+    args = parser.parse_args()
+
+    session = FixtureSession(args.fixtures) if args.fixtures else None
+    df = scrape_jobadder_site(JOBADDER_SITES[args.site], session=session)
+    print(df.to_string(index=False))
+    print(f"Total jobs: {len(df)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from lxml import etree, html
+from http_utils import FixtureSession, make_session
+from job_records import JOB_COLUMNS, JobRecordBuffer
+
+logger = logging.getLogger(__name__)
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Compiled once; each board's markup follows one of these two templates
+LAYOUTS = {
+    # <ul class="jobs-list"><li class="job-item"> cards, as on the AIRBUS board
+    'list': {
+        'rows': etree.XPath(f"//ul[{_has_class('jobs-list')}]/li[{_has_class('job-item')}]"),
+        'link': etree.XPath(f".//h3[{_has_class('load-place')}]/a"),
+        'classification': etree.XPath(f"(.//*[{_has_class('row')}])[last()]/p[1]//*[{_has_class('load-place')}]"),
+        'location': etree.XPath(f".//p[{_has_class('loc-mark')}]/span[last()]"),
+    },
+    # four-column results table, as on the BAE board
+    'table': {
+        'rows': etree.XPath("//tbody/tr[count(td)=4]"),
+        'link': etree.XPath("td[1]//a"),
+        'classification': etree.XPath("td[2]"),
+        'location': etree.XPath("td[4]"),
+    },
+}
+
+JOBTOOLS_SITES = {
+    'AIRBUS': {
+        'base_url': 'https://careers.airbusgroupap.com.au',
+        'organ_id': 17272,
+        'layout': 'list',
+        'columns': ['Link', 'Job Title', 'Job Category', 'Location', 'Company'],
+        'company': 'AIRBUS',
+    },
+    'BAE': {
+        'base_url': 'https://careers.au.baesystems.com',
+        'organ_id': 16804,
+        'layout': 'table',
+        'company': 'BAE',
+    },
+}
+
+PAGE_PARAM = 'in_pagenum'  # what the #load-more button requests for each extra page
+BATCH_SIZE = 4
+MAX_PAGES = 100
+
+def search_url(config):
+    return f"{config['base_url']}/jobtools/jncustomsearch.searchResults"
+
+def fetch_page(session, config, page):
+    params = {'in_organid': config['organ_id'], 'in_jobDate': 'All', PAGE_PARAM: page}
+    response = session.get(search_url(config), params=params, timeout=15)
+    response.raise_for_status()
+    return response.text
+
+def _text(nodes):
+    return nodes[0].text_content().strip() if nodes else ''
+
+def parse_page(fragment, config):
+    """One lxml parse per page; returns rows in the board's column order"""
+    if not fragment.strip():
+        return []
+    layout = LAYOUTS[config['layout']]
+    tree = html.fromstring(fragment)
+    rows = []
+    for item in layout['rows'](tree):
+        links = layout['link'](item)
+        if not links or not links[0].get('href'):
+            continue
+        link = urljoin(search_url(config), links[0].get('href'))
+        rows.append((link, links[0].text_content().strip(), _text(layout['classification'](item)),
+                     _text(layout['location'](item)), config['company']))
+    return rows
+
+def scrape_jobtools_site(config, session=None, max_workers=BATCH_SIZE):
+    """Fetch pages in parallel batches until a batch brings back nothing new"""
+    session = session or make_session(pool_size=max_workers)
+    jobs = JobRecordBuffer(columns=config.get('columns', JOB_COLUMNS))
+    seen = set()
+
+    page = 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while page <= MAX_PAGES:
+            batch = list(range(page, min(page + max_workers, MAX_PAGES + 1)))
+            new_rows = 0
+            for fragment in executor.map(lambda p: fetch_page(session, config, p), batch):
+                for row in parse_page(fragment, config):
+                    if row[0] in seen:
+                        continue
+                    seen.add(row[0])
+                    jobs.add(*row)
+                    new_rows += 1
+            logger.info(f"{config['company']}: pages {batch[0]}-{batch[-1]} added {new_rows} jobs")
+            if not new_rows:
+                break
+            page += len(batch)
+
+    return jobs.to_dataframe()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Scrape a JobTools board over plain HTTP')
+    parser.add_argument('site', choices=sorted(JOBTOOLS_SITES))
+    parser.add_argument('--fixtures', help='replay recorded responses from this directory instead of the network')
+    args = parser.parse_args()
+
+    session = FixtureSession(args.fixtures) if args.fixtures else None
+    df = scrape_jobtools_site(JOBTOOLS_SITES[args.site], session=session)
+    print(df.to_string(index=False))
+    print(f"Total jobs: {len(df)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import argparse
+import csv
+import glob
+import logging
+import os
+import sys
+import time
+from job_parquet import ParquetJobWriter
+from job_records import JOB_COLUMNS, canonical_column, job_key
+
+logger = logging.getLogger(__name__)
+
+MERGE_PREFIX = 'merge_JOB_'
+BATCH_ROWS = 5000
+
+def site_csvs(input_dir):
+    """Per-site CSVs in input_dir, leaving out earlier merge outputs"""
+    paths = glob.glob(os.path.join(input_dir, '*.csv'))
+    return sorted(p for p in paths if not os.path.basename(p).startswith(MERGE_PREFIX))
+
+def read_rows(path, columns=JOB_COLUMNS):
+    """Stream one CSV as tuples in the canonical column order, whatever its header says"""
+    with open(path, 'r', newline='', encoding='utf-8-sig', errors='replace') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if not header:
+            return
+        positions = {}
+        for index, name in enumerate(header):
+            positions.setdefault(canonical_column(name), index)
+        unknown = [name for name in header if canonical_column(name) not in columns]
+        if unknown:
+            logger.info(f"{os.path.basename(path)}: ignoring columns {unknown}")
+        if 'Link' not in positions and 'Job Title' not in positions:
+            logger.warning(f"{os.path.basename(path)}: no Link or Job Title column, skipped")
+            return
+
+        picks = [positions.get(column) for column in columns]
+        for record in reader:
+            if not record:
+                continue
+            yield tuple(record[i].strip() if i is not None and i < len(record) else '' for i in picks)
+
+def merge(paths, csv_path, parquet_path=None, columns=JOB_COLUMNS):
+    """Write every unique job from paths to csv_path (and parquet_path) in one streaming pass.
+
+    Only a 16-byte key per unique job is held in memory; rows are written in batches
+    of BATCH_ROWS as they are read, so input size never turns into resident memory.
+    """
+    link, title, location, company = (columns.index(c) for c in ('Link', 'Job Title', 'Location', 'Company'))
+    seen = set()
+    stats = {'files': 0, 'read': 0, 'written': 0}
+    columnar = ParquetJobWriter(parquet_path, columns) if parquet_path else None
+
+    with open(csv_path, 'w', newline='', encoding='utf-8') as out:
+        writer = csv.writer(out)
+        writer.writerow(columns)
+        batch = []
+        for path in paths:
+            stats['files'] += 1
+            for row in read_rows(path, columns):
+                stats['read'] += 1
+                key = job_key(row[link], row[title], row[location], row[company])
+                if key in seen:
+                    continue
+                seen.add(key)
+                batch.append(row)
+                if len(batch) >= BATCH_ROWS:
+                    writer.writerows(batch)
+                    if columnar:
+                        columnar.write(batch)
+                    stats['written'] += len(batch)
+                    batch = []
+        writer.writerows(batch)
+        if columnar:
+            columnar.write(batch)
+            columnar.close()
+        stats['written'] += len(batch)
+
+    logger.info(f"Merged {stats['read']} rows from {stats['files']} files into {stats['written']} unique jobs")
+    return stats
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Merge per-site job CSVs into one deduplicated CSV and Parquet file')
+    parser.add_argument('--input-dir', default='csv_files', help='directory holding the per-site CSVs')
+    parser.add_argument('--output', help=f"merged CSV path (default: <input-dir>/{MERGE_PREFIX}<timestamp>.csv)")
+    parser.add_argument('--no-parquet', action='store_true', help='write the CSV only')
+    args = parser.parse_args()
+
+    paths = site_csvs(args.input_dir)
+    if not paths:
+        print(f"No CSV files in {args.input_dir}")
+        return 1
+    csv_path = args.output or os.path.join(args.input_dir, f"{MERGE_PREFIX}{time.strftime('%Y-%m-%d_%H-%M-%S')}.csv")
+    parquet_path = None if args.no_parquet else os.path.splitext(csv_path)[0] + '.parquet'
+
+    stats = merge(paths, csv_path, parquet_path)
+    print(f"All CSV files have been merged into {csv_path}"
+          f"{f' and {parquet_path}' if parquet_path and os.path.exists(parquet_path) else ''}"
+          f" ({stats['written']} unique jobs from {stats['read']} rows)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from http_utils import FixtureSession, make_session
+from job_records import JobRecordBuffer
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 25  # what the Candidate Experience UI itself requests
+
+# One entry per Oracle Recruiting Cloud Candidate Experience site; facets are
+# the finder arguments the site's own search URL carries (locationId etc.)
+ORACLE_SITES = {
+    'NOVA': {
+        'host': 'epdj.fa.ap1.oraclecloud.com',
+        'site_number': 'CX',
+        'facets': {'locationId': '300000000392483', 'locationLevel': 'country'},
+        'company': 'NOVA',
+    },
+}
+
+def requisitions_url(config):
+    return f"https://{config['host']}/hcmRestApi/resources/latest/recruitingCEJobRequisitions"
+
+def finder(config, offset):
+    """findReqs finder string, e.g. findReqs;siteNumber=CX,limit=25,offset=0,locationId=..."""
+    args = {'siteNumber': config['site_number'], **config.get('facets', {}),
+            'limit': PAGE_SIZE, 'offset': offset, 'sortBy': 'POSTING_DATES_DESC'}
+    return 'findReqs;' + ','.join(f"{key}={value}" for key, value in args.items())
+
+def fetch_page(session, config, offset):
+    """GET one page of requisitions and return the search result block"""
+    params = {'onlyData': 'true', 'expand': 'requisitionList.secondaryLocations', 'finder': finder(config, offset)}
+    response = session.get(requisitions_url(config), params=params, timeout=15,
+                           headers={'Accept': 'application/json'})
+    response.raise_for_status()
+    items = response.json().get('items') or [{}]
+    return items[0]
+
+def job_link(config, requisition):
+    return (f"https://{config['host']}/hcmUI/CandidateExperience/en/sites/{config['site_number']}"
+            f"/job/{requisition.get('Id', '')}")
+
+def parse_requisitions(search, config, jobs):
+    for requisition in search.get('requisitionList', []):
+        jobs.add(job_link(config, requisition), (requisition.get('Title') or '').strip(),
+                 requisition.get('JobFamily') or requisition.get('JobFunction') or 'N/A',
+                 requisition.get('PrimaryLocation') or 'N/A', config['company'])
+
+def scrape_oracle_site(config, session=None, max_workers=4):
+    """Page one carries TotalJobsCount; the remaining offsets are fetched concurrently"""
+    session = session or make_session(pool_size=max_workers)
+    jobs = JobRecordBuffer()
+
+    first = fetch_page(session, config, 0)
+    total = first.get('TotalJobsCount', 0)
+    parse_requisitions(first, config, jobs)
+    logger.info(f"{config['company']}: {total} requisitions")
+
+    offsets = list(range(PAGE_SIZE, total, PAGE_SIZE))
+    if offsets:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+            for search in executor.map(lambda offset: fetch_page(session, config, offset), offsets):
+                parse_requisitions(search, config, jobs)
+
+    return jobs.to_dataframe()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Scrape an Oracle Recruiting Cloud site over its REST API')
+    parser.add_argument('site', choices=sorted(ORACLE_SITES))
+    parser.add_argument('--fixtures', help='replay recorded responses from this directory instead of the network')
+    args = parser.parse_args()
+
+    session = FixtureSession(args.fixtures) if args.fixtures else None
+    df = scrape_oracle_site(ORACLE_SITES[args.site], session=session)
+    print(df.to_string(index=False))
+    print(f"Total jobs: {len(df)}")
+
+if __name__ == "__main__":
+    main()
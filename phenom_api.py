@@ -0,0 +1,121 @@
+import argparse
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from http_utils import FixtureSession, make_session
+from job_records import JobRecordBuffer
+
+logger = logging.getLogger(__name__)
+
+# One entry per Phenom People careers site; params are the search page's own query string
+PHENOM_SITES = {
+    'Raytheon': {
+        'base_url': 'https://careers.rtx.com',
+        'site_path': '/global/en',
+        'search_page': 'rtx-australia-job-search',
+        'params': {},
+        'country': 'Australia',
+        'company': 'Raytheon',
+    },
+    'Collins': {
+        'base_url': 'https://careers.rtx.com',
+        'site_path': '/global/en',
+        'search_page': 'collins-aerospace-search-results-general',
+        'params': {'qcountry': 'Australia'},
+        'country': 'Australia',
+        'company': 'Collins Aero',
+    },
+    'Thales': {
+        'base_url': 'https://careers.thalesgroup.com',
+        'site_path': '/global/en',
+        'search_page': 'search-results',
+        'params': {'keywords': 'Australia'},
+        'country': None,  # keyword search, keep whatever the site returns
+        'company': 'Thales',
+    },
+    'KBR': {
+        'base_url': 'https://careers.kbr.com',
+        'site_path': '/us/en',
+        'search_page': 'search-results',
+        'params': {'qcountry': 'Australia'},
+        'country': 'Australia',
+        'company': 'KBR',
+    },
+}
+
+DDO_MARKER = re.compile(r'phApp\.ddo\s*=\s*')
+
+def search_url(config):
+    return f"{config['base_url']}{config['site_path']}/{config['search_page']}"
+
+def extract_ddo(html):
+    """Decode the phApp.ddo object the search page embeds for its first render"""
+    match = DDO_MARKER.search(html)
+    if not match:
+        return {}
+    try:
+        ddo, _ = json.JSONDecoder().raw_decode(html, match.end())
+        return ddo
+    except ValueError as e:
+        logger.error(f"Could not decode phApp.ddo: {e}")
+        return {}
+
+def fetch_page(session, config, offset):
+    """GET one search-results page and return its eagerLoadRefineSearch block"""
+    params = dict(config.get('params', {}))
+    if offset:
+        params.update({'from': offset, 's': 1})
+    response = session.get(search_url(config), params=params, timeout=15)
+    response.raise_for_status()
+    return extract_ddo(response.text).get('eagerLoadRefineSearch', {})
+
+def job_link(config, job):
+    slug = re.sub(r'[^A-Za-z0-9]+', '-', job.get('title', '')).strip('-')
+    job_key = job.get('jobSeqNo') or job.get('jobId')
+    return f"{config['base_url']}{config['site_path']}/job/{job_key}/{slug}"
+
+def parse_jobs(search, config, jobs):
+    """Append one row per job in a refine-search block, applying the country filter"""
+    country = config.get('country')
+    for job in search.get('data', {}).get('jobs', []):
+        if country and job.get('country') and job['country'] != country:
+            continue
+
+        location = job.get('location') or job.get('cityStateCountry') or 'N/A'
+        jobs.add(job_link(config, job), job.get('title', '').strip(),
+                 job.get('category') or 'N/A', location, config['company'])
+
+def scrape_phenom_site(config, session=None, max_workers=4):
+    """Read page one for totalHits/hits, then fetch every other page concurrently"""
+    session = session or make_session(pool_size=max_workers)
+    jobs = JobRecordBuffer()
+
+    first = fetch_page(session, config, 0)
+    total = first.get('totalHits', 0)
+    page_size = first.get('hits') or len(first.get('data', {}).get('jobs', [])) or 10
+    parse_jobs(first, config, jobs)
+    logger.info(f"{config['company']}: {total} postings, {page_size} per page")
+
+    offsets = list(range(page_size, total, page_size))
+    if offsets:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+            for page in executor.map(lambda offset: fetch_page(session, config, offset), offsets):
+                parse_jobs(page, config, jobs)
+
+    return jobs.to_dataframe()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Scrape a Phenom People careers site over plain HTTP')
+    parser.add_argument('site', choices=sorted(PHENOM_SITES))
+    parser.add_argument('--fixtures', help='replay recorded responses from this directory instead of the network')
+    args = parser.parse_args()
+
+    session = FixtureSession(args.fixtures) if args.fixtures else None
+    df = scrape_phenom_site(PHENOM_SITES[args.site], session=session)
+    print(df.to_string(index=False))
+    print(f"Total jobs: {len(df)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,456 @@
+import argparse
+import json
+import mimetypes
+import os
+import re
+import sys
+import threading
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, quote, urldefrag, urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from http_utils import request_key
+
+# run_scrapers.py sets one of these for each child: where to record, or which stand-in to replay from
+RECORD_ENV = 'SCRAPER_RECORD_DIR'
+REPLAY_ENV = 'SCRAPER_REPLAY_SERVER'
+ORIGINAL_URL_HEADER = 'X-Replay-Url'
+
+SCRIPT_TAG = re.compile(r'<script\b[^>]*>.*?</script\s*>', re.IGNORECASE | re.DOTALL)
+IFRAME_SRC = re.compile(r'(<iframe\b[^>]*?\bsrc=")(https?://[^"]+)(")', re.IGNORECASE)
+PAGE_START = re.compile(r'<head\b[^>]*>|<html\b[^>]*>', re.IGNORECASE)
+# Added to every replayed page snapshot. The <base> resolves links against the page's original URL,
+# so the scraper reads the same hrefs it would live; the click handler takes a followed link back
+# to the stand-in. %s is the stand-in's URL
+FOLLOW_LINKS_JS = """
+document.addEventListener('click', function (event) {
+    var link = event.target.closest ? event.target.closest('a[href]') : null;
+    if (!link || event.defaultPrevented || link.getAttribute('href').charAt(0) === '#'
+            || !/^https?:/.test(link.href)) {
+        return;
+    }
+    event.preventDefault();
+    window.location.href = %s + '/replay?url=' + encodeURIComponent(link.href);
+});
+"""
+
+def record_dir():
+    return os.environ.get(RECORD_ENV)
+
+def replay_server():
+    return os.environ.get(REPLAY_ENV)
+
+def split_url(url):
+    """(url without query or fragment, query params as a dict), the shape index.json entries use"""
+    url, _ = urldefrag(url)
+    parts = urlsplit(url)
+    base = f"{parts.scheme}://{parts.netloc}{parts.path}"
+    return base, dict(parse_qsl(parts.query, keep_blank_values=True)) or None
+
+def fixture_key(entry):
+    """Lookup key for an index.json entry, with any query inline in its url merged into params
+    and sorted, the same way FixtureServer.lookup normalises an incoming URL"""
+    base, inline = split_url(entry['url'])
+    params = dict(inline or {}, **(entry.get('params') or {}))
+    return request_key(entry.get('method', 'GET'), base, params or None, entry.get('data'), entry.get('json'))
+
+class FixtureRecorder:
+    """Writes responses into a fixture directory in the index.json format FixtureSession reads"""
+
+    def __init__(self, fixture_dir):
+        self.fixture_dir = fixture_dir
+        self._lock = threading.Lock()
+        os.makedirs(fixture_dir, exist_ok=True)
+        self._index_path = os.path.join(fixture_dir, 'index.json')
+        self._entries = {}
+        if os.path.exists(self._index_path):
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                for entry in json.load(f):
+                    self._entries[self._key(entry)] = entry
+
+    @staticmethod
+    def _key(entry):
+        return fixture_key(entry)
+
+    def add(self, method, url, content, status=200, params=None, data=None, json_body=None,
+            content_type=None, kind='http'):
+        """Store one response; a later response for the same request replaces the earlier one"""
+        entry = {'method': method.upper(), 'url': url, 'status': status, 'kind': kind}
+        if params:
+            entry['params'] = params
+        if data:
+            entry['data'] = data
+        if json_body is not None:
+            entry['json'] = json_body
+        if content_type:
+            entry['headers'] = {'Content-Type': content_type}
+
+        key = self._key(entry)
+        extension = mimetypes.guess_extension((content_type or '').split(';')[0].strip()) or '.bin'
+        with self._lock:
+            existing = self._entries.get(key)
+            entry['file'] = existing['file'] if existing else f"{len(self._entries):04d}{extension}"
+            with open(os.path.join(self.fixture_dir, entry['file']), 'wb') as f:
+                f.write(content)
+            self._entries[key] = entry
+            with open(self._index_path, 'w', encoding='utf-8') as f:
+                json.dump(list(self._entries.values()), f, indent=2)
+        return entry
+
+class RecordingSession(requests.Session):
+    """requests.Session that saves every response it receives as a fixture"""
+
+    def __init__(self, fixture_dir):
+        super().__init__()
+        self.recorder = FixtureRecorder(fixture_dir)
+
+    def request(self, method, url, params=None, data=None, json=None, **kwargs):
+        response = super().request(method, url, params=params, data=data, json=json, **kwargs)
+        self.recorder.add(method, url, response.content, response.status_code, params=params,
+                          data=data if isinstance(data, (dict, str)) else None, json_body=json,
+                          content_type=response.headers.get('Content-Type'))
+        return response
+
+class ReplayAdapter(HTTPAdapter):
+    """Sends every request to the stand-in server, carrying the real URL in a header"""
+
+    def __init__(self, server_url, **kwargs):
+        super().__init__(**kwargs)
+        self.server_url = server_url.rstrip('/')
+
+    def send(self, request, **kwargs):
+        request.headers[ORIGINAL_URL_HEADER] = request.url
+        request.url = f"{self.server_url}/replay"
+        return super().send(request, **kwargs)
+
+def strip_scripts(html):
+    """A snapshot is the rendered DOM; its scripts would only re-fetch from the live site"""
+    return SCRIPT_TAG.sub('', html)
+
+class _DriverWrapper:
+    """Forwards everything to the real WebDriver except what the subclass overrides"""
+
+    def __init__(self, driver):
+        self._driver = driver
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+class RecordingDriver(_DriverWrapper):
+    """Snapshots each page (and its iframes) under the URL the scraper asked for and, after a
+    redirect, the URL it ended up at.
+
+    A page is snapshotted when get() loads it, whenever the scraper reads page_source, and as
+    the scraper leaves it: the next get(), back(), forward() or quit(), or an element click.
+    Navigation a click or a script causes is noticed on the scraper's next use of the driver,
+    which snapshots the new page under its own URL. The last snapshot of a URL wins, so it
+    holds the most rendered DOM the scraper saw (every "load more" batch included).
+    """
+
+    def __init__(self, driver, fixture_dir):
+        super().__init__(driver)
+        self.recorder = FixtureRecorder(fixture_dir)
+        self._requested = None
+        self._href = None
+        install_click_hook(driver, self._record_current)
+
+    def __getattr__(self, name):
+        self._follow()
+        if name == 'page_source':
+            html = self._driver.page_source
+            self._record_current(html)
+            return html
+        return getattr(self._driver, name)
+
+    def get(self, url):
+        self.snapshot()
+        self._driver.get(url)
+        self._requested = url
+        self._href = self._top_href()
+        self.snapshot()
+
+    def back(self):
+        self._navigate(self._driver.back)
+
+    def forward(self):
+        self._navigate(self._driver.forward)
+
+    def _navigate(self, move):
+        self.snapshot()
+        move()
+        self._follow()
+
+    def _top_href(self):
+        """location.href without its fragment, or None inside a frame"""
+        href = self._driver.execute_script("return window.self === window.top ? location.href : null")
+        return urldefrag(href)[0] if href else None
+
+    def _follow(self):
+        """Snapshot a page the driver reached without get(): a click, a form post or a script redirect"""
+        try:
+            href = self._top_href()
+        except Exception:
+            return
+        if href and href != self._href:
+            self._href = href
+            self._requested = None
+            self.snapshot()
+
+    def snapshot(self):
+        """Record the current document and its frames under their URLs"""
+        driver = self._driver
+        try:
+            driver.switch_to.default_content()
+            self._record_document(self._requested)
+            frames = driver.execute_script("return window.frames.length") or 0
+            for index in range(frames):
+                try:
+                    driver.switch_to.frame(index)
+                    self._record_document()
+                finally:
+                    driver.switch_to.default_content()
+        except Exception as e:
+            print(f"Could not snapshot {driver.current_url}: {e}")
+
+    def _record_current(self, html=None):
+        """Record whichever document (page or frame) the scraper is in, without switching out of it"""
+        try:
+            top = self._top_href() is not None
+            self._record_document(self._requested if top else None, html)
+        except Exception as e:
+            print(f"Could not snapshot {self._driver.current_url}: {e}")
+
+    def _record_document(self, requested=None, html=None):
+        url = self._driver.execute_script("return location.href")
+        html = strip_scripts(html if html is not None else self._driver.page_source).encode('utf-8')
+        for address in dict.fromkeys((url, requested)):
+            if not address or not address.startswith('http'):
+                continue
+            base, params = split_url(address)
+            self.recorder.add('GET', base, html, params=params, content_type='text/html; charset=utf-8',
+                              kind='snapshot')
+
+    def quit(self):
+        self.snapshot()
+        self._driver.quit()
+
+def install_click_hook(driver, before_click):
+    """Have the elements driver returns call before_click() ahead of click() and submit()"""
+    from selenium.webdriver.remote.webelement import WebElement
+    base = getattr(driver, '_web_element_cls', WebElement)
+
+    class RecordingElement(base):
+        def click(self):
+            before_click()
+            super().click()
+
+        def submit(self):
+            before_click()
+            super().submit()
+
+    driver._web_element_cls = RecordingElement
+
+class ReplayDriver(_DriverWrapper):
+    """Loads every URL from the stand-in server instead of the live site"""
+
+    def __init__(self, driver, server_url):
+        super().__init__(driver)
+        self.server_url = server_url.rstrip('/')
+
+    def get(self, url):
+        self._driver.get(replay_url(self.server_url, url))
+
+def replay_url(server_url, url):
+    return f"{server_url}/replay?url={quote(url, safe='')}"
+
+def wrap_driver(driver):
+    """driver wrapped for run_scrapers.py --record or --replay, or driver itself otherwise"""
+    if record_dir():
+        return RecordingDriver(driver, record_dir())
+    if replay_server():
+        return ReplayDriver(driver, replay_server())
+    return driver
+
+def wrap_sb(sb):
+    """The same for a SeleniumBase SB context: sb.open() and sb.driver then go through the wrapper"""
+    sb.driver = wrap_driver(sb.driver)
+    return sb
+
+def replay_page(html, server_url, page_url):
+    """A page snapshot as the stand-in serves it: iframes load from the stand-in too, and links
+    keep their original URLs but are followed through it"""
+    html = IFRAME_SRC.sub(lambda m: m.group(1) + replay_url(server_url, m.group(2)) + m.group(3), html)
+    head = (f'<base href="{escape(page_url)}">'
+            f'<script>{FOLLOW_LINKS_JS % json.dumps(server_url)}</script>')
+    start = PAGE_START.search(html)
+    at = start.end() if start else 0
+    return html[:at] + head + html[at:]
+
+class FixtureServer:
+    """Local HTTP stand-in answering from every index.json under fixture_root.
+
+    Browsers ask for /replay?url=<original>; requests sessions send the original URL in
+    the X-Replay-Url header. Either way the lookup key is the one FixtureSession uses.
+    """
+
+    def __init__(self, fixture_root, port=0):
+        self.fixture_root = fixture_root
+        self.port = port
+        self.responses = {}
+        self.misses = []
+        self._load()
+        self._server = None
+
+    def _load(self):
+        for directory, _, files in os.walk(self.fixture_root):
+            if 'index.json' not in files:
+                continue
+            with open(os.path.join(directory, 'index.json'), 'r', encoding='utf-8') as f:
+                for entry in json.load(f):
+                    self.responses[fixture_key(entry)] = (directory, entry)
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def lookup(self, method, original_url, body=b'', content_type=''):
+        base, params = split_url(original_url)
+        data, json_body = None, None
+        if body:
+            if 'json' in content_type:
+                json_body = json.loads(body)
+            elif 'x-www-form-urlencoded' in content_type:
+                data = dict(parse_qsl(body.decode('utf-8'), keep_blank_values=True))
+            else:
+                data = body
+        key = request_key(method, base, params, data, json_body)
+        found = self.responses.get(key)
+        if found is None:
+            self.misses.append(key)
+        return found
+
+    def start(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _answer(self):
+                original = self.headers.get(ORIGINAL_URL_HEADER)
+                if not original:
+                    query = dict(parse_qsl(urlsplit(self.path).query))
+                    original = query.get('url', '')
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length else b''
+                found = server.lookup(self.command, original, body, self.headers.get('Content-Type', ''))
+                if found is None:
+                    self.send_error(404, f"No fixture for {self.command} {original}")
+                    return
+
+                directory, entry = found
+                with open(os.path.join(directory, entry['file']), 'rb') as f:
+                    content = f.read()
+                headers = entry.get('headers') or {}
+                content_type = headers.get('Content-Type') or mimetypes.guess_type(entry['file'])[0] or 'text/html'
+                if entry.get('kind') == 'snapshot':
+                    content = replay_page(content.decode('utf-8'), server.url, original).encode('utf-8')
+                self.send_response(entry.get('status', 200))
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = _answer
+            do_POST = _answer
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', self.port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        print(f"Replaying {len(self.responses)} fixtures from {self.fixture_root} at {self.url}")
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self.misses:
+            print(f"{len(self.misses)} requests had no fixture, e.g. {self.misses[0]}")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+# Rheinmetall's search URL: an inline query whose parameters are not in sorted order
+ROUND_TRIP_QUERY = ('9dc11c304b4c06c2f71c48cc6574e7e5term=&9dc11c304b4c06c2f71c48cc6574e7e5filter='
+                    '%257B%2522countries%2522%253A%255B%2522Australia%2522%255D%257D')
+
+def check_round_trip():
+    """Record a response and a page snapshot from a local origin, then replay both by the same URL"""
+    import tempfile
+
+    class Origin(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = f"<html>{self.path}</html>".encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    origin = ThreadingHTTPServer(('127.0.0.1', 0), Origin)
+    threading.Thread(target=origin.serve_forever, daemon=True).start()
+    http_url = f"http://127.0.0.1:{origin.server_port}/en/career/vacancies?{ROUND_TRIP_QUERY}"
+    page_url = f"http://127.0.0.1:{origin.server_port}/en/career/page?{ROUND_TRIP_QUERY}"
+    failures = []
+    try:
+        with tempfile.TemporaryDirectory() as fixture_dir:
+            expected = RecordingSession(fixture_dir).get(http_url, timeout=5).content
+            base, params = split_url(page_url)
+            FixtureRecorder(fixture_dir).add('GET', base, b'<html>page</html>', params=params,
+                                             content_type='text/html; charset=utf-8', kind='snapshot')
+            with FixtureServer(fixture_dir) as server:
+                session = requests.Session()
+                session.mount('http://', ReplayAdapter(server.url))
+                replayed = session.get(http_url, timeout=5)
+                if replayed.status_code != 200 or replayed.content != expected:
+                    failures.append(f"session replay of {http_url}: {replayed.status_code}")
+                browser = requests.get(replay_url(server.url, page_url), timeout=5)
+                if browser.status_code != 200 or browser.text != replay_page('<html>page</html>', server.url, page_url):
+                    failures.append(f"browser replay of {page_url}: {browser.status_code}")
+    finally:
+        origin.shutdown()
+        origin.server_close()
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve recorded fixtures from a local stand-in server')
+    parser.add_argument('fixture_root', nargs='?', help='directory containing one or more index.json fixture sets')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--check', action='store_true', help='check that a recorded URL replays, then exit')
+    args = parser.parse_args()
+
+    if args.check:
+        failures = check_round_trip()
+        for failure in failures:
+            print(f"FAILED {failure}")
+        print("Record/replay round trip: " + ('failed' if failures else 'ok'))
+        return 1 if failures else 0
+    if not args.fixture_root:
+        parser.error('fixture_root is required')
+
+    with FixtureServer(args.fixture_root, args.port) as server:
+        print(f"Point scrapers at it with {REPLAY_ENV}={server.url}; Ctrl-C to stop")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import argparse
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree, html
+from http_utils import FixtureSession, make_session
+from job_records import JobRecordBuffer
+
+logger = logging.getLogger(__name__)
+
+RIPPLING_SITES = {
+    'DroneShield': {
+        'board': 'droneshield',
+        'country': 'AU',  # filtered by Rippling, not by us
+        'source': 'https://www.droneshield.com/open-positions',
+        'company': 'DroneShield',
+    },
+}
+
+NEXT_DATA = etree.XPath("//script[@id='__NEXT_DATA__']/text()")
+
+def board_url(config):
+    return f"https://ats.rippling.com/embed/{config['board']}/jobs"
+
+def board_params(config, page):
+    return {
+        's': config.get('source', ''),
+        'page': page,
+        'searchQuery': '',
+        'workplaceType': '',
+        'country': config.get('country', ''),
+        'state': '',
+        'city': '',
+    }
+
+def find_job_page(node):
+    """Walk the Next.js payload for the paged job list ({"items": [...], "totalPages": n})"""
+    if isinstance(node, dict):
+        if isinstance(node.get('items'), list) and 'totalPages' in node:
+            return node
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        return None
+    for child in children:
+        found = find_job_page(child)
+        if found is not None:
+            return found
+    return None
+
+def fetch_page(session, config, page):
+    response = session.get(board_url(config), params=board_params(config, page), timeout=15)
+    response.raise_for_status()
+    scripts = NEXT_DATA(html.fromstring(response.text))
+    if not scripts:
+        logger.error(f"No __NEXT_DATA__ payload on page {page}")
+        return {'items': [], 'totalPages': 0}
+    return find_job_page(json.loads(scripts[0])) or {'items': [], 'totalPages': 0}
+
+def _label(value):
+    if isinstance(value, dict):
+        return value.get('name') or value.get('label') or ''
+    return value or ''
+
+def parse_items(job_page, config, jobs):
+    for item in job_page.get('items', []):
+        link = item.get('url') or f"https://ats.rippling.com/{config['board']}/jobs/{item.get('id', '')}"
+        locations = [_label(location) for location in item.get('locations') or []]
+        location = ', '.join(name for name in locations if name) or _label(item.get('workLocation')) or 'N/A'
+        jobs.add(link, item.get('name', '').strip(), _label(item.get('department')) or 'N/A',
+                 location, config['company'])
+
+def scrape_rippling_site(config, session=None, max_workers=4):
+    """Page 0 tells us totalPages; the rest are fetched concurrently"""
+    session = session or make_session(pool_size=max_workers)
+    jobs = JobRecordBuffer()
+
+    first = fetch_page(session, config, 0)
+    parse_items(first, config, jobs)
+    total_pages = first.get('totalPages', 1)
+
+    pages = list(range(1, total_pages))
+    if pages:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as executor:
+            for job_page in executor.map(lambda page: fetch_page(session, config, page), pages):
+                parse_items(job_page, config, jobs)
+
+    logger.info(f"{config['company']}: {len(jobs)} jobs over {max(total_pages, 1)} pages")
+    return jobs.to_dataframe()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Scrape a Rippling ATS board over plain HTTP')
+    parser.add_argument('site', choices=sorted(RIPPLING_SITES))
+    parser.add_argument('--fixtures', help='replay recorded responses from this directory instead of the network')
+    args = parser.parse_args()
+
+    session = FixtureSession(args.fixtures) if args.fixtures else None
+    df = scrape_rippling_site(RIPPLING_SITES[args.site], session=session)
+    print(df.to_string(index=False))
+    print(f"Total jobs: {len(df)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import argparse
+import glob
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Site modules are discovered by filename; shared helpers deliberately use other names
+SCRAPER_PATTERNS = ['*_scraper_utils.py', '*_Scraper_Utils.py', '*_scraper.py']
+DEFAULT_TIMEOUT = 900
+# Scrapers spend their time waiting on the network and on Chrome, not on this machine's CPUs
+DEFAULT_JOBS = 8
+LOG_DIR = 'logs'
+# waits.py appends each browser scraper's per-wait totals to this JSON-lines file
+WAIT_LOG_ENV = 'SCRAPER_WAIT_LOG'
+
+# CAE_job_data.csv, Collins_job_data_<timestamp>.csv, hanwha_jobs_<timestamp>.csv
+CSV_FILE = re.compile(r'^(.+?)_(?:job_data|jobs)(?:_.*)?\.csv$', re.IGNORECASE)
+# Sites whose CSV is not named after the module (other names only differ in case)
+CSV_NAMES = {
+    'COAL': 'CoalGroup',
+    'MCC': 'Maitland_Council',
+    'MIDSCOAST': 'MIDC',
+    'NEW_COAL': 'NCIG',
+}
+
+def discover_scrapers(base_dir, only=None):
+    """Find every site module in base_dir, optionally filtered by site name"""
+    found = set()
+    for pattern in SCRAPER_PATTERNS:
+        found.update(glob.glob(os.path.join(base_dir, pattern)))
+
+    scripts = sorted(found, key=lambda p: os.path.basename(p).lower())
+    if only:
+        wanted = {name.lower() for name in only}
+        scripts = [p for p in scripts if site_name(p).lower() in wanted]
+    return scripts
+
+def site_name(script_path):
+    """Site label for a module, e.g. CAE_scraper_utils.py -> CAE"""
+    name = os.path.splitext(os.path.basename(script_path))[0]
+    for suffix in ('_scraper_utils', '_Scraper_Utils', '_scraper'):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+def csv_site(csv_path):
+    """Site label for a scraper's CSV, e.g. Maitland_Council_job_data.csv -> MCC; the same
+    label the scraper gives the job store, so every data layer files a site under one name"""
+    name = os.path.basename(csv_path)
+    match = CSV_FILE.match(name)
+    stem = match.group(1) if match else os.path.splitext(name)[0]
+    return _csv_labels().get(stem.lower(), stem)
+
+_labels = None
+
+def _csv_labels():
+    global _labels
+    if _labels is None:
+        sites = {site_name(path) for path in discover_scrapers(os.path.dirname(os.path.abspath(__file__)))}
+        _labels = {site.lower(): site for site in sites}
+        _labels.update((stem.lower(), site) for site, stem in CSV_NAMES.items())
+    return _labels
+
+def uses_driver_pool(script_path):
+    """Only modules whose configure_webdriver() can attach to a pooled browser get a lease"""
+    with open(script_path, 'r', encoding='utf-8', errors='replace') as f:
+        return 'lease_pooled_driver(' in f.read()
+
+def run_scraper(script_path, timeout, log_dir, pool=None, record_root=None):
+    """Run one site module in its own interpreter and return a result dict"""
+    env = dict(os.environ)
+    if record_root:
+        from replay import RECORD_ENV
+        env[RECORD_ENV] = os.path.abspath(os.path.join(record_root, site_name(script_path)))
+    if pool is not None and uses_driver_pool(script_path):
+        from driver_pool import DEBUGGER_ADDRESS_ENV
+        with pool.lease() as browser:
+            env[DEBUGGER_ADDRESS_ENV] = browser.debugger_address
+            return _run_scraper(script_path, timeout, log_dir, env)
+    return _run_scraper(script_path, timeout, log_dir, env)
+
+# Each scraper leads its own process group so a timeout can take its chromedriver and Chrome down too
+if os.name == 'nt':
+    NEW_PROCESS_GROUP = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    NEW_PROCESS_GROUP = {'start_new_session': True}
+
+def kill_tree(proc):
+    """Kill a scraper and everything it started (chromedriver, Chrome and its renderers)"""
+    if os.name == 'nt':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(proc.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    proc.wait()
+
+def _run_scraper(script_path, timeout, log_dir, env=None):
+    site = site_name(script_path)
+    log_name = os.path.splitext(os.path.basename(script_path))[0]
+    log_path = os.path.join(log_dir, f'{log_name}.log')
+    start = time.time()
+    status = 'ok'
+    returncode = None
+
+    with open(log_path, 'w', encoding='utf-8', errors='replace') as log_file:
+        try:
+            proc = subprocess.Popen(
+                [sys.executable, os.path.basename(script_path)],
+                cwd=os.path.dirname(os.path.abspath(script_path)),
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                env=env,
+                **NEW_PROCESS_GROUP,
+            )
+            try:
+                returncode = proc.wait(timeout=timeout)
+                if returncode != 0:
+                    status = 'failed'
+            except subprocess.TimeoutExpired:
+                kill_tree(proc)
+                log_file.write(f"\nrun_scrapers: killed after {timeout}s\n")
+                status = 'timeout'
+        except Exception as e:
+            log_file.write(f"\nrun_scrapers: could not start {script_path}: {e}\n")
+            status = 'error'
+
+    return {
+        'site': site,
+        'script': os.path.basename(script_path),
+        'status': status,
+        'returncode': returncode,
+        'seconds': time.time() - start,
+        'log': log_path,
+    }
+
+def run_all(scripts, max_workers, timeout, log_dir=LOG_DIR, pool=None, record_root=None):
+    """Run scripts with at most max_workers at a time, printing each result as it lands"""
+    if not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_script = {executor.submit(run_scraper, script, timeout, log_dir, pool, record_root): script for script in scripts}
+        for future in as_completed(future_to_script):
+            result = future.result()
+            results.append(result)
+            print(f"[{len(results)}/{len(scripts)}] {result['site']}: {result['status']} in {result['seconds']:.1f}s")
+    return results
+
+def print_summary(results, wall_seconds):
+    print(f"\n{'='*60}")
+    print(f"{'Site':<20}{'Status':<10}{'Seconds':>10}  Log")
+    print(f"{'-'*60}")
+    for result in sorted(results, key=lambda r: r['seconds'], reverse=True):
+        print(f"{result['site']:<20}{result['status']:<10}{result['seconds']:>10.1f}  {result['log']}")
+    print(f"{'-'*60}")
+
+    serial_seconds = sum(r['seconds'] for r in results)
+    failed = [r['site'] for r in results if r['status'] != 'ok']
+    print(f"Sites run: {len(results)}, failed: {len(failed)}")
+    print(f"Wall clock: {wall_seconds:.1f}s (serial would be ~{serial_seconds:.1f}s)")
+    if failed:
+        print(f"Check logs for: {', '.join(sorted(failed))}")
+    print(f"{'='*60}")
+
+def print_wait_report(wait_log):
+    """Seconds each browser scraper spent waiting, slowest first, with the wait types that timed out"""
+    with open(wait_log, 'r', encoding='utf-8') as f:
+        reports = [json.loads(line) for line in f if line.strip()]
+    if not reports:
+        return
+    print(f"\n{'Site':<20}{'Waits':>7}{'Seconds':>10}  Timed out")
+    for report in sorted(reports, key=lambda r: -sum(w['seconds'] for w in r['waits'].values())):
+        waits = report['waits'].values()
+        timed_out = ', '.join(f"{name} x{w['timeouts']}" for name, w in report['waits'].items() if w['timeouts'])
+        print(f"{report['site']:<20}{sum(w['count'] for w in waits):>7}{sum(w['seconds'] for w in waits):>10.1f}  {timed_out}")
+    print(f"Wait reports: {wait_log}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Run every site scraper in a bounded process pool')
+    parser.add_argument('-j', '--jobs', type=int, default=DEFAULT_JOBS,
+                        help=f'maximum number of scrapers running at once (default: {DEFAULT_JOBS})')
+    parser.add_argument('-t', '--timeout', type=int, default=DEFAULT_TIMEOUT,
+                        help=f'wall-clock seconds allowed per site (default: {DEFAULT_TIMEOUT})')
+    parser.add_argument('-b', '--browsers', type=int, default=0,
+                        help='keep this many warm Chrome instances and lease them to scrapers (default: 0, each scraper launches its own)')
+    parser.add_argument('--log-dir', default=LOG_DIR, help='directory for per-site output logs')
+    parser.add_argument('--no-block', action='store_true',
+                        help='let browsers load images, fonts, media and trackers (baseline for bytes saved)')
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument('--record', metavar='DIR',
+                          help='save every HTTP response and page snapshot under DIR/<site> as fixtures')
+    fixtures.add_argument('--replay', metavar='DIR',
+                          help='serve the fixtures under DIR from a local stand-in server instead of the live sites')
+    parser.add_argument('sites', nargs='*', help='only run these sites, e.g. CAE Cubic')
+    args = parser.parse_args()
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    scripts = discover_scrapers(base_dir, args.sites)
+    if not scripts:
+        print("No scraper modules found.")
+        return 1
+
+    print(f"Running {len(scripts)} scrapers with up to {args.jobs} at a time (timeout {args.timeout}s each)")
+    # Children inherit these: browser scrapers append their transfer report to one file per sweep
+    from browser_profile import BLOCK_ENV, TRANSFER_LOG_ENV
+    if not os.path.exists(args.log_dir):
+        os.makedirs(args.log_dir)
+    transfer_log = os.path.join(args.log_dir, 'transfer_unblocked.jsonl' if args.no_block else 'transfer.jsonl')
+    open(transfer_log, 'w').close()
+    os.environ[TRANSFER_LOG_ENV] = os.path.abspath(transfer_log)
+    wait_log = os.path.join(args.log_dir, 'waits.jsonl')
+    open(wait_log, 'w').close()
+    os.environ[WAIT_LOG_ENV] = os.path.abspath(wait_log)
+    os.environ[BLOCK_ENV] = '0' if args.no_block else '1'
+    start = time.time()
+    pool = None
+    server = None
+    if args.replay:
+        from replay import REPLAY_ENV, FixtureServer
+        server = FixtureServer(args.replay).start()
+        os.environ[REPLAY_ENV] = server.url
+    if args.browsers > 0:
+        from driver_pool import DriverPool
+        pool = DriverPool(args.browsers).start()
+    try:
+        results = run_all(scripts, max(1, args.jobs), args.timeout, args.log_dir, pool, args.record)
+    finally:
+        if pool is not None:
+            pool.stop()
+        if server is not None:
+            server.stop()
+    print_summary(results, time.time() - start)
+    print_wait_report(wait_log)
+    print(f"Transfer reports: {transfer_log} (compare with: python browser_profile.py <blocked> <unblocked>)")
+
+    return 0 if all(r['status'] == 'ok' for r in results) else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+import argparse
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+from lxml import etree, html
+from http_utils import FixtureSession, make_session
+from job_records import JobRecordBuffer
+
+logger = logging.getLogger(__name__)
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+JOB_LOCATION = f"(.//span[{_has_class('jobLocation')}])[1]"
+
+# Every RMK board renders the same tr.data-row results table; only the
+# classification and location cells differ, so those are per-site compiled XPaths
+RMK_SITES = {
+    'CSIRO': {
+        'base_url': 'https://jobs.csiro.au',
+        'path': '/search/',
+        'params': {'createNewAlert': 'false', 'q': ''},
+        'classification': etree.XPath("normalize-space(td[2])"),
+        # first line of the location cell only, e.g. "Clayton" out of "Clayton, VIC, AU"
+        'location': etree.XPath(f"normalize-space(substring-before(concat({JOB_LOCATION}, ','), ','))"),
+        'company': 'CSIRO',
+    },
+    'Qinetic': {
+        'base_url': 'https://careers.qinetiq.com',
+        'path': '/search/',
+        'params': {'createNewAlert': 'false', 'q': '', 'locationsearch': 'Australia'},
+        'classification': etree.XPath(f"normalize-space((.//span[{_has_class('jobDepartment')}])[1])"),
+        # the inner <span> when there is one, otherwise the whole cell
+        'location': etree.XPath(f"normalize-space(({JOB_LOCATION}/span | {JOB_LOCATION}[not(span)])[1])"),
+        'company': 'Qinetic',
+    },
+    'Babcock': {
+        'base_url': 'https://jobs.babcockinternational.com',
+        'path': '/go/Australasia/4733701/',
+        'startrow_in_path': True,  # /go/ category pages page as /go/<name>/<id>/<startrow>/
+        'params': {},
+        'classification': etree.XPath("normalize-space(@data-ph-at-job-category-text)"),
+        # leave out the <small> note that follows the location
+        'location': etree.XPath(f"normalize-space({JOB_LOCATION}/text()[normalize-space()][1])"),
+        'company': 'Babcock',
+    },
+}
+
+ROWS = etree.XPath(f"//tr[{_has_class('data-row')}]")
+TITLE_LINK = etree.XPath(f".//a[{_has_class('jobTitle-link')}]")
+# "Results <b>1 – 25</b> of <b>132</b>"
+RESULT_TOTAL = etree.XPath(f"normalize-space((//span[{_has_class('paginationLabel')}])[1]/b[last()])")
+LAST_PAGE_LINK = etree.XPath(f"(//a[{_has_class('paginationItemLast')}])[1]/@href")
+STARTROW = re.compile(r'startrow=(\d+)|/(\d+)/?(?:\?|$)')
+
+def page_url(config, startrow):
+    """URL and query for the results page starting at startrow"""
+    params = dict(config.get('params', {}))
+    path = config['path']
+    if config.get('startrow_in_path'):
+        if startrow:
+            path = f"{path.rstrip('/')}/{startrow}/"
+    elif startrow:
+        params['startrow'] = startrow
+    return f"{config['base_url']}{path}", params
+
+def fetch_page(session, config, startrow):
+    url, params = page_url(config, startrow)
+    response = session.get(url, params=params or None, timeout=15)
+    response.raise_for_status()
+    return html.fromstring(response.text)
+
+def last_startrow(tree):
+    """Total results from the pagination label, falling back to the "Last Page" link's offset + 1"""
+    total = RESULT_TOTAL(tree).replace(',', '')
+    if total.isdigit():
+        return int(total)
+    hrefs = LAST_PAGE_LINK(tree)
+    match = STARTROW.search(hrefs[0]) if hrefs else None
+    if match:
+        return int(match.group(1) or match.group(2)) + 1
+    return 0
+
+def parse_rows(tree, config):
+    rows = []
+    for row in ROWS(tree):
+        links = TITLE_LINK(row)
+        if not links or not links[0].get('href'):
+            continue
+        rows.append((urljoin(config['base_url'], links[0].get('href')), links[0].text_content().strip(),
+                     config['classification'](row), config['location'](row), config['company']))
+    return rows
+
+def scrape_rmk_site(config, session=None, max_workers=4):
+    """Read page one for the result count, then fetch every other startrow page concurrently"""
+    session = session or make_session(pool_size=max_workers)
+    jobs = JobRecordBuffer()
+    seen = set()
+
+    first = fetch_page(session, config, 0)
+    pages = [parse_rows(first, config)]
+    page_size = len(pages[0])
+    total = last_startrow(first)
+    logger.info(f"{config['company']}: {total} postings, {page_size} per page")
+
+    startrows = list(range(page_size, total, page_size)) if page_size else []
+    if startrows:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(startrows))) as executor:
+            trees = executor.map(lambda startrow: fetch_page(session, config, startrow), startrows)
+            pages.extend(parse_rows(tree, config) for tree in trees)
+
+    # A posting added while paging can shift a row onto the next page as well
+    for rows in pages:
+        for row in rows:
+            if row[0] in seen:
+                continue
+            seen.add(row[0])
+            jobs.add(*row)
+
+    return jobs.to_dataframe()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Scrape a SuccessFactors RMK careers site over plain HTTP')
+    parser.add_argument('site', choices=sorted(RMK_SITES))
+    parser.add_argument('--fixtures', help='replay recorded responses from this directory instead of the network')
+    args = parser.parse_args()
+
+    session = FixtureSession(args.fixtures) if args.fixtures else None
+    df = scrape_rmk_site(RMK_SITES[args.site], session=session)
+    print(df.to_string(index=False))
+    print(f"Total jobs: {len(df)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import atexit
+import json
+import logging
+import os
+import sys
+import time
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from run_scrapers import WAIT_LOG_ENV, site_name
+
+logger = logging.getLogger(__name__)
+
+# Every wait records how long it actually took, so fixed sleeps can be compared against real readiness
+WAIT_LOG = []
+
+def _record(name, start, ok, detail=''):
+    seconds = time.perf_counter() - start
+    if not WAIT_LOG:
+        atexit.register(report_waits)
+    WAIT_LOG.append({'wait': name, 'seconds': seconds, 'ok': ok, 'detail': detail})
+    logger.debug(f"{name}({detail}) {'ok' if ok else 'timed out'} after {seconds:.2f}s")
+    return ok
+
+def wait_until(driver, condition, timeout=10, name='condition', detail='', poll=0.1):
+    """Generic WebDriverWait wrapper that returns True/False instead of raising"""
+    start = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll).until(condition)
+        return _record(name, start, True, detail)
+    except TimeoutException:
+        return _record(name, start, False, detail)
+
+def wait_for_ready(driver, timeout=15):
+    """document.readyState is complete"""
+    return wait_until(driver, lambda d: d.execute_script("return document.readyState") == "complete",
+                      timeout, 'ready')
+
+def wait_for_present(driver, css, timeout=10):
+    return wait_until(driver, EC.presence_of_element_located((By.CSS_SELECTOR, css)), timeout, 'present', css)
+
+def wait_for_hidden(driver, css, timeout=10):
+    """Element is gone or no longer displayed, e.g. a load-more button after the last page"""
+    return wait_until(driver, EC.invisibility_of_element_located((By.CSS_SELECTOR, css)), timeout, 'hidden', css)
+
+def count(driver, css):
+    return driver.execute_script("return document.querySelectorAll(arguments[0]).length", css)
+
+def wait_for_count_increase(driver, css, previous_count, timeout=10):
+    """More elements match css than before, e.g. cards after clicking load more"""
+    return wait_until(driver, lambda d: count(d, css) > previous_count, timeout, 'count_increase', css)
+
+def wait_for_url_change(driver, old_url, timeout=10):
+    return wait_until(driver, lambda d: d.current_url != old_url, timeout, 'url_change', old_url)
+
+def wait_for_staleness(driver, element, timeout=10):
+    """An element from the previous page has been replaced, i.e. a page turn happened"""
+    return wait_until(driver, EC.staleness_of(element), timeout, 'stale')
+
+_NETWORK_IDLE_JS = """
+const [idleMs, timeoutMs, done] = arguments;
+performance.setResourceTimingBufferSize(10000);
+const start = performance.now();
+let last = performance.getEntriesByType('resource').length;
+let quietSince = start;
+const tick = () => {
+    const now = performance.now();
+    const seen = performance.getEntriesByType('resource').length;
+    if (seen !== last) { last = seen; quietSince = now; }
+    if (now - quietSince >= idleMs) return done(true);
+    if (now - start >= timeoutMs) return done(false);
+    setTimeout(tick, 50);
+};
+tick();
+"""
+
+def wait_for_network_idle(driver, idle_ms=500, timeout=15):
+    """No new resource-timing entries (XHR, fetch, scripts) for idle_ms"""
+    return _async_wait(driver, 'network_idle', _NETWORK_IDLE_JS, f'{idle_ms}ms', idle_ms, timeout * 1000, timeout=timeout)
+
+_DOM_STABLE_JS = """
+const [selector, quietMs, timeoutMs, done] = arguments;
+const target = document.querySelector(selector) || document.body;
+let quiet, hard;
+const observer = new MutationObserver(() => {
+    clearTimeout(quiet);
+    quiet = setTimeout(() => finish(true), quietMs);
+});
+const finish = (ok) => { observer.disconnect(); clearTimeout(quiet); clearTimeout(hard); done(ok); };
+observer.observe(target, {childList: true, subtree: true, attributes: true, characterData: true});
+quiet = setTimeout(() => finish(true), quietMs);
+hard = setTimeout(() => finish(false), timeoutMs);
+"""
+
+def wait_for_dom_stable(driver, css='body', quiet_ms=300, timeout=10):
+    """MutationObserver on css reports no changes for quiet_ms"""
+    return _async_wait(driver, 'dom_stable', _DOM_STABLE_JS, css, css, quiet_ms, timeout * 1000, timeout=timeout)
+
+def _async_wait(driver, name, script, detail, *args, timeout):
+    start = time.perf_counter()
+    try:
+        driver.set_script_timeout(timeout + 5)
+        ok = bool(driver.execute_async_script(script, *args))
+    except (TimeoutException, WebDriverException) as e:
+        logger.debug(f"{name} script failed: {e}")
+        ok = False
+    return _record(name, start, ok, detail)
+
+def scroll_into_view(driver, element):
+    """Instant scroll, so there is no smooth-scroll animation to sleep through"""
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", element)
+
+def wait_summary():
+    """Per-wait-type totals, printed by report_waits() when the scraper exits"""
+    totals = {}
+    for entry in WAIT_LOG:
+        stats = totals.setdefault(entry['wait'], {'count': 0, 'seconds': 0.0, 'timeouts': 0})
+        stats['count'] += 1
+        stats['seconds'] += entry['seconds']
+        stats['timeouts'] += 0 if entry['ok'] else 1
+    for name, stats in sorted(totals.items(), key=lambda item: -item[1]['seconds']):
+        print(f"  {name:<16}{stats['count']:>5} waits {stats['seconds']:>8.2f}s  {stats['timeouts']} timed out")
+    return totals
+
+def report_waits():
+    """Print this process's wait totals and append them to the sweep's wait log, if there is one"""
+    if not WAIT_LOG:
+        return
+    print("Wait summary:")
+    totals = wait_summary()
+    log_path = os.environ.get(WAIT_LOG_ENV)
+    if log_path:
+        with open(log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'site': site_name(sys.argv[0]), 'waits': totals}) + '\n')
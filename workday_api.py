@@ -0,0 +1,97 @@
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from http_utils import FixtureSession, make_session
+from job_records import JobRecordBuffer
+
+logger = logging.getLogger(__name__)
+
+# Workday country reference ID, shared by every tenant
+AUSTRALIA = 'd903bb3fedad45039383f6de334ad4db'
+PAGE_SIZE = 20  # Workday rejects larger limits
+
+# One entry per myworkdayjobs.com board
+WORKDAY_SITES = {
+    'CAE': {
+        'host': 'cae.wd3.myworkdayjobs.com',
+        'tenant': 'cae',
+        'site': 'career',
+        'search_text': 'australia',
+        'facets': {'Location_Country': [AUSTRALIA]},
+        'classification': 'Engineering',
+        'company': 'CAE',
+    },
+    'Cubic': {
+        'host': 'cubic.wd1.myworkdayjobs.com',
+        'tenant': 'cubic',
+        'site': 'cubic_global_careers',
+        'search_text': '',
+        'facets': {'Location_Country': [AUSTRALIA]},
+        'classification': 'N/A',
+        'company': 'Cubic',
+    },
+}
+
+def jobs_url(config):
+    return f"https://{config['host']}/wday/cxs/{config['tenant']}/{config['site']}/jobs"
+
+def search_body(config, offset):
+    return {
+        'appliedFacets': config.get('facets', {}),
+        'limit': PAGE_SIZE,
+        'offset': offset,
+        'searchText': config.get('search_text', ''),
+    }
+
+def fetch_page(session, config, offset):
+    """POST one page of the Workday job search and return the decoded JSON"""
+    response = session.post(jobs_url(config), json=search_body(config, offset), timeout=15,
+                            headers={'Accept': 'application/json'})
+    response.raise_for_status()
+    return response.json()
+
+def parse_postings(data, config, jobs):
+    """Append one row per jobPosting in a search response"""
+    base = f"https://{config['host']}/en-US/{config['site']}"
+    for posting in data.get('jobPostings', []):
+        external_path = posting.get('externalPath')
+        if not external_path:
+            continue
+
+        location = posting.get('locationsText') or 'N/A'
+        jobs.add(base + external_path, posting.get('title', '').strip(),
+                 config.get('classification', 'N/A'), location, config['company'])
+
+def scrape_workday_site(config, session=None, max_workers=4):
+    """Page the whole search result for one board; the first page gives the total"""
+    session = session or make_session(pool_size=max_workers)
+    jobs = JobRecordBuffer()
+
+    first = fetch_page(session, config, 0)
+    total = first.get('total', 0)
+    parse_postings(first, config, jobs)
+    logger.info(f"{config['company']}: {total} postings")
+
+    offsets = list(range(PAGE_SIZE, total, PAGE_SIZE))
+    if offsets:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(offsets))) as executor:
+            # map() keeps page order so output is stable between runs
+            for page in executor.map(lambda offset: fetch_page(session, config, offset), offsets):
+                parse_postings(page, config, jobs)
+
+    return jobs.to_dataframe()
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Scrape a Workday board through its JSON search API')
+    parser.add_argument('site', choices=sorted(WORKDAY_SITES))
+    parser.add_argument('--fixtures', help='replay recorded responses from this directory instead of the network')
+    args = parser.parse_args()
+
+    session = FixtureSession(args.fixtures) if args.fixtures else None
+    df = scrape_workday_site(WORKDAY_SITES[args.site], session=session)
+    print(df.to_string(index=False))
+    print(f"Total jobs: {len(df)}")
+
+if __name__ == "__main__":
+    main()